@@ -1,8 +1,75 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol, Optional
 from core.models import LocationResult
+from core.utils.deadline import deadline_scope
 
 class GeocodingProvider(Protocol):
     def geocode(self, address: str) -> Optional[LocationResult]:
         ...
+
+class AsyncGeocodingProvider(Protocol):
+    async def geocode(self, address: str, *, timeout_s: Optional[float] = None) -> Optional[LocationResult]:
+        """timeout_s는 실제 호출이 시작된 시점부터 잽니다 (대기열에서 기다린 시간 제외)."""
+        ...
+
+
+# 비동기 provider가 블로킹 HTTP 호출을 돌리는 공용 스레드 풀
+# (크기는 배치 동시 실행 상한과 맞춤; 연결 풀/회로 차단기/호출 한도는 동기 경로와 공유)
+_executor: ThreadPoolExecutor | None = None
+
+
+def blocking_pool_size() -> int:
+    from core.config import settings
+
+    return max(1, settings.geocode_batch_concurrency)
+
+
+def _blocking_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=blocking_pool_size(), thread_name_prefix="geocode-async")
+    return _executor
+
+
+class AsyncProviderAdapter:
+    """AsyncGeocodingProvider over a synchronous provider.
+
+    요청은 공용 스레드 풀에서 실행되므로 이벤트 루프를 막지 않고, 여러 주소를
+    동시에 보낼 수 있습니다. 취소/타임아웃된 호출의 스레드는 마감 시간까지 남습니다.
+    호출 시점의 컨텍스트(마감 시간 포함)를 스레드로 넘깁니다.
+    timeout_s(와 같은 예산의 마감 시간)는 풀 스레드가 호출을 시작할 때부터 잽니다.
+    """
+
+    def __init__(self, provider: GeocodingProvider):
+        self.provider = provider
+
+    @property
+    def max_concurrency(self) -> int:
+        """Calls beyond this only wait in the pool's queue."""
+        return blocking_pool_size()
+
+    async def geocode(self, address: str, *, timeout_s: Optional[float] = None) -> Optional[LocationResult]:
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        started = asyncio.Event()
+
+        def call() -> Optional[LocationResult]:
+            loop.call_soon_threadsafe(started.set)
+            # 스레드 쪽 재시도도 timeout_s 안에서 멈추도록 같은 예산을 마감 시간으로 걺
+            with deadline_scope(timeout_s):
+                return self.provider.geocode(address)
+
+        future = loop.run_in_executor(_blocking_executor(), ctx.run, call)
+        if timeout_s is None:
+            return await future
+        try:
+            await started.wait()
+        except asyncio.CancelledError:
+            # 아직 대기열에 있으면 실행하지 않음
+            future.cancel()
+            raise
+        return await asyncio.wait_for(future, timeout_s)
@@ -0,0 +1,158 @@
+"""Per-endpoint circuit breakers for external APIs.
+
+VWorld가 502를 연달아 돌려줄 때 모든 세션이 타임아웃/백오프를 끝까지 기다리지
+않도록, 엔드포인트별로 최근 호출의 오류율과 지연을 보고 회로를 엽니다.
+
+- closed: 정상. 최근 `window_s`초 호출 중 `min_calls` 이상에서 실패(예외, 5xx/429,
+  `slow_call_s` 초과)가 `failure_rate` 이상이면 open.
+- open: `open_s`초 동안 호출 없이 즉시 `CircuitOpenError`.
+- half_open: 시험 호출 `half_open_probes`개만 통과. 모두 성공하면 closed,
+  하나라도 실패하면 다시 open.
+
+엔드포인트 이름: "kakao_geocode", "vworld_geocode", "vworld_wfs" (`api.http.get(endpoint=...)`).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from core.config import settings
+from core.exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_s: float = 30.0,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_s: float | None = None,
+        open_s: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.name = name
+        self.window_s = window_s
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_s = slow_call_s
+        self.open_s = open_s
+        self.half_open_probes = half_open_probes
+        self._calls: deque[tuple[float, bool, float]] = deque()  # (ended_at, ok, latency_s)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.open_s:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._calls.clear()
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go out now."""
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == OPEN:
+                raise CircuitOpenError(f"{self.name}: circuit open, retry in {self.open_s - (now - self._opened_at):.0f}s")
+            if self._state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    raise CircuitOpenError(f"{self.name}: circuit half-open, probe in flight")
+                self._probes_in_flight += 1
+
+    def release(self) -> None:
+        """Give back a call admitted by before_call that was never sent."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record(self, ok: bool, latency_s: float) -> None:
+        if ok and self.slow_call_s is not None and latency_s > self.slow_call_s:
+            ok = False
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if not ok:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._state = CLOSED
+                    self._calls.clear()
+                return
+            if self._state == OPEN:
+                return
+
+            self._calls.append((now, ok, latency_s))
+            while self._calls and now - self._calls[0][0] > self.window_s:
+                self._calls.popleft()
+            n = len(self._calls)
+            failures = sum(1 for _, c_ok, _ in self._calls if not c_ok)
+            if n >= self.min_calls and failures / n >= self.failure_rate:
+                self._open(now)
+
+    def health(self) -> dict:
+        """State plus rolling error rate / p90 latency over the current window."""
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            calls = [c for c in self._calls if now - c[0] <= self.window_s]
+            latencies = sorted(lat for _, _, lat in calls)
+            return {
+                "state": self._state,
+                "calls": len(calls),
+                "error_rate": (sum(1 for _, ok, _ in calls if not ok) / len(calls)) if calls else 0.0,
+                "p90_latency_s": latencies[int(0.9 * (len(latencies) - 1))] if latencies else None,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._calls.clear()
+            self._probes_in_flight = 0
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(
+                name,
+                window_s=settings.circuit_window_s,
+                min_calls=settings.circuit_min_calls,
+                failure_rate=settings.circuit_failure_rate,
+                slow_call_s=settings.circuit_slow_call_s,
+                open_s=settings.circuit_open_s,
+            )
+        return breaker
+
+
+def health_report() -> dict[str, dict]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.health() for b in breakers}
@@ -0,0 +1,113 @@
+"""Hedged geocoding over two providers.
+
+주 provider(Kakao)에 먼저 요청하고, hedge 지연 안에 답이 없으면 보조 provider
+(VWorld)에도 같은 요청을 보내 먼저 도착한 유효한 결과를 씁니다. 늦게 끝난 쪽은
+결과만 버립니다(스레드는 취소할 수 없으므로 끝날 때까지 실행).
+
+hedge 지연은 주 provider의 최근 지연 분포의 분위수(기본 p90)로 계속 갱신합니다.
+hedge가 발동해 보조가 이긴 경우에도 주 provider의 실제 지연은 끝난 뒤 기록하므로
+분포가 잘리지 않습니다.
+"""
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from api.adapters import GeocodingProvider
+from core.models import LocationResult
+
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="geocode-hedge")
+
+
+class HedgedGeocodingProvider:
+    """GeocodingProvider that hedges `primary` with `secondary` after a delay."""
+
+    def __init__(
+        self,
+        primary: GeocodingProvider,
+        secondary: GeocodingProvider,
+        *,
+        hedge_delay_s: float | None = None,
+        quantile: float = 0.9,
+        window: int = 200,
+        min_delay_s: float = 0.05,
+        max_delay_s: float = 2.0,
+        initial_delay_s: float = 0.3,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.fixed_delay_s = hedge_delay_s
+        self.quantile = quantile
+        self.min_delay_s = min_delay_s
+        self.max_delay_s = max_delay_s
+        self.initial_delay_s = initial_delay_s
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.wins = {"primary": 0, "secondary": 0}
+        self.hedged = 0
+        self.requests = 0
+
+    @property
+    def hedge_delay_s(self) -> float:
+        if self.fixed_delay_s is not None:
+            return self.fixed_delay_s
+        with self._lock:
+            samples = list(self._latencies)
+        if len(samples) < 10:
+            return self.initial_delay_s
+        return float(np.clip(np.quantile(samples, self.quantile), self.min_delay_s, self.max_delay_s))
+
+    def stats(self) -> dict:
+        delay = self.hedge_delay_s
+        with self._lock:
+            return {"requests": self.requests, "hedged": self.hedged, "wins": dict(self.wins), "hedge_delay_s": delay}
+
+    def _submit_primary(self, address: str) -> Future:
+        def _call() -> LocationResult | None:
+            # 풀 대기열에서 기다린 시간은 provider 지연이 아니므로 실행 시작부터 잼
+            started = time.monotonic()
+            res = self.primary.geocode(address)
+            # 실패한 호출은 지연 분포에 넣지 않음 (빠른 실패가 p90을 끌어내리지 않도록)
+            with self._lock:
+                self._latencies.append(time.monotonic() - started)
+            return res
+
+        # 호출 측 마감 시간(contextvar)이 보조 스레드에서도 보이도록 컨텍스트를 넘김
+        return _executor.submit(contextvars.copy_context().run, _call)
+
+    def _won(self, name: str) -> None:
+        with self._lock:
+            self.wins[name] += 1
+
+    def geocode(self, address: str) -> LocationResult | None:
+        with self._lock:
+            self.requests += 1
+        primary = self._submit_primary(address)
+        done, _ = wait([primary], timeout=self.hedge_delay_s)
+        if done and primary.exception() is None and primary.result() is not None:
+            self._won("primary")
+            return primary.result()
+
+        with self._lock:
+            self.hedged += 1
+        secondary = _executor.submit(contextvars.copy_context().run, self.secondary.geocode, address)
+        names = {primary: "primary", secondary: "secondary"}
+        pending = {primary, secondary}
+        finished: list[Future] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in sorted(done, key=lambda f: f is not primary):
+                finished.append(f)
+                if f.exception() is None and f.result() is not None:
+                    self._won(names[f])
+                    return f.result()
+
+        # 둘 다 유효한 결과가 없음: 어느 쪽이든 '없음'이면 None, 둘 다 예외면 주 provider 예외
+        if any(f.exception() is None for f in finished):
+            return None
+        raise primary.exception()
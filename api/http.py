@@ -0,0 +1,281 @@
+"""Process-wide pooled HTTP session for outbound API calls.
+
+Kakao/VWorld/WFS 호출이 매번 `requests.get`으로 새 TCP+TLS 연결을 맺지 않도록
+프로세스당 `requests.Session` 하나를 공유합니다. 호스트별 keep-alive 연결 풀
+크기와 connect/read 타임아웃은 settings(OKSSANGIMONG_HTTP_*)에서 정합니다.
+
+urllib3 커넥션 풀은 스레드 안전하므로 Streamlit 세션 스레드들이 같은 세션을 씁니다.
+fork된 자식 프로세스는 부모의 소켓을 공유하지 않도록 새 세션을 만듭니다.
+`endpoint=`를 주면 엔드포인트별 회로 차단기(`api.circuit`)를 거칩니다.
+호출 측 마감 시간(`core.utils.deadline`)이 있으면 타임아웃과 호출 한도 대기를 남은
+시간으로 줄이고, `get_with_retries`는 재시도 가능한 오류만 그 안에서 다시 보냅니다.
+`cache_ttl_s`를 주면 200 응답(`cacheable`이 있으면 그 검증을 통과한 것만)을 디스크 캐시
+(`core.data_access.response_cache`)에 두고 TTL 동안은 요청(회로 차단기/호출 한도 포함) 없이 캐시에서 돌려줍니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from api.circuit import get_breaker
+from api.ratelimit import ENDPOINT_GROUPS, get_bucket
+from core.config import settings
+from core.data_access.response_cache import CachedResponse, default_response_cache, response_key
+from core.exceptions import DeadlineExceededError
+from core.utils.deadline import Deadline, backoff_delay, current_deadline
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_session_pid: int | None = None
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_connections,
+        pool_maxsize=settings.http_pool_maxsize,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _lock:
+            if _session is None or _session_pid != pid:
+                _session = _new_session()
+                _session_pid = pid
+    return _session
+
+
+def default_timeout(read_s: float | None = None) -> tuple[float, float]:
+    """(connect, read) timeout; read_s overrides the configured read timeout."""
+    return (settings.http_connect_timeout_s, settings.http_read_timeout_s if read_s is None else read_s)
+
+
+def _healthy(resp: requests.Response) -> bool:
+    return resp.status_code < 500 and resp.status_code != 429
+
+
+def retryable(error: BaseException | requests.Response) -> bool:
+    """Timeouts, dropped connections and 5xx are worth another try; 4xx/429/open circuits are not."""
+    if isinstance(error, requests.Response):
+        return error.status_code >= 500
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return False
+
+
+def _cached_response(url: str, cached: CachedResponse) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = cached.status
+    resp.headers = CaseInsensitiveDict({"Content-Type": cached.content_type, "X-Cache": "HIT"})
+    resp._content = cached.body
+    resp._content_consumed = True  # iter_content가 본문을 조각으로 돌려주도록
+    resp.url = url
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    return resp
+
+
+def _cache_lookup(url: str, params) -> tuple[str | None, requests.Response | None]:
+    key = response_key(url, params)
+    try:
+        cached = default_response_cache().get(key)
+    except Exception:
+        # 캐시 문제로 실제 요청을 막지 않음
+        return None, None
+    return key, (_cached_response(url, cached) if cached is not None else None)
+
+
+def json_object(resp: requests.Response) -> dict | None:
+    """Body parsed as a JSON object, or None (non-JSON content type, bad JSON, not an object)."""
+    if "json" not in resp.headers.get("Content-Type", "").lower():
+        return None
+    try:
+        data = json.loads(resp.content)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _cache_store(key: str, resp: requests.Response, ttl_s: float, cacheable: Callable[[requests.Response], bool] | None) -> None:
+    if resp.status_code != 200:
+        return
+    try:
+        # 200이어도 본문이 오류(예: status=ERROR, ServiceExceptionReport)면 저장하지 않음
+        if cacheable is not None and not cacheable(resp):
+            return
+        default_response_cache().put(
+            key, status=resp.status_code, content_type=resp.headers.get("Content-Type", ""), body=resp.content, ttl_s=ttl_s
+        )
+    except Exception:
+        pass
+
+
+def store_response(url: str, params, resp: requests.Response, body: bytes, *, ttl_s: float) -> None:
+    """Cache a 200 body the caller has read (and validated) itself, e.g. while streaming.
+
+    `get(..., store=False)`와 짝으로 씁니다. 캐시에서 나온 응답은 다시 쓰지 않습니다.
+    """
+    if not settings.http_cache_enabled or resp.status_code != 200 or resp.headers.get("X-Cache") == "HIT":
+        return
+    try:
+        default_response_cache().put(
+            response_key(url, params), status=200, content_type=resp.headers.get("Content-Type", ""), body=body, ttl_s=ttl_s
+        )
+    except Exception:
+        pass
+
+
+def _within(timeout: tuple[float, float], deadline: Deadline) -> tuple[float, float]:
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError("deadline exceeded before request")
+    return (min(timeout[0], remaining), min(timeout[1], remaining))
+
+
+def get(
+    url: str,
+    *,
+    timeout: float | tuple[float, float] | None = None,
+    endpoint: str | None = None,
+    quota_key: str | None = None,
+    max_wait_s: float | None = None,
+    deadline: Deadline | None = None,
+    cache_ttl_s: float | None = None,
+    cacheable: Callable[[requests.Response], bool] | None = None,
+    store: bool = True,
+    **kwargs,
+) -> requests.Response:
+    """`requests.get` over the shared pool; a float timeout is the read timeout.
+
+    endpoint가 주어지면 해당 회로 차단기를 거칩니다. 회로가 열려 있으면 요청 없이
+    `CircuitOpenError`를 던지고, 예외/5xx/429/느린 응답은 실패로 기록합니다.
+    quota_key(API 키)도 주어지면 키별 공유 버킷에서 차례를 받은 뒤 요청하며,
+    max_wait_s(기본 settings.rate_limit_max_wait_s) 안에 차례가 없으면 `RateLimitedError`.
+    deadline(기본: 현재 `deadline_scope`)이 지났으면 요청 없이 `DeadlineExceededError`.
+    cache_ttl_s가 있으면 디스크 캐시를 먼저 보고(hit이면 `X-Cache: HIT`), 200 응답은 그 TTL로 저장.
+    cacheable(resp)가 주어지면 그것이 True인 응답만 저장합니다 (본문 검증은 호출 측 몫).
+    store=False면 조회만 하고, 스트림으로 읽는 호출 측이 다 읽은 뒤 `store_response`로 저장합니다.
+    """
+    cache_key = None
+    if cache_ttl_s is not None and settings.http_cache_enabled:
+        cache_key, cached = _cache_lookup(url, kwargs.get("params"))
+        if cached is not None:
+            return cached
+    resp = _get(url, timeout=timeout, endpoint=endpoint, quota_key=quota_key, max_wait_s=max_wait_s, deadline=deadline, **kwargs)
+    if cache_key is not None and store:
+        _cache_store(cache_key, resp, cache_ttl_s, cacheable)
+    return resp
+
+
+def _get(
+    url: str,
+    *,
+    timeout: float | tuple[float, float] | None,
+    endpoint: str | None,
+    quota_key: str | None,
+    max_wait_s: float | None,
+    deadline: Deadline | None,
+    **kwargs,
+) -> requests.Response:
+    if timeout is None or isinstance(timeout, (int, float)):
+        timeout = default_timeout(timeout)
+    deadline = deadline or current_deadline()
+    if deadline is not None:
+        timeout = _within(timeout, deadline)
+    if endpoint is None:
+        return get_session().get(url, timeout=timeout, **kwargs)
+
+    breaker = get_breaker(endpoint)
+    breaker.before_call()
+    if quota_key:
+        wait = settings.rate_limit_max_wait_s if max_wait_s is None else max_wait_s
+        if deadline is not None:
+            wait = deadline.cap(wait)
+        try:
+            get_bucket(ENDPOINT_GROUPS[endpoint], quota_key).acquire(max_wait_s=wait)
+        except Exception:
+            # 요청을 보내지 않았으므로 회로 상태에는 반영하지 않음 (half-open 시험 슬롯만 반환)
+            breaker.release()
+            raise
+    if deadline is not None:
+        # 호출 한도 대기로 남은 시간이 줄었을 수 있음
+        try:
+            timeout = _within(timeout, deadline)
+        except DeadlineExceededError:
+            breaker.release()
+            raise
+    started = time.monotonic()
+    ok = False
+    try:
+        resp = get_session().get(url, timeout=timeout, **kwargs)
+        ok = _healthy(resp)
+        return resp
+    finally:
+        breaker.record(ok, time.monotonic() - started)
+
+
+def get_with_retries(
+    url: str,
+    *,
+    retries: int | None = None,
+    deadline: Deadline | None = None,
+    wait: Callable[[float], bool] | None = None,
+    **kwargs,
+) -> requests.Response:
+    """`get`, retrying timeouts / connection errors / 5xx with jittered backoff.
+
+    재시도는 최대 retries(기본 settings.http_max_retries)번, 백오프는 full jitter이며
+    마감 시간의 남은 예산을 넘는 대기는 하지 않습니다(그때는 마지막 응답/오류를 그대로).
+    wait(delay)는 백오프 대기 함수로, True를 돌려주면 (예: 다른 요청이 이미 답을 찾음)
+    더 기다리지 않고 마지막 결과를 돌려줍니다. 기본은 `time.sleep`.
+    """
+    retries = settings.http_max_retries if retries is None else retries
+    deadline = deadline or current_deadline()
+    attempt = 0
+    while True:
+        try:
+            resp = get(url, deadline=deadline, **kwargs)
+            error: BaseException | None = None
+        except Exception as e:
+            if not retryable(e):
+                raise
+            resp, error = None, e
+        if (resp is not None and not retryable(resp)) or attempt >= retries:
+            break
+        delay = backoff_delay(attempt, base_s=settings.http_backoff_base_s, cap_s=settings.http_backoff_cap_s, deadline=deadline)
+        if delay is None:
+            break
+        if wait is not None:
+            if wait(delay):
+                break
+        else:
+            time.sleep(delay)
+        if resp is not None:
+            resp.close()
+        attempt += 1
+    if error is not None:
+        raise error
+    return resp
+
+
+def close_session() -> None:
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-import requests
+from api import http
+from core.config import settings
 from core.models import LocationResult
 
+
+def _cacheable(resp) -> bool:
+    """Only responses with at least one document (no negative caching)."""
+    data = http.json_object(resp)
+    return bool(data and data.get("documents"))
+
+
 class KakaoGeocodingProvider:
     """Kakao local API: address search.
 
@@ -11,7 +19,7 @@ class KakaoGeocodingProvider:
 
     BASE_URL = "https://dapi.kakao.com/v2/local/search/address.json"
 
-    def __init__(self, api_key: str, timeout_s: float = 5.0):
+    def __init__(self, api_key: str, timeout_s: float | None = None):
         self.api_key = api_key
         self.timeout_s = timeout_s
 
@@ -21,7 +29,16 @@ class KakaoGeocodingProvider:
             return None
 
         headers = {"Authorization": f"KakaoAK {self.api_key}"}
-        resp = requests.get(self.BASE_URL, headers=headers, params={"query": address}, timeout=self.timeout_s)
+        resp = http.get_with_retries(
+            self.BASE_URL,
+            headers=headers,
+            params={"query": address},
+            timeout=self.timeout_s,
+            endpoint="kakao_geocode",
+            quota_key=self.api_key,
+            cache_ttl_s=settings.geocode_cache_ttl_s,
+            cacheable=_cacheable,
+        )
         resp.raise_for_status()
         data = resp.json()
         docs = data.get("documents") or []
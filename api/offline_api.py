@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from core.data_access.address_index import AddressIndex, default_address_index
+from core.models import LocationResult
+
+class OfflineGeocodingProvider:
+    """Local road-name address index (no network).
+
+    `python -m core.data_access.address_index`로 만든 색인을 사용합니다.
+    """
+
+    def __init__(self, index: AddressIndex | None = None):
+        index = index or default_address_index()
+        if index is None:
+            raise FileNotFoundError("offline address index not built (python -m core.data_access.address_index)")
+        self.index = index
+
+    def geocode(self, address: str) -> LocationResult | None:
+        address = (address or "").strip()
+        if not address:
+            return None
+
+        m = self.index.lookup(address)
+        if m is None:
+            return None
+
+        return LocationResult(
+            input_address=address,
+            normalized_address=m.address,
+            point={"lat": m.lat, "lon": m.lon},
+            provider="offline",
+            extra={"match": m.match, "building_name": m.name},
+        )
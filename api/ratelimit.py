@@ -0,0 +1,121 @@
+"""Host-wide rate limiter for provider quotas (file-locked token bucket).
+
+Kakao/VWorld 키의 초당/일일 한도를 넘지 않도록, 같은 호스트의 모든 스레드와
+프로세스가 `data/cache/ratelimit/<그룹>-<키 해시>.json` 상태 파일 하나를
+`fcntl.flock`으로 잠그고 공유합니다.
+
+버킷은 GCRA(virtual scheduling) 방식입니다. 호출마다 다음 허용 시각(tat)을
+예약하고 그 시각까지 기다리므로, 몰린 요청이 도착 순서대로 줄을 서고 재시도
+폭주가 없습니다. 대기 시간이 deadline을 넘으면 예약하지 않고 바로
+`RateLimitedError`를 던집니다. 일일 한도를 다 쓰면 기다리지 않고 실패합니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내부에서만 공유
+    fcntl = None
+
+from core.config import settings
+from core.exceptions import RateLimitedError
+
+_KST = timezone(timedelta(hours=9))
+
+
+class TokenBucket:
+    """`rate_per_s` sustained, `burst` back-to-back, optional `daily_limit` (KST day)."""
+
+    def __init__(self, path: Path, *, rate_per_s: float, burst: int = 1, daily_limit: int | None = None):
+        self.path = Path(path)
+        self.rate_per_s = rate_per_s
+        self.burst = max(1, burst)
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+
+    def _update(self, fn):
+        """Run fn(state) -> result under the thread lock and the file lock; persists state."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, "a+", encoding="utf-8") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    state = {}
+                result = fn(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reserve(self, state: dict, now: float, max_wait_s: float) -> float:
+        day = datetime.fromtimestamp(now, _KST).strftime("%Y-%m-%d")
+        if state.get("day") != day:
+            state["day"], state["used_today"] = day, 0
+        if self.daily_limit is not None and state["used_today"] >= self.daily_limit:
+            raise RateLimitedError(f"{self.path.stem}: daily quota of {self.daily_limit} exhausted")
+
+        interval = 1.0 / self.rate_per_s
+        tat = max(float(state.get("tat", 0.0)), now)
+        # burst만큼은 tat가 현재보다 앞서 있어도 바로 허용
+        wait = max(0.0, tat - (self.burst - 1) * interval - now)
+        if wait > max_wait_s:
+            raise RateLimitedError(f"{self.path.stem}: rate limited, next slot in {wait:.2f}s")
+        state["tat"] = tat + interval
+        state["used_today"] += 1
+        return wait
+
+    def acquire(self, *, max_wait_s: float = 0.0) -> float:
+        """Take one slot, sleeping until it starts; returns seconds waited.
+
+        max_wait_s 안에 차례가 오지 않으면 RateLimitedError.
+        """
+        wait = self._update(lambda state: self._reserve(state, time.time(), max_wait_s))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def state_dir() -> Path:
+    return Path(settings.data_dir) / "cache" / "ratelimit"
+
+
+_buckets: dict[tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _limits(group: str) -> tuple[float, int, int | None]:
+    if group == "kakao":
+        return settings.kakao_rate_per_s, settings.kakao_burst, settings.kakao_daily_limit
+    return settings.vworld_rate_per_s, settings.vworld_burst, settings.vworld_daily_limit
+
+
+def get_bucket(group: str, api_key: str) -> TokenBucket:
+    """Shared bucket for one provider key ("kakao" / "vworld" group)."""
+    key_hash = hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:10]
+    with _buckets_lock:
+        bucket = _buckets.get((group, key_hash))
+        if bucket is None:
+            rate, burst, daily = _limits(group)
+            path = state_dir() / f"{group}-{key_hash}.json"
+            bucket = _buckets[(group, key_hash)] = TokenBucket(path, rate_per_s=rate, burst=burst, daily_limit=daily)
+        return bucket
+
+
+# 같은 키를 쓰는 엔드포인트는 한 버킷을 공유
+ENDPOINT_GROUPS = {"kakao_geocode": "kakao", "vworld_geocode": "vworld", "vworld_wfs": "vworld"}
+
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-import requests
+from api import http
+from core.config import settings
 from core.models import LocationResult
 
+
+def _cacheable(resp) -> bool:
+    """Only `status == "OK"` bodies; NOT_FOUND/ERROR also come back as HTTP 200."""
+    data = http.json_object(resp)
+    return bool(data) and ((data.get("response") or {}).get("status") == "OK")
+
+
 class VWorldGeocodingProvider:
     """VWorld geocoding (address -> point).
 
@@ -12,7 +20,7 @@ class VWorldGeocodingProvider:
 
     BASE_URL = "https://api.vworld.kr/req/address"
 
-    def __init__(self, api_key: str, timeout_s: float = 5.0):
+    def __init__(self, api_key: str, timeout_s: float | None = None):
         self.api_key = api_key
         self.timeout_s = timeout_s
 
@@ -30,7 +38,15 @@ class VWorldGeocodingProvider:
             "address": address,
             "key": self.api_key,
         }
-        resp = requests.get(self.BASE_URL, params=params, timeout=self.timeout_s)
+        resp = http.get_with_retries(
+            self.BASE_URL,
+            params=params,
+            timeout=self.timeout_s,
+            endpoint="vworld_geocode",
+            quota_key=self.api_key,
+            cache_ttl_s=settings.geocode_cache_ttl_s,
+            cacheable=_cacheable,
+        )
         resp.raise_for_status()
         data = resp.json()
 
@@ -51,4 +67,4 @@ class VWorldGeocodingProvider:
             point={"lat": lat, "lon": lon},
             provider="vworld",
             extra={"raw": data},
-        )
\ No newline at end of file
+        )
@@ -2,13 +2,30 @@ from __future__ import annotations
 
 import math
 import os
-import time
-from typing import Iterable, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
 
 import requests
 
+from api import http
+from core.config import settings
+from core.data_access.wfs_tile_cache import WfsTileCache, default_wfs_tile_cache
+from core.exceptions import ProviderUnavailableError
+from core.utils.deadline import Deadline, current_deadline
+from core.utils.geojson_stream import FeatureStream
+from core.utils.geometry import extract_polygons as _extract_polygons
+from core.utils.geometry import iter_exterior_rings as _iter_exterior_rings
+from core.utils.geometry import point_in_polygon as _point_in_polygon
+from core.utils.geometry import ring_contains as _ring_contains
+from core.utils.singleflight import SingleFlight
+
 VWORLD_WFS_URL = "https://api.vworld.kr/req/wfs"
 
+_flight = SingleFlight()
+# 반경 단계별 요청을 동시에 보내는 공용 풀
+_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="vworld-wfs")
+
 
 def _bbox_from_point(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
     meters_per_deg_lat = 111320.0
@@ -18,51 +35,35 @@ def _bbox_from_point(lat: float, lon: float, radius_m: float) -> tuple[float, fl
     return (lon - dlon, lat - dlat, lon + dlon, lat + dlat)  # (minLon, minLat, maxLon, maxLat)
 
 
-def _point_in_polygon(point: tuple[float, float], polygon: Iterable[tuple[float, float]]) -> bool:
-    x, y = point
-    inside = False
-    pts = list(polygon)
-    if len(pts) < 3:
-        return False
-    j = len(pts) - 1
-    for i in range(len(pts)):
-        xi, yi = pts[i]
-        xj, yj = pts[j]
-        intersects = ((yi > y) != (yj > y)) and (
-            x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi
-        )
-        if intersects:
-            inside = not inside
-        j = i
-    return inside
-
+class _Truncated(Exception):
+    """The response hit the requested feature cap, so the bbox may have more buildings."""
 
-def _extract_polygons(geometry: dict) -> list[list[tuple[float, float]]]:
-    if not geometry:
-        return []
-    geom_type = geometry.get("type")
-    coords = geometry.get("coordinates") or []
-    polygons: list[list[tuple[float, float]]] = []
-    if geom_type == "Polygon":
-        if coords:
-            polygons.append([(float(x), float(y)) for x, y in coords[0]])
-    elif geom_type == "MultiPolygon":
-        for poly in coords:
-            if poly:
-                polygons.append([(float(x), float(y)) for x, y in poly[0]])
-    return polygons
 
-
-def _fetch_polygon_once(
+def _fetch_polygons(
+    bbox: tuple[float, float, float, float],
     *,
-    lat: float,
-    lon: float,
     api_key: str,
-    radius_m: float,
     timeout_s: float,
     domain: Optional[str],
-) -> Optional[list[tuple[float, float]]]:
-    min_lon, min_lat, max_lon, max_lat = _bbox_from_point(lat, lon, radius_m)
+    cancelled: Optional[threading.Event] = None,
+    deadline: Optional[Deadline] = None,
+    point: Optional[tuple[float, float]] = None,
+    max_features: Optional[int] = None,
+) -> Optional[list[list[tuple[float, float]]]]:
+    """Exterior rings of all buildings intersecting bbox; None if the request failed.
+
+    응답은 스트림으로 읽으며 feature를 하나씩 디코드합니다. point(lon, lat)가 주어지면
+    링마다 bbox → 점-폴리곤 순으로 확인해 점을 포함하는 첫 링에서 읽기를 멈추고
+    [그 링]을, 끝까지 없으면 [첫 링]을 반환합니다 (나머지 링은 변환하지 않음).
+    max_features가 주어지면 maxfeatures로 보내고, feature 수가 그 상한에 닿으면
+    (잘렸을 수 있으므로) `_Truncated`를 던집니다.
+    디스크 캐시에는 스트림을 끝까지 읽었고 features 배열이 있었으며 상한에 닿지 않은
+    본문만, 읽는 동안 모은 바이트 그대로 저장합니다 (본문을 다시 파싱하지 않음).
+    """
+    # 다른 반경에서 이미 답을 찾았으면 요청(과 호출 한도)을 쓰지 않음
+    if cancelled is not None and cancelled.is_set():
+        return None
+    min_lon, min_lat, max_lon, max_lat = bbox
 
     # EPSG:4326 bbox 순서: (ymin,xmin,ymax,xmax) = (minLat,minLon,maxLat,maxLon)
     bbox_str = f"{min_lat},{min_lon},{max_lat},{max_lon}"
@@ -79,8 +80,44 @@ def _fetch_polygon_once(
     }
     if domain:
         params["domain"] = domain
+    if max_features is not None:
+        params["maxfeatures"] = str(max_features)
+
+    # 타임아웃/5xx만 마감 시간 안에서 재시도. 다른 반경이 먼저 답을 찾으면 백오프 대기를 끊음
+    resp = http.get_with_retries(
+        VWORLD_WFS_URL,
+        params=params,
+        timeout=timeout_s,
+        endpoint="vworld_wfs",
+        quota_key=api_key,
+        deadline=deadline,
+        wait=cancelled.wait if cancelled is not None else None,
+        cache_ttl_s=settings.http_cache_wfs_ttl_s,
+        store=False,
+        stream=True,
+    )
 
-    resp = requests.get(VWORLD_WFS_URL, params=params, timeout=timeout_s)
+    def _store(body: bytes) -> None:
+        http.store_response(VWORLD_WFS_URL, params, resp, body, ttl_s=settings.http_cache_wfs_ttl_s)
+
+    try:
+        return _read_polygons(resp, cancelled=cancelled, point=point, max_features=max_features, on_complete=_store)
+    finally:
+        # 끝까지 읽은 연결은 풀로 돌아가고, 중간에 멈춘 스트림은 연결을 닫음
+        resp.close()
+
+
+def _read_polygons(
+    resp: requests.Response,
+    *,
+    cancelled: Optional[threading.Event],
+    point: Optional[tuple[float, float]],
+    max_features: Optional[int] = None,
+    on_complete: Optional[Callable[[bytes], None]] = None,
+) -> Optional[list[list[tuple[float, float]]]]:
+    """Polygons from a WFS response; on_complete(body) gets a fully read, valid, uncapped body."""
+    if cancelled is not None and cancelled.is_set():
+        return None
     ctype = resp.headers.get("Content-Type", "")
 
     # HTTP 에러
@@ -104,25 +141,71 @@ def _fetch_polygon_once(
         print("[VWORLD WFS] BODY:", resp.text[:500])
         return None
 
-    data = resp.json()
-    features = data.get("features") or []
-    if not features:
-        # 0건이면 그냥 None
+    polygons: list[list[tuple[float, float]]] = []
+    raw = resp.iter_content(chunk_size=16 * 1024)
+    body = bytearray() if on_complete is not None else None
+
+    def _tee():
+        # 캐시에 둘 본문은 파싱하면서 같이 모음
+        for chunk in raw:
+            if body is not None:
+                body.extend(chunk)
+            yield chunk
+
+    chunks = _tee()
+    features = FeatureStream(chunks)
+    n_features = 0
+    try:
+        for f in features:
+            n_features += 1
+            if point is None:
+                polygons.extend(_extract_polygons(f.get("geometry") or {}))
+                continue
+            for ring in _iter_exterior_rings(f.get("geometry") or {}):
+                if _ring_contains(point, ring):
+                    return [[(float(x), float(y)) for x, y in ring]]
+                if not polygons:
+                    polygons.append([(float(x), float(y)) for x, y in ring])
+    except ValueError as e:
+        # 잘린/깨진 JSON
+        print("[VWORLD WFS] Invalid JSON body | URL:", resp.url, "|", str(e)[:200])
         return None
+    # features 배열 뒤의 나머지(crs 등)도 읽어야 연결을 재사용할 수 있음
+    for _ in chunks:
+        pass
+    if max_features is not None and n_features >= max_features:
+        print("[VWORLD WFS] response hit maxfeatures", max_features, "| URL:", resp.url)
+        raise _Truncated()
+    if body is not None and features.found_array:
+        on_complete(bytes(body))
+    return polygons
 
-    polygons: list[list[tuple[float, float]]] = []
-    for f in features:
-        polygons.extend(_extract_polygons(f.get("geometry") or {}))
 
+def _fetch_polygon_once(
+    *,
+    lat: float,
+    lon: float,
+    api_key: str,
+    radius_m: float,
+    timeout_s: float,
+    domain: Optional[str],
+    cancelled: Optional[threading.Event] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[list[tuple[float, float]]]:
+    polygons = _fetch_polygons(
+        _bbox_from_point(lat, lon, radius_m),
+        api_key=api_key,
+        timeout_s=timeout_s,
+        domain=domain,
+        cancelled=cancelled,
+        deadline=deadline,
+        point=(lon, lat),
+    )
     if not polygons:
+        # 0건이면 그냥 None
         return None
 
-    # 점 포함 폴리곤 우선
-    point = (lon, lat)
-    for poly in polygons:
-        if _point_in_polygon(point, poly):
-            return poly
-
+    # 점 포함 폴리곤이 있으면 그것, 없으면 첫 폴리곤 (스트림에서 이미 골라 옴)
     return polygons[0]
 
 
@@ -134,11 +217,16 @@ def get_building_polygon(
     domain: Optional[str] = None,
     *,
     max_attempts: int = 3,
+    deadline: Optional[Deadline] = None,
 ) -> Optional[list[tuple[float, float]]]:
     """
     coords는 (lat, lon)로 들어온다고 가정.
     (lon, lat)가 들어오는 경우가 많아서 대한민국 범위 기준 자동 보정.
-    또한 radius를 늘려가며 재시도해서 "가끔 안 잡히는" 케이스를 줄임.
+    또한 radius를 늘린 bbox(30m/60m/120m)도 동시에 조회해서 "가끔 안 잡히는" 케이스를 줄임.
+    같은 위치(약 0.1m 단위)에 대한 동시 호출은 요청 하나를 공유합니다.
+    타일 캐시(settings.wfs_tile_cache_enabled)가 켜져 있으면 점이 속한 고정 타일의
+    폴리곤을 한 번에 받아 두고 같은 타일의 다른 점은 로컬에서 답합니다.
+    deadline(기본: 현재 `deadline_scope`)이 지나면 그때까지 찾은 결과(없으면 None)를 반환합니다.
     """
     lat, lon = coords
 
@@ -147,27 +235,167 @@ def get_building_polygon(
         lat, lon = lon, lat
 
     domain = domain or os.getenv("VWORLD_DOMAIN")
+    deadline = deadline or current_deadline()
+
+    if settings.wfs_tile_cache_enabled:
+        return _get_building_polygon_tiled(
+            lat,
+            lon,
+            api_key,
+            cache=default_wfs_tile_cache(),
+            radius_m=radius_m,
+            timeout_s=timeout_s,
+            domain=domain,
+            max_attempts=max_attempts,
+            deadline=deadline,
+        )
+    return _get_building_polygon_point(
+        lat, lon, api_key, radius_m=radius_m, timeout_s=timeout_s, domain=domain, max_attempts=max_attempts, deadline=deadline
+    )
 
-    # radius escalation: 30m -> 60m -> 120m (기본)
-    radii = [radius_m, radius_m * 2, radius_m * 4]
-
-    for attempt in range(max_attempts):
-        r = radii[min(attempt, len(radii) - 1)]
-        try:
-            poly = _fetch_polygon_once(
-                lat=lat,
-                lon=lon,
-                api_key=api_key,
-                radius_m=r,
-                timeout_s=timeout_s,
-                domain=domain,
-            )
-            if poly:
-                return poly
-        except requests.RequestException as e:
-            print("[VWORLD WFS] RequestException:", str(e))
 
-        # backoff
-        time.sleep(0.2 * (2**attempt))
+def _get_building_polygon_point(
+    lat: float,
+    lon: float,
+    api_key: str,
+    *,
+    radius_m: float,
+    timeout_s: float,
+    domain: Optional[str],
+    max_attempts: int,
+    deadline: Optional[Deadline],
+) -> Optional[list[tuple[float, float]]]:
+    key = (round(lat, 6), round(lon, 6), api_key, radius_m, max_attempts, domain)
+    return _flight.do(
+        key,
+        lambda: _get_building_polygon(
+            lat,
+            lon,
+            api_key,
+            radius_m=radius_m,
+            timeout_s=timeout_s,
+            domain=domain,
+            max_attempts=max_attempts,
+            deadline=deadline,
+        ),
+    )
+
+
+def _get_building_polygon_tiled(
+    lat: float,
+    lon: float,
+    api_key: str,
+    *,
+    cache: WfsTileCache,
+    radius_m: float,
+    timeout_s: float,
+    domain: Optional[str],
+    max_attempts: int = 3,
+    deadline: Optional[Deadline] = None,
+) -> Optional[list[tuple[float, float]]]:
+    tile = cache.tile_of(lat, lon)
+    features = cache.get(tile)
+    if features is None:
+        features = _flight.do(
+            ("tile", cache.tile_deg, tile, api_key, domain),
+            lambda: _fetch_tile(cache, tile, api_key=api_key, timeout_s=timeout_s, domain=domain, deadline=deadline),
+        )
+    if features is None:
+        return None
+    if features.truncated:
+        # 한 번에 다 받을 수 없는 밀집 타일: 이웃 폴리곤이 빠졌을 수 있으므로 점 중심 조회
+        return _get_building_polygon_point(
+            lat, lon, api_key, radius_m=radius_m, timeout_s=timeout_s, domain=domain, max_attempts=max_attempts, deadline=deadline
+        )
+    # 점을 포함하는 폴리곤이 없으면 반경 단계의 최대치(기본 120m) 안에서 가장 가까운 폴리곤
+    return features.polygon_at(lat, lon, max_dist_m=radius_m * 4)
+
+
+def _fetch_tile(cache: WfsTileCache, tile, *, api_key: str, timeout_s: float, domain: Optional[str], deadline: Optional[Deadline]):
+    try:
+        polygons = _fetch_polygons(
+            cache.tile_bbox(tile),
+            api_key=api_key,
+            timeout_s=timeout_s,
+            domain=domain,
+            deadline=deadline,
+            max_features=settings.wfs_tile_max_features,
+        )
+    except _Truncated:
+        return cache.mark_truncated(tile)
+    except ProviderUnavailableError as e:
+        print("[VWORLD WFS]", str(e))
+        return None
+    except requests.RequestException as e:
+        print("[VWORLD WFS] RequestException:", str(e))
+        return None
+    if polygons is None:
+        return None
+    # 건물이 없는 타일도 캐시 (요청 실패만 제외)
+    return cache.put(tile, polygons)
+
+
+def _get_building_polygon(
+    lat: float,
+    lon: float,
+    api_key: str,
+    *,
+    radius_m: float,
+    timeout_s: float,
+    domain: Optional[str],
+    max_attempts: int,
+    deadline: Optional[Deadline] = None,
+) -> Optional[list[tuple[float, float]]]:
+    # radius escalation: 30m / 60m / 120m (기본)을 동시에 보내고, 점을 포함하는
+    # 폴리곤이 처음 도착하면 바로 반환. 아직 시작 안 한 요청은 취소하고, 진행 중인
+    # 요청은 응답을 버림 (blocking 소켓 읽기는 중간에 끊을 수 없음)
+    radii = [radius_m, radius_m * 2, radius_m * 4][: max(1, max_attempts)]
+    cancelled = threading.Event()
+    futures: dict[Future, float] = {
+        _executor.submit(
+            _fetch_polygon_once,
+            lat=lat,
+            lon=lon,
+            api_key=api_key,
+            radius_m=r,
+            timeout_s=timeout_s,
+            domain=domain,
+            cancelled=cancelled,
+            deadline=deadline,
+        ): r
+        for r in radii
+    }
+
+    point = (lon, lat)
+    fallback: dict[float, list[tuple[float, float]]] = {}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(
+                pending, timeout=deadline.remaining() if deadline else None, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                print("[VWORLD WFS] deadline exceeded")
+                break
+            for fut in done:
+                try:
+                    poly = fut.result()
+                except ProviderUnavailableError as e:
+                    # 회로 open / 호출 한도 초과 / 마감 초과: 이 반경은 포기 (호출 측 폴백)
+                    print("[VWORLD WFS]", str(e))
+                    continue
+                except requests.RequestException as e:
+                    print("[VWORLD WFS] RequestException:", str(e))
+                    continue
+                if not poly:
+                    continue
+                if _point_in_polygon(point, poly):
+                    return poly
+                fallback[futures[fut]] = poly
+    finally:
+        cancelled.set()
+        for fut in pending:
+            fut.cancel()
 
-    return None
\ No newline at end of file
+    # 점을 포함하는 폴리곤이 없으면 가장 작은 반경에서 찾은 폴리곤
+    return fallback[min(fallback)] if fallback else None
@@ -0,0 +1,98 @@
+"""Geocode cache hit rate: exact address key vs canonicalized key.
+
+Usage:
+    python -m benchmarks.bench_address_cache_hit_rate [--log addresses.txt] [--requests 20000]
+
+`--log`가 주어지면 한 줄에 주소 하나인 실제 입력 로그를 재생하고, 없으면 같은 주소를
+여러 표기(약칭, 띄어쓰기, 번지, 괄호 속 건물명, 상세주소)로 바꿔 쓴 합성 로그를
+인기도가 치우친(Zipf) 순서로 재생합니다. 캐시 용량은 무제한으로 가정합니다.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from core.utils.address import canonicalize_address
+
+_SIDO_VARIANTS = {
+    "서울특별시": ["서울특별시", "서울시", "서울"],
+    "부산광역시": ["부산광역시", "부산시", "부산"],
+    "경기도": ["경기도", "경기"],
+}
+_GU = ["중구", "종로구", "강남구", "마포구", "해운대구", "분당구"]
+_ROADS = ["세종대로", "테헤란로", "종로", "양화로", "해운대로", "판교역로", "강남대로118길"]
+_DONG = ["태평로1가", "역삼동", "서교동", "우동", "삼평동"]
+_BLDG = ["시청", "타워", "빌딩", "센터"]
+
+
+def _base_addresses(n: int, rng: np.random.Generator) -> list[tuple[str, str, str, bool]]:
+    out = []
+    for _ in range(n):
+        sido = str(rng.choice(list(_SIDO_VARIANTS)))
+        gu = str(rng.choice(_GU))
+        if rng.random() < 0.7:
+            out.append((sido, gu, f"{rng.choice(_ROADS)} {rng.integers(1, 400)}", True))
+        else:
+            out.append((sido, gu, f"{rng.choice(_DONG)} {rng.integers(1, 999)}-{rng.integers(1, 30)}", False))
+    return out
+
+
+def _variant(addr: tuple[str, str, str, bool], rng: np.random.Generator) -> str:
+    sido, gu, rest, is_road = addr
+    sido = str(rng.choice(_SIDO_VARIANTS[sido]))
+    if is_road and rng.random() < 0.3:
+        road, num = rest.rsplit(" ", 1)
+        rest = road + num
+    if not is_road and rng.random() < 0.4:
+        rest += "번지"
+    s = f"{sido} {gu} {rest}"
+    if rng.random() < 0.3:
+        s += f" ({rng.choice(_BLDG)})"
+    if rng.random() < 0.2:
+        s += f", {rng.integers(1, 20)}층"
+    if rng.random() < 0.3:
+        s = s.replace(" ", "  ", 1)
+    return s
+
+
+def synthetic_log(requests: int, distinct: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    bases = _base_addresses(distinct, rng)
+    ranks = np.minimum(rng.zipf(1.3, requests) - 1, distinct - 1)
+    return [_variant(bases[r], rng) for r in ranks]
+
+
+def hit_rate(log: list[str], key) -> float:
+    seen = set()
+    hits = 0
+    for addr in log:
+        k = key(addr)
+        if k in seen:
+            hits += 1
+        else:
+            seen.add(k)
+    return hits / max(len(log), 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", type=Path, default=None, help="replay log, one address per line")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--distinct", type=int, default=2_000)
+    args = parser.parse_args()
+
+    if args.log:
+        log = [line.strip() for line in args.log.read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        log = synthetic_log(args.requests, args.distinct)
+
+    print(f"requests: {len(log)}")
+    print(f"{'key':>12} {'hit_rate':>9} {'distinct_keys':>14}")
+    for name, key in (("exact", lambda a: " ".join(a.split())), ("canonical", canonicalize_address)):
+        print(f"{name:>12} {hit_rate(log, key):>9.3f} {len({key(a) for a in log}):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Nearest-building lookup latency benchmark.
+
+Usage:
+    python -m benchmarks.bench_nearby_buildings [--sizes 10000 100000 1000000] [--repeat 20]
+
+서울 범위에 무작위 건물 테이블을 만들어 `find_nearby_buildings` 지연시간을 측정합니다.
+격자 인덱스 빌드 시간은 테이블 로드 시 1회 비용이므로 따로 출력합니다.
+`--legacy`를 주면 기존 iterrows 구현도 (10k 행에서만) 함께 측정합니다.
+`--sqlite`를 주면 임시 디렉터리에 R*Tree DB를 만들어 sqlite 저장소도 측정합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from core.data_access import repositories
+from core.data_access.loaders import BuildingsData
+from core.data_access.spatial_index import GridIndex
+from core.data_access.sqlite_repository import SqliteBuildingRepository, build_buildings_db
+from core.utils.geometry import haversine_m
+
+SEOUL_BBOX = (37.42, 126.76, 37.70, 127.18)  # (minLat, minLon, maxLat, maxLon)
+
+
+def make_buildings(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    min_lat, min_lon, max_lat, max_lon = SEOUL_BBOX
+    return pd.DataFrame(
+        {
+            "building_id": [f"b-{i}" for i in range(n)],
+            "name": [f"건물 {i}" for i in range(n)],
+            "address": [f"서울특별시 테스트로 {i}" for i in range(n)],
+            "lat": rng.uniform(min_lat, max_lat, n),
+            "lon": rng.uniform(min_lon, max_lon, n),
+            "roof_area_m2": rng.uniform(50.0, 3000.0, n),
+        }
+    )
+
+
+def _legacy_find(df: pd.DataFrame, lat: float, lon: float, radius_m: float, limit: int) -> list:
+    candidates = []
+    for _, row in df.iterrows():
+        d = haversine_m(lat, lon, float(row["lat"]), float(row["lon"]))
+        if d <= radius_m:
+            candidates.append((d, row))
+    candidates.sort(key=lambda x: x[0])
+    return candidates[:limit]
+
+
+def _time_ms(fn, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--radius", type=float, default=200.0)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--sqlite", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    print(f"{'rows':>10} {'impl':>10} {'median_ms':>10} {'max_ms':>10}")
+    for n in args.sizes:
+        df = make_buildings(n)
+        queries = list(zip(rng.uniform(37.5, 37.6, args.repeat), rng.uniform(126.9, 127.05, args.repeat)))
+        it = iter(queries * 2)
+
+        t0 = time.perf_counter()
+        index = GridIndex.build(df["lat"].to_numpy(), df["lon"].to_numpy())
+        print(f"{n:>10} {'build_idx':>10} {(time.perf_counter() - t0) * 1000.0:>10.2f} {'':>10}")
+
+        data = BuildingsData(snapshot_id="bench", table=df, index=index)
+        with mock.patch.object(repositories, "load_buildings_snapshot", return_value=data):
+            med, mx = _time_ms(
+                lambda: repositories.find_nearby_buildings(*next(it), radius_m=args.radius, limit=args.limit),
+                args.repeat,
+            )
+        print(f"{n:>10} {'grid':>10} {med:>10.2f} {mx:>10.2f}")
+
+        if args.sqlite:
+            with tempfile.TemporaryDirectory() as tmp:
+                repo = SqliteBuildingRepository(Path(tmp) / "buildings.sqlite")
+                build_buildings_db(df, repo.path)
+                it = iter(queries * 2)
+                med, mx = _time_ms(
+                    lambda: repo.find_nearby_buildings(*next(it), radius_m=args.radius, limit=args.limit),
+                    args.repeat,
+                )
+            print(f"{n:>10} {'sqlite':>10} {med:>10.2f} {mx:>10.2f}")
+
+        if args.legacy and n <= 10_000:
+            it = iter(queries * 2)
+            med, mx = _time_ms(lambda: _legacy_find(df, *next(it), args.radius, args.limit), min(args.repeat, 3))
+            print(f"{n:>10} {'iterrows':>10} {med:>10.2f} {mx:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
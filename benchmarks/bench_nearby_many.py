@@ -0,0 +1,53 @@
+"""Batch nearest-building throughput (points per second).
+
+Usage:
+    python -m benchmarks.bench_nearby_many [--rows 100000 1000000] [--points 10000]
+
+`find_nearby_buildings_many`와 `find_nearby_buildings` 반복 호출의 처리량을 비교합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from unittest import mock
+
+import numpy as np
+
+from benchmarks.bench_nearby_buildings import make_buildings
+from core.data_access import repositories
+from core.data_access.loaders import BuildingsData
+from core.data_access.spatial_index import GridIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--points", type=int, default=10_000)
+    parser.add_argument("--radius", type=float, default=200.0)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(2)
+    points = list(zip(rng.uniform(37.45, 37.65, args.points), rng.uniform(126.8, 127.15, args.points)))
+
+    print(f"{'rows':>10} {'impl':>10} {'points':>8} {'seconds':>8} {'points/s':>10}")
+    for n in args.rows:
+        df = make_buildings(n)
+        index = GridIndex.build(df["lat"].to_numpy(), df["lon"].to_numpy())
+        data = BuildingsData(snapshot_id="bench", table=df, index=index)
+        with mock.patch.object(repositories, "load_buildings_snapshot", return_value=data):
+            t0 = time.perf_counter()
+            repositories.find_nearby_buildings_many(points, radius_m=args.radius, limit=args.limit)
+            batch_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            for lat, lon in points:
+                repositories.find_nearby_buildings(lat, lon, radius_m=args.radius, limit=args.limit)
+            loop_s = time.perf_counter() - t0
+
+        print(f"{n:>10} {'many':>10} {args.points:>8} {batch_s:>8.2f} {args.points / batch_s:>10.0f}")
+        print(f"{n:>10} {'loop':>10} {args.points:>8} {loop_s:>8.2f} {args.points / loop_s:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Per-worker memory: pandas table vs memory-mapped columnar store.
+
+Usage:
+    python -m benchmarks.bench_worker_rss [--rows 700000] [--workers 4]
+
+임시 data 디렉터리에 무작위 건물 테이블을 만들고, 워커 프로세스 여러 개가 동시에
+근접 검색을 수행한 뒤 각자의 RSS / PSS / Private 메모리를 보고합니다 (Linux 전용).
+PSS는 공유 페이지를 프로세스 수로 나눈 값이라 mmap 공유 효과가 드러납니다.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_nearby_buildings import make_buildings
+
+
+def _smaps_kb() -> dict[str, int]:
+    out = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[2] == "kB":
+                out[parts[0].rstrip(":")] = int(parts[1])
+    return out
+
+
+def _worker(mode: str, barrier, results) -> None:
+    from core.data_access import repositories
+    from core.data_access.loaders import load_buildings_snapshot
+
+    assert (load_buildings_snapshot().columns is not None) == (mode == "mmap")
+    for k in range(200):
+        repositories.find_nearby_buildings(37.50 + k * 0.0005, 126.95 + k * 0.0005, radius_m=200.0)
+    barrier.wait()
+    m = _smaps_kb()
+    results.put((mode, os.getpid(), m["Rss"], m["Pss"], m.get("Private_Clean", 0) + m.get("Private_Dirty", 0)))
+    barrier.wait()
+
+
+def _run(mode: str, workers: int) -> list[tuple]:
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(mode, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=700_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from core.data_access.columnar import write_building_columns
+
+    data_dir = Path(tempfile.mkdtemp(prefix="okssang-rss-"))
+    try:
+        processed = data_dir / "processed"
+        processed.mkdir(parents=True)
+        df = make_buildings(args.rows)
+        df.to_csv(processed / "sample_buildings.csv", index=False)
+        os.environ["OKSSANGIMONG_DATA_DIR"] = str(data_dir)
+
+        print(f"{'mode':>6} {'pid':>8} {'rss_mb':>8} {'pss_mb':>8} {'private_mb':>10}")
+        for mode in ("pandas", "mmap"):
+            if mode == "mmap":
+                write_building_columns(df, processed / "buildings_columns")
+            for m, pid, rss, pss, private in _run(mode, args.workers):
+                print(f"{m:>6} {pid:>8} {rss / 1024:>8.1f} {pss / 1024:>8.1f} {private / 1024:>10.1f}")
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,73 @@ class Settings:
     kakao_rest_api_key: str | None = os.getenv("KAKAO_REST_API_KEY") or None
     vworld_api_key: str | None = os.getenv("VWORLD_API_KEY") or None
 
+    # 건물 저장소: "memory"(pandas + 격자 인덱스) | "sqlite"(processed/buildings.sqlite, R*Tree)
+    building_repository: str = os.getenv("OKSSANGIMONG_BUILDING_REPOSITORY", "memory")
+    # 데이터 파일 변경 확인 주기 (초). 바뀌면 백그라운드에서 새 스냅샷으로 교체
+    data_reload_interval_s: float = float(os.getenv("OKSSANGIMONG_DATA_RELOAD_INTERVAL_S", "5"))
+    # 건물 근접 검색 격자 인덱스 셀 크기 (도, 0.002° ≈ 220m)
+    building_grid_cell_deg: float = float(os.getenv("OKSSANGIMONG_GRID_CELL_DEG", "0.002"))
+
+    # 지오코딩 결과 캐시 (data/cache/geocode.sqlite). TTL(초), 최대 항목 수, "0"이면 끔
+    geocode_cache_enabled: bool = os.getenv("OKSSANGIMONG_GEOCODE_CACHE", "1") != "0"
+    geocode_cache_ttl_s: float = float(os.getenv("OKSSANGIMONG_GEOCODE_CACHE_TTL_S", str(30 * 24 * 3600)))
+    geocode_cache_max_entries: int = int(os.getenv("OKSSANGIMONG_GEOCODE_CACHE_MAX_ENTRIES", "50000"))
+    # SQLite 캐시의 LRU 조회 시각은 이 시간(초)보다 오래됐을 때만 갱신 (조회마다 쓰기 트랜잭션을 열지 않음)
+    cache_touch_interval_s: float = float(os.getenv("OKSSANGIMONG_CACHE_TOUCH_INTERVAL_S", "600"))
+
+    # Kakao/VWorld 키가 모두 있으면 hedged 지오코딩. 지연(초)을 비워 두면 Kakao 지연 p90으로 자동 조정
+    geocode_hedge_enabled: bool = os.getenv("OKSSANGIMONG_GEOCODE_HEDGE", "1") != "0"
+    geocode_hedge_delay_s: float | None = float(os.environ["OKSSANGIMONG_GEOCODE_HEDGE_DELAY_S"]) if os.getenv("OKSSANGIMONG_GEOCODE_HEDGE_DELAY_S") else None
+    # 일괄 지오코딩(geocode_many): 동시 요청 상한, 주소당 제한 시간(초)
+    geocode_batch_concurrency: int = int(os.getenv("OKSSANGIMONG_GEOCODE_BATCH_CONCURRENCY", "16"))
+    geocode_batch_timeout_s: float = float(os.getenv("OKSSANGIMONG_GEOCODE_BATCH_TIMEOUT_S", "10"))
+
+    # 외부 API HTTP 연결 풀 (프로세스 공용 keep-alive 세션)
+    http_connect_timeout_s: float = float(os.getenv("OKSSANGIMONG_HTTP_CONNECT_TIMEOUT_S", "3.05"))
+    http_read_timeout_s: float = float(os.getenv("OKSSANGIMONG_HTTP_READ_TIMEOUT_S", "5"))
+    http_pool_connections: int = int(os.getenv("OKSSANGIMONG_HTTP_POOL_CONNECTIONS", "8"))
+    http_pool_maxsize: int = int(os.getenv("OKSSANGIMONG_HTTP_POOL_MAXSIZE", "16"))
+    # 재시도 가능한 오류(타임아웃/연결 끊김/5xx)의 재시도 횟수와 full-jitter 백오프(초)
+    http_max_retries: int = int(os.getenv("OKSSANGIMONG_HTTP_MAX_RETRIES", "2"))
+    http_backoff_base_s: float = float(os.getenv("OKSSANGIMONG_HTTP_BACKOFF_BASE_S", "0.2"))
+    http_backoff_cap_s: float = float(os.getenv("OKSSANGIMONG_HTTP_BACKOFF_CAP_S", "2"))
+    # 주소 지오코딩 / 옥상 면적 추정(WFS) 한 번에 쓰는 전체 시간 예산(초)
+    geocode_deadline_s: float = float(os.getenv("OKSSANGIMONG_GEOCODE_DEADLINE_S", "8"))
+    rooftop_deadline_s: float = float(os.getenv("OKSSANGIMONG_ROOFTOP_DEADLINE_S", "12"))
+    # 외부 API 원본 응답 디스크 캐시 (data/cache/http.sqlite, zlib 압축). 총 크기(바이트) 초과 시 LRU, "0"이면 끔
+    http_cache_enabled: bool = os.getenv("OKSSANGIMONG_HTTP_CACHE", "1") != "0"
+    http_cache_max_bytes: int = int(os.getenv("OKSSANGIMONG_HTTP_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    # WFS 건물 폴리곤 응답 TTL(초). 지오코딩 응답은 geocode_cache_ttl_s를 따름
+    http_cache_wfs_ttl_s: float = float(os.getenv("OKSSANGIMONG_HTTP_CACHE_WFS_TTL_S", str(7 * 24 * 3600)))
+    # VWorld WFS 건물 폴리곤을 고정 타일(도 단위) 단위로 받아 프로세스 메모리에 캐시. "0"이면 점 중심 bbox 조회
+    wfs_tile_cache_enabled: bool = os.getenv("OKSSANGIMONG_WFS_TILE_CACHE", "1") != "0"
+    wfs_tile_deg: float = float(os.getenv("OKSSANGIMONG_WFS_TILE_DEG", "0.002"))
+    wfs_tile_cache_max_tiles: int = int(os.getenv("OKSSANGIMONG_WFS_TILE_CACHE_MAX_TILES", "512"))
+    wfs_tile_cache_ttl_s: float = float(os.getenv("OKSSANGIMONG_WFS_TILE_CACHE_TTL_S", str(24 * 3600)))
+    # 타일 요청의 feature 상한(maxfeatures). 응답이 상한에 닿으면 잘린 것으로 보고 점 중심 조회로 대체
+    wfs_tile_max_features: int = int(os.getenv("OKSSANGIMONG_WFS_TILE_MAX_FEATURES", "1000"))
+
+    # 외부 API 회로 차단기: window_s 안에서 min_calls 이상, 실패율 failure_rate 이상이면 open_s 동안 차단
+    circuit_window_s: float = float(os.getenv("OKSSANGIMONG_CIRCUIT_WINDOW_S", "30"))
+    circuit_min_calls: int = int(os.getenv("OKSSANGIMONG_CIRCUIT_MIN_CALLS", "5"))
+    circuit_failure_rate: float = float(os.getenv("OKSSANGIMONG_CIRCUIT_FAILURE_RATE", "0.5"))
+    # 이 시간(초)보다 오래 걸린 호출도 실패로 집계
+    circuit_slow_call_s: float = float(os.getenv("OKSSANGIMONG_CIRCUIT_SLOW_CALL_S", "4"))
+    circuit_open_s: float = float(os.getenv("OKSSANGIMONG_CIRCUIT_OPEN_S", "30"))
+
+    # 키별 호출 한도 (호스트 내 모든 프로세스 공유). 일일 한도는 비우면 무제한
+    kakao_rate_per_s: float = float(os.getenv("OKSSANGIMONG_KAKAO_RATE_PER_S", "10"))
+    kakao_burst: int = int(os.getenv("OKSSANGIMONG_KAKAO_BURST", "5"))
+    kakao_daily_limit: int | None = int(os.environ["OKSSANGIMONG_KAKAO_DAILY_LIMIT"]) if os.getenv("OKSSANGIMONG_KAKAO_DAILY_LIMIT") else None
+    vworld_rate_per_s: float = float(os.getenv("OKSSANGIMONG_VWORLD_RATE_PER_S", "5"))
+    vworld_burst: int = int(os.getenv("OKSSANGIMONG_VWORLD_BURST", "3"))
+    vworld_daily_limit: int | None = int(os.environ["OKSSANGIMONG_VWORLD_DAILY_LIMIT"]) if os.getenv("OKSSANGIMONG_VWORLD_DAILY_LIMIT") else None
+    # 한도에 걸렸을 때 줄 서서 기다리는 최대 시간(초)
+    rate_limit_max_wait_s: float = float(os.getenv("OKSSANGIMONG_RATE_LIMIT_MAX_WAIT_S", "2"))
+
+    # 주소/건물명 자동완성 색인 최대 항목 수 (프로세스마다 색인을 들고 있으므로 메모리 상한 역할)
+    autocomplete_max_entries: int = int(os.getenv("OKSSANGIMONG_AUTOCOMPLETE_MAX_ENTRIES", "300000"))
+
     # 버전 관리(계수/수식/데이터)
     engine_version: str = "0.1.0"
     coefficient_set_version: str = "v1"
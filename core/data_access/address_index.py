@@ -0,0 +1,374 @@
+"""Offline road-name address index (memory-mapped).
+
+도로명주소 DB 사본(juso.go.kr `위치정보요약DB`, `|` 구분 텍스트)이나 같은 정보를 담은
+CSV로 `data/processed/address_index/`를 만들고, 오프라인 지오코더가 mmap으로 엽니다.
+
+레이아웃 (문자열은 `columnar.StringColumn`과 같은 UTF-8 바이트 + 오프셋):
+- key.*:        "시도 시군구 도로명 본번[-부번]" (canonicalize_address 결과), UTF-8 바이트 순 정렬
+- road_key.*:   "도로명 본번[-부번]" 정렬본,  road_rows.npy: road_key 순서 -> key 행 번호
+- name.*:       건물명 (없으면 null)
+- lat.npy, lon.npy: float32 WGS84
+- region.*:     고유 "시도 시군구" 정렬본,  region_ids.npy: key 행 -> region 번호
+- region_road.*: 지역별 고유 도로명 (지역 번호, 도로명 바이트 순),  region_road_offsets.npy: 지역 -> 범위
+- region_road_jamo.offsets/data.npy: 같은 도로명의 `jamo_bytes` (오타 보정용)
+
+원본 좌표(UTM-K, EPSG:5179)는 빌드할 때 WGS84로 변환합니다.
+
+생성:
+    python -m core.data_access.address_index data/raw/juso/entrc_*.txt [--encoding cp949] [--out DIR]
+    python -m core.data_access.address_index addresses.csv --encoding utf-8
+        # CSV 컬럼: sido,sigungu,road,main_no,sub_no,name,lat,lon (WGS84)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.columnar import StringColumn
+from core.utils.address import canonicalize_address
+from core.utils.hangul import edit_distances, jamo_bytes, to_jamo
+
+FORMAT_VERSION = 2
+
+# 위치정보요약DB 컬럼 위치 (헤더 없음, `|` 구분)
+JUSO_COLUMNS = {3: "sido", 4: "sigungu", 7: "road", 9: "main_no", 10: "sub_no", 11: "name", 16: "x", 17: "y"}
+
+_ROAD_TAIL = re.compile(r"(?:^| )(\S+(?:로|길)) (\d+)(?:-(\d+))?$")
+
+
+def default_address_index_dir() -> Path:
+    return Path(settings.data_dir) / "processed" / "address_index"
+
+
+def utmk_to_wgs84(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Inverse transverse Mercator for UTM-K (EPSG:5179, GRS80) -> (lat, lon) degrees."""
+    a = 6378137.0
+    f = 1 / 298.257222101
+    e2 = f * (2 - f)
+    ep2 = e2 / (1 - e2)
+    k0, lat0, lon0, fe, fn = 0.9996, math.radians(38.0), math.radians(127.5), 1_000_000.0, 2_000_000.0
+
+    def meridian_arc(phi):
+        return a * (
+            (1 - e2 / 4 - 3 * e2**2 / 64 - 5 * e2**3 / 256) * phi
+            - (3 * e2 / 8 + 3 * e2**2 / 32 + 45 * e2**3 / 1024) * np.sin(2 * phi)
+            + (15 * e2**2 / 256 + 45 * e2**3 / 1024) * np.sin(4 * phi)
+            - (35 * e2**3 / 3072) * np.sin(6 * phi)
+        )
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    m = meridian_arc(lat0) + (y - fn) / k0
+    mu = m / (a * (1 - e2 / 4 - 3 * e2**2 / 64 - 5 * e2**3 / 256))
+    e1 = (1 - math.sqrt(1 - e2)) / (1 + math.sqrt(1 - e2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1**3 / 32) * np.sin(2 * mu)
+        + (21 * e1**2 / 16 - 55 * e1**4 / 32) * np.sin(4 * mu)
+        + (151 * e1**3 / 96) * np.sin(6 * mu)
+        + (1097 * e1**4 / 512) * np.sin(8 * mu)
+    )
+    sin1, cos1, tan1 = np.sin(phi1), np.cos(phi1), np.tan(phi1)
+    c1 = ep2 * cos1**2
+    t1 = tan1**2
+    n1 = a / np.sqrt(1 - e2 * sin1**2)
+    r1 = a * (1 - e2) / (1 - e2 * sin1**2) ** 1.5
+    d = (x - fe) / (n1 * k0)
+    lat = phi1 - (n1 * tan1 / r1) * (
+        d**2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1**2 - 9 * ep2) * d**4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1**2 - 252 * ep2 - 3 * c1**2) * d**6 / 720
+    )
+    lon = lon0 + (
+        d - (1 + 2 * t1 + c1) * d**3 / 6 + (5 - 2 * c1 + 28 * t1 - 3 * c1**2 + 8 * ep2 + 24 * t1**2) * d**5 / 120
+    ) / cos1
+    return np.degrees(lat), np.degrees(lon)
+
+
+def read_address_source(path: Path, *, encoding: str = "cp949") -> pd.DataFrame:
+    """One source file -> frame with sido, sigungu, road, main_no, sub_no, name, lat, lon."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        df = pd.read_csv(path, dtype=str, encoding=encoding)
+    else:
+        df = pd.read_csv(
+            path, sep="|", header=None, dtype=str, encoding=encoding, usecols=list(JUSO_COLUMNS), quoting=3
+        ).rename(columns=JUSO_COLUMNS)
+        lat, lon = utmk_to_wgs84(pd.to_numeric(df.pop("x"), errors="coerce"), pd.to_numeric(df.pop("y"), errors="coerce"))
+        df["lat"], df["lon"] = lat, lon
+    return df
+
+
+def _canonical_unique(values: pd.Series) -> pd.Series:
+    # 도로명/시군구는 종류가 적으므로 고유값만 정규화
+    uniques = values.unique()
+    return values.map(dict(zip(uniques, (canonicalize_address(v) for v in uniques))))
+
+
+def _address_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """key, road_key, region and road columns for the source rows."""
+    main = pd.to_numeric(df["main_no"], errors="coerce").fillna(0).astype(int).astype(str)
+    sub = pd.to_numeric(df["sub_no"], errors="coerce").fillna(0).astype(int) if "sub_no" in df else 0
+    number = main.where(sub == 0, main + "-" + sub.astype(str))
+    road = _canonical_unique(df["road"].str.replace(" ", "", regex=False))
+    region = _canonical_unique(df["sido"].fillna("") + " " + df["sigungu"].fillna(""))
+    road_key = road + " " + number
+    full = (region + " " + road_key).str.strip()
+    return pd.DataFrame({"key": full, "road_key": road_key, "region": region, "road": road})
+
+
+def _sorted_by_bytes(values: pd.Series) -> np.ndarray:
+    # numpy 'S' 배열 정렬은 바이트 사전순 = 조회 시 이진 탐색 순서
+    return np.argsort(values.str.encode("utf-8").to_numpy().astype("S"), kind="stable")
+
+
+def write_address_index(frames: Iterable[pd.DataFrame], directory: Path) -> int:
+    """Build the index from source frames; returns the number of distinct addresses."""
+    df = pd.concat(list(frames), ignore_index=True)
+    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+    df = df.dropna(subset=["lat", "lon", "road", "main_no"]).reset_index(drop=True)
+    df[["key", "road_key", "region", "road"]] = _address_keys(df)
+    # 건물 하나에 출입구가 여러 개면 첫 출입구 좌표를 씀
+    df = df.drop_duplicates("key").reset_index(drop=True)
+    df = df.iloc[_sorted_by_bytes(df["key"])].reset_index(drop=True)
+    road_order = _sorted_by_bytes(df["road_key"])
+    # 지역별 고유 도로명: 오타 보정은 이 목록(시군구당 수백 개)만 훑음
+    regions = pd.Series(df["region"].unique())
+    regions = regions.iloc[_sorted_by_bytes(regions)].reset_index(drop=True)
+    region_ids = df["region"].map(pd.Series(np.arange(len(regions)), index=regions)).to_numpy(dtype=np.int32)
+    roads = pd.DataFrame({"region": region_ids, "road": df["road"]}).drop_duplicates()
+    roads = roads.iloc[_sorted_by_bytes(roads["road"])]
+    roads = roads.iloc[np.argsort(roads["region"].to_numpy(), kind="stable")].reset_index(drop=True)
+    road_offsets = np.searchsorted(roads["region"].to_numpy(), np.arange(len(regions) + 1)).astype(np.int64)
+    road_jamo = [jamo_bytes(to_jamo(r)) for r in roads["road"].tolist()]
+
+    directory = Path(directory)
+    tmp = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    name = df["name"].where(df["name"].fillna("").str.strip() != "", None) if "name" in df else pd.Series([None] * len(df))
+    for col, values in (
+        ("key", df["key"]),
+        ("road_key", df["road_key"].iloc[road_order]),
+        ("name", name),
+        ("region", regions),
+        ("region_road", roads["road"]),
+    ):
+        offsets, data, null = StringColumn.encode(values.reset_index(drop=True))
+        np.save(tmp / f"{col}.offsets.npy", offsets)
+        np.save(tmp / f"{col}.data.npy", data)
+        np.save(tmp / f"{col}.null.npy", null)
+    jamo_offsets = np.zeros(len(road_jamo) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(b) for b in road_jamo), dtype=np.int64, count=len(road_jamo)), out=jamo_offsets[1:])
+    np.save(tmp / "region_road_jamo.offsets.npy", jamo_offsets)
+    np.save(tmp / "region_road_jamo.data.npy", np.frombuffer(b"".join(road_jamo), dtype=np.uint8))
+    np.save(tmp / "region_road_offsets.npy", road_offsets)
+    np.save(tmp / "region_ids.npy", region_ids)
+    np.save(tmp / "road_rows.npy", road_order.astype(np.int32))
+    np.save(tmp / "lat.npy", df["lat"].to_numpy(dtype=np.float32))
+    np.save(tmp / "lon.npy", df["lon"].to_numpy(dtype=np.float32))
+    (tmp / "meta.json").write_text(
+        json.dumps({"version": FORMAT_VERSION, "rows": int(len(df)), "regions": int(len(regions))})
+    )
+
+    old = directory.with_name(directory.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if directory.exists():
+        directory.rename(old)
+    tmp.rename(directory)
+    shutil.rmtree(old, ignore_errors=True)
+    return int(len(df))
+
+
+def _bytes_at(col: StringColumn, i: int) -> bytes:
+    return bytes(col.data[col.offsets[i] : col.offsets[i + 1]])
+
+
+def _bisect_left(col: StringColumn, n: int, target: bytes) -> int:
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _bytes_at(col, mid) < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@dataclass(frozen=True)
+class AddressMatch:
+    address: str
+    lat: float
+    lon: float
+    name: str | None
+    match: str  # "exact" | "road" | "road_typo"
+
+
+@dataclass(frozen=True)
+class AddressIndex:
+    n: int
+    key: StringColumn
+    road_key: StringColumn
+    road_rows: np.ndarray
+    name: StringColumn
+    lat: np.ndarray
+    lon: np.ndarray
+    n_regions: int
+    region: StringColumn
+    region_ids: np.ndarray
+    region_road: StringColumn
+    region_road_offsets: np.ndarray
+    road_jamo_offsets: np.ndarray
+    road_jamo_data: np.ndarray
+
+    def _match(self, row: int, match: str) -> AddressMatch:
+        return AddressMatch(self.key[row], float(self.lat[row]), float(self.lon[row]), self.name[row], match)
+
+    def exact(self, key: str) -> int | None:
+        target = key.encode("utf-8")
+        i = _bisect_left(self.key, self.n, target)
+        return i if i < self.n and _bytes_at(self.key, i) == target else None
+
+    def region_id(self, region: str) -> int | None:
+        target = region.encode("utf-8")
+        i = _bisect_left(self.region, self.n_regions, target)
+        return i if i < self.n_regions and _bytes_at(self.region, i) == target else None
+
+    def rows_on_road(self, road: str) -> np.ndarray:
+        """Rows (key order) of every address on roads named `road`."""
+        prefix = (road + " ").encode("utf-8")
+        lo = _bisect_left(self.road_key, self.n, prefix)
+        hi = _bisect_left(self.road_key, self.n, prefix + b"\xff")
+        return np.asarray(self.road_rows[lo:hi])
+
+    def similar_road(self, region_id: int, road: str) -> str | None:
+        """The one road in the region whose name is within a few jamo edits of `road`.
+
+        빌드 때 만든 지역별 도로명 목록만 한 번에 비교합니다. 도로명의 숫자("118길")는
+        같아야 하고, 자모 8개 미만이면 1개, 그 이상이면 2개까지 다를 수 있습니다.
+        가장 가까운 후보가 둘 이상이면 고르지 않습니다.
+        """
+        lo, hi = int(self.region_road_offsets[region_id]), int(self.region_road_offsets[region_id + 1])
+        target = jamo_bytes(to_jamo(road))
+        limit = 1 if len(target) < 8 else 2
+        starts = np.asarray(self.road_jamo_offsets[lo : hi + 1])
+        lengths = np.diff(starts)
+        near = np.flatnonzero(np.abs(lengths - len(target)) <= limit)
+        if not len(near):
+            return None
+        width = int(lengths[near].max())
+        pos = starts[near][:, None] + np.arange(width)
+        candidates = np.asarray(self.road_jamo_data)[np.minimum(pos, len(self.road_jamo_data) - 1)]
+        dist = edit_distances(target, candidates, lengths[near], limit=limit)
+        digits = re.sub(r"\D", "", road)
+        best: dict[int, list[str]] = {}
+        for i in np.flatnonzero(dist <= limit):
+            name = self.region_road[lo + int(near[i])]
+            if re.sub(r"\D", "", name) == digits:
+                best.setdefault(int(dist[i]), []).append(name)
+        if not best:
+            return None
+        names = best[min(best)]
+        return names[0] if len(names) == 1 else None
+
+    def _regions_of(self, rows: np.ndarray, tokens: list[str]) -> list[int]:
+        # 행마다 키를 나누지 않고, 후보 행의 고유 지역만 입력 토큰과 비교
+        return [int(g) for g in np.unique(self.region_ids[rows]) if all(t in self.region[int(g)].split() for t in tokens)]
+
+    def lookup(self, address: str) -> AddressMatch | None:
+        """Exact canonical match, else the same road/number within the given region.
+
+        시도/시군구를 생략한 입력은 남은 후보가 한 지역일 때만 인정합니다. 도로명이 색인에
+        없으면 시도+시군구가 주어진 경우에 한해 자모 오타를 허용해 고칩니다 (match="road_typo").
+        해당 건물번호가 없으면 다른 건물을 내주지 않고 None입니다. 지번 주소는 지원하지 않습니다.
+        """
+        key = canonicalize_address(address)
+        if not key:
+            return None
+        row = self.exact(key)
+        if row is not None:
+            return self._match(row, "exact")
+
+        m = _ROAD_TAIL.search(key)
+        if m is None:
+            return None
+        road, main_no, sub_no = m.group(1), int(m.group(2)), int(m.group(3) or 0)
+        region = key[: m.start()].split()
+        match = "road"
+        regions = self._regions_of(self.rows_on_road(road), region)
+        if not regions and len(region) >= 2:
+            # 오타 후보는 지역 범위 안에서만 찾음 (전국 도로명과 비교하지 않음)
+            region_id = self.region_id(" ".join(region))
+            fixed = self.similar_road(region_id, road) if region_id is not None else None
+            if fixed is not None:
+                match, road, regions = "road_typo", fixed, [region_id]
+
+        number = f"{main_no}-{sub_no}" if sub_no else str(main_no)
+        same = [r for r in (self.exact(f"{self.region[g]} {road} {number}".strip()) for g in regions) if r is not None]
+        if len(same) != 1:
+            return None
+        return self._match(same[0], match)
+
+
+def open_address_index(directory: Path) -> AddressIndex:
+    directory = Path(directory)
+    meta = json.loads((directory / "meta.json").read_text())
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported address index version: {meta.get('version')}")
+
+    def _load(name: str) -> np.ndarray:
+        return np.load(directory / f"{name}.npy", mmap_mode="r")
+
+    def _strings(name: str) -> StringColumn:
+        return StringColumn(_load(f"{name}.offsets"), _load(f"{name}.data"), _load(f"{name}.null"))
+
+    return AddressIndex(
+        n=int(meta["rows"]),
+        key=_strings("key"),
+        road_key=_strings("road_key"),
+        road_rows=_load("road_rows"),
+        name=_strings("name"),
+        lat=_load("lat"),
+        lon=_load("lon"),
+        n_regions=int(meta["regions"]),
+        region=_strings("region"),
+        region_ids=_load("region_ids"),
+        region_road=_strings("region_road"),
+        region_road_offsets=_load("region_road_offsets"),
+        road_jamo_offsets=_load("region_road_jamo.offsets"),
+        road_jamo_data=_load("region_road_jamo.data"),
+    )
+
+
+@lru_cache(maxsize=1)
+def default_address_index() -> AddressIndex | None:
+    directory = default_address_index_dir()
+    if not (directory / "meta.json").exists():
+        return None
+    return open_address_index(directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the offline road-name address index.")
+    parser.add_argument("sources", type=Path, nargs="+", help="위치정보요약DB .txt files or CSV")
+    parser.add_argument("--encoding", default="cp949")
+    parser.add_argument("--out", type=Path, default=default_address_index_dir())
+    args = parser.parse_args()
+    n = write_address_index((read_address_source(p, encoding=args.encoding) for p in args.sources), args.out)
+    print(f"wrote {n} addresses -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Memory-mapped columnar building store.
+
+`data/processed/buildings_columns/` 아래에 컬럼별 `.npy` 파일을 두고
+`np.load(mmap_mode="r")`로 엽니다. 같은 호스트의 모든 프로세스가 OS 페이지 캐시의
+한 복사본을 공유하고, 콜드 스타트에 Parquet/CSV 파싱이 필요 없습니다.
+
+레이아웃:
+- meta.json: 행 수, 포맷 버전
+- lat.npy, lon.npy, roof_area_m2.npy: float32 숫자 컬럼 (결측은 NaN, compact schema와 동일)
+- <col>.offsets.npy / <col>.data.npy / <col>.null.npy: 문자열 컬럼 (UTF-8 바이트 + 오프셋)
+- grid_*.npy, grid.json: `GridIndex` 버킷 배열
+
+생성:
+    python -m core.data_access.columnar [--out DIR]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.spatial_index import GridIndex
+
+FORMAT_VERSION = 2
+NUMERIC_COLUMNS = ("lat", "lon", "roof_area_m2")
+STRING_COLUMNS = ("building_id", "name", "address")
+
+
+def default_columns_dir() -> Path:
+    return Path(settings.data_dir) / "processed" / "buildings_columns"
+
+
+@dataclass(frozen=True)
+class StringColumn:
+    """Variable-length UTF-8 strings packed into one byte array."""
+
+    offsets: np.ndarray
+    data: np.ndarray
+    null: np.ndarray
+
+    def __getitem__(self, i: int) -> str | None:
+        if self.null[i]:
+            return None
+        return bytes(self.data[self.offsets[i] : self.offsets[i + 1]]).decode("utf-8")
+
+    def tolist(self) -> list[str | None]:
+        """All values, decoding the byte array once instead of per-row slices."""
+        buf = bytes(self.data)
+        offsets = self.offsets.tolist()
+        return [None if n else buf[offsets[i] : offsets[i + 1]].decode("utf-8") for i, n in enumerate(self.null.tolist())]
+
+    @staticmethod
+    def encode(values: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        null = values.isna().to_numpy()
+        encoded = [b"" if n else str(v).encode("utf-8") for v, n in zip(values.tolist(), null)]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return offsets, data, null
+
+
+@dataclass(frozen=True)
+class BuildingColumns:
+    n: int
+    numeric: dict[str, np.ndarray]
+    strings: dict[str, StringColumn]
+    index: GridIndex
+
+    def to_frame(self) -> pd.DataFrame:
+        """The whole store as a table with the `load_buildings_table` columns (not schema-applied)."""
+        df = pd.DataFrame({name: col.tolist() for name, col in self.strings.items()})
+        for name, col in self.numeric.items():
+            df[name] = np.asarray(col)
+        return df
+
+    def records(self, rows: np.ndarray) -> list[dict]:
+        """Materialize only the requested rows as dicts."""
+        out = []
+        for r in rows:
+            rec: dict = {name: col[r] for name, col in self.strings.items()}
+            for name, col in self.numeric.items():
+                v = float(col[r])
+                rec[name] = None if np.isnan(v) else v
+            out.append(rec)
+        return out
+
+
+def write_building_columns(df: pd.DataFrame, directory: Path, *, cell_deg: float | None = None) -> int:
+    """Write `df` as a columnar store at `directory` and return the row count.
+
+    임시 디렉터리에 쓴 뒤 교체합니다. 이미 mmap으로 열린 파일은 삭제되어도
+    해당 프로세스가 닫을 때까지 유효합니다.
+    """
+    directory = Path(directory)
+    tmp = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    numeric = {
+        name: pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+        for name in NUMERIC_COLUMNS
+    }
+    for name, arr in numeric.items():
+        np.save(tmp / f"{name}.npy", arr)
+    for name in STRING_COLUMNS:
+        offsets, data, null = StringColumn.encode(df[name])
+        np.save(tmp / f"{name}.offsets.npy", offsets)
+        np.save(tmp / f"{name}.data.npy", data)
+        np.save(tmp / f"{name}.null.npy", null)
+
+    GridIndex.build(
+        numeric["lat"], numeric["lon"], cell_deg=cell_deg or settings.building_grid_cell_deg
+    ).save(tmp)
+    (tmp / "meta.json").write_text(json.dumps({"version": FORMAT_VERSION, "rows": int(len(df))}))
+
+    old = directory.with_name(directory.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if directory.exists():
+        directory.rename(old)
+    tmp.rename(directory)
+    shutil.rmtree(old, ignore_errors=True)
+    return int(len(df))
+
+
+def open_building_columns(directory: Path) -> BuildingColumns:
+    """Open a store written by `write_building_columns` (zero-copy, read-only mmap)."""
+    directory = Path(directory)
+    meta = json.loads((directory / "meta.json").read_text())
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported columnar store version: {meta.get('version')}")
+
+    def _load(name: str) -> np.ndarray:
+        return np.load(directory / f"{name}.npy", mmap_mode="r")
+
+    numeric = {name: _load(name) for name in NUMERIC_COLUMNS}
+    strings = {
+        name: StringColumn(_load(f"{name}.offsets"), _load(f"{name}.data"), _load(f"{name}.null"))
+        for name in STRING_COLUMNS
+    }
+    index = GridIndex.load(directory, numeric["lat"], numeric["lon"])
+    return BuildingColumns(n=int(meta["rows"]), numeric=numeric, strings=strings, index=index)
+
+
+def main() -> None:
+    # loaders가 이 모듈을 import하므로 여기서만 지연 import
+    from core.data_access.loaders import read_buildings_source
+
+    parser = argparse.ArgumentParser(description="Write the buildings table as a memory-mapped columnar store.")
+    parser.add_argument("--out", type=Path, default=default_columns_dir())
+    args = parser.parse_args()
+    n = write_building_columns(read_buildings_source(), args.out)
+    print(f"wrote {n} buildings -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
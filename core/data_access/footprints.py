@@ -0,0 +1,175 @@
+"""Local building footprint store (SQLite + R*Tree).
+
+VWorld WFS를 매번 호출하지 않도록 건물 폴리곤을 `data/cache/footprints.sqlite`에
+저장합니다 (실행 중에 쓰이므로 git이 추적하지 않는 캐시 디렉터리). 폴리곤 외곽선은
+(lon, lat) float64 쌍을 이어 붙인 BLOB으로, bbox는 R*Tree로 인덱싱합니다. 조회는 점을 포함하는 폴리곤 중 가장 작은 것을 돌려줍니다.
+
+- `RooftopService.estimate_area`가 먼저 여기서 찾고, 없을 때만 WFS를 호출한 뒤
+  결과를 다시 저장합니다(write-through).
+- 미리 채워 두면 네트워크 없이도 동작합니다.
+
+GeoJSON에서 채우기:
+    python -m core.data_access.footprints buildings.geojson [...] [--db PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from core.config import settings
+from core.utils.geojson_stream import iter_features
+from core.utils.geometry import extract_polygons, point_in_polygon, polygon_area_m2
+
+Polygon = list[tuple[float, float]]
+
+# R*Tree는 좌표를 float32로 저장하므로 bbox 경계에 여유를 둠
+_BBOX_EPS_DEG = 1e-5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS footprints (
+    id INTEGER PRIMARY KEY,
+    coords BLOB NOT NULL,
+    area_m2 REAL,
+    source TEXT,
+    fetched_at REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS footprints_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+"""
+
+_LOOKUP = """
+    SELECT f.coords, f.area_m2
+    FROM footprints_rtree r JOIN footprints f ON f.id = r.id
+    WHERE r.min_lat <= ? AND r.max_lat >= ? AND r.min_lon <= ? AND r.max_lon >= ?
+"""
+
+
+def default_footprints_path() -> Path:
+    return Path(settings.data_dir) / "cache" / "footprints.sqlite"
+
+
+def pack_polygon(polygon: Sequence[tuple[float, float]]) -> bytes:
+    return np.asarray(polygon, dtype="<f8").reshape(-1, 2).tobytes()
+
+
+def unpack_polygon(blob: bytes) -> Polygon:
+    arr = np.frombuffer(blob, dtype="<f8").reshape(-1, 2)
+    return [(float(x), float(y)) for x, y in arr]
+
+
+class FootprintStore:
+    """Point-in-polygon lookups over stored building footprints.
+
+    커넥션은 스레드별로 하나씩 엽니다. WAL 모드라 여러 프로세스가 동시에 읽고
+    쓰는 동안에도 리더가 막히지 않습니다. 파일이 아직 없으면 조회는 항상 miss이고,
+    첫 저장 때 파일을 만듭니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, lat: float, lon: float) -> Polygon | None:
+        """Smallest stored footprint containing (lat, lon), as (lon, lat) pairs."""
+        if getattr(self._local, "conn", None) is None and not self.path.exists():
+            return None
+        rows = self._conn().execute(
+            _LOOKUP,
+            (lat + _BBOX_EPS_DEG, lat - _BBOX_EPS_DEG, lon + _BBOX_EPS_DEG, lon - _BBOX_EPS_DEG),
+        ).fetchall()
+
+        best: Polygon | None = None
+        best_area = float("inf")
+        for blob, area in rows:
+            poly = unpack_polygon(blob)
+            area = float("inf") if area is None else area
+            if area < best_area and point_in_polygon((lon, lat), poly):
+                best, best_area = poly, area
+        return best
+
+    def add(self, polygon: Sequence[tuple[float, float]], *, source: str = "vworld") -> bool:
+        """Store one footprint; returns False if it is degenerate or already stored."""
+        return self.add_many([polygon], source=source) == 1
+
+    def add_many(self, polygons: Iterable[Sequence[tuple[float, float]]], *, source: str = "vworld") -> int:
+        """Store footprints in one transaction; returns how many were new."""
+        conn = self._conn()
+        now = time.time()
+        added = 0
+        with conn:
+            for polygon in polygons:
+                if len(polygon) < 3:
+                    continue
+                blob = pack_polygon(polygon)
+                arr = np.frombuffer(blob, dtype="<f8").reshape(-1, 2)
+                min_lon, min_lat = arr.min(axis=0)
+                max_lon, max_lat = arr.max(axis=0)
+                bbox = (float(min_lat), float(max_lat), float(min_lon), float(max_lon))
+                # 같은 bbox 안에 동일한 좌표열이 있으면 중복
+                dup = conn.execute(
+                    _LOOKUP + " AND f.coords = ?",
+                    (bbox[1], bbox[0], bbox[3], bbox[2], blob),
+                ).fetchone()
+                if dup:
+                    continue
+                cur = conn.execute(
+                    "INSERT INTO footprints (coords, area_m2, source, fetched_at) VALUES (?, ?, ?, ?)",
+                    (blob, float(polygon_area_m2(polygon)), source, now),
+                )
+                conn.execute("INSERT INTO footprints_rtree VALUES (?, ?, ?, ?, ?)", (cur.lastrowid, *bbox))
+                added += 1
+        return added
+
+    def __len__(self) -> int:
+        if getattr(self._local, "conn", None) is None and not self.path.exists():
+            return 0
+        return int(self._conn().execute("SELECT COUNT(*) FROM footprints").fetchone()[0])
+
+
+@lru_cache(maxsize=1)
+def default_footprint_store() -> FootprintStore:
+    return FootprintStore(default_footprints_path())
+
+
+def _iter_file_polygons(path: Path) -> Iterable[Polygon]:
+    def _chunks():
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                yield chunk
+
+    for feature in iter_features(_chunks()):
+        yield from extract_polygons(feature.get("geometry") or {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load building footprints from GeoJSON into the local store.")
+    parser.add_argument("sources", type=Path, nargs="+", help="GeoJSON FeatureCollection files (EPSG:4326)")
+    parser.add_argument("--db", type=Path, default=default_footprints_path())
+    parser.add_argument("--source", default="import")
+    args = parser.parse_args()
+
+    store = FootprintStore(args.db)
+    for path in args.sources:
+        n = store.add_many(_iter_file_polygons(path), source=args.source)
+        print(f"{path}: {n} new footprints")
+    print(f"total {len(store)} footprints -> {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Persistent geocode cache (SQLite).
+
+같은 주소를 (표기가 달라도) 다시 입력하면 Kakao/VWorld를 호출하지 않도록 `(provider, 주소 키)`별
+결과를 `data/cache/geocode.sqlite`에 저장합니다. 파일 하나를 WAL 모드로 열기 때문에
+재시작 후에도 유지되고 같은 호스트의 모든 세션/프로세스가 공유합니다.
+
+- TTL이 지난 항목은 miss로 취급하고 다음 저장 때 덮어씁니다.
+- 항목 수가 max_entries를 넘으면 가장 오래 조회되지 않은 것부터 지웁니다 (LRU).
+  조회 시각은 `touch_interval_s`보다 오래됐을 때만 갱신하므로 대부분의 조회는 읽기만 합니다.
+- hit/miss 수는 메모리에서 세고 다음 저장 트랜잭션 때 DB에 더해 `stats()`로 볼 수 있습니다.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from core.config import settings
+from core.models import LocationResult
+from core.utils.address import canonicalize_address
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    provider TEXT NOT NULL,
+    key TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (provider, key)
+);
+CREATE INDEX IF NOT EXISTS geocode_cache_accessed ON geocode_cache (accessed_at);
+CREATE TABLE IF NOT EXISTS geocode_cache_stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def default_geocode_cache_path() -> Path:
+    return Path(settings.data_dir) / "cache" / "geocode.sqlite"
+
+
+def address_key(address: str) -> str:
+    """Cache key for an address (see `canonicalize_address`)."""
+    return canonicalize_address(address)
+
+
+class GeocodeCache:
+    """(provider, address key) -> LocationResult with TTL and LRU bound."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_s: float | None = None,
+        max_entries: int | None = None,
+        touch_interval_s: float | None = None,
+    ):
+        self.path = Path(path)
+        self.ttl_s = settings.geocode_cache_ttl_s if ttl_s is None else ttl_s
+        self.max_entries = settings.geocode_cache_max_entries if max_entries is None else max_entries
+        self.touch_interval_s = settings.cache_touch_interval_s if touch_interval_s is None else touch_interval_s
+        self._local = threading.local()
+        # 아직 DB에 더하지 않은 hit/miss 수
+        self._pending = {"hits": 0, "misses": 0}
+        self._pending_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str) -> None:
+        with self._pending_lock:
+            self._pending[name] += 1
+
+    def _flush_counts(self, conn: sqlite3.Connection) -> None:
+        # 호출 측 쓰기 트랜잭션 안에서 실행
+        with self._pending_lock:
+            pending, self._pending = self._pending, {"hits": 0, "misses": 0}
+        conn.executemany(
+            "INSERT INTO geocode_cache_stats VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [(name, n) for name, n in pending.items() if n],
+        )
+
+    def get(self, provider: str, key: str, *, allow_stale: bool = False) -> LocationResult | None:
+        """Cached result, or None; allow_stale ignores the TTL (provider outage fallback)."""
+        conn = self._conn()
+        now = time.time()
+        row = conn.execute(
+            "SELECT result, created_at, accessed_at FROM geocode_cache WHERE provider = ? AND key = ?", (provider, key)
+        ).fetchone()
+        if row is None or (not allow_stale and now - row[1] > self.ttl_s):
+            self._count("misses")
+            return None
+        if now - row[2] >= self.touch_interval_s:
+            with conn:
+                conn.execute(
+                    "UPDATE geocode_cache SET accessed_at = ? WHERE provider = ? AND key = ?", (now, provider, key)
+                )
+        self._count("hits")
+        return LocationResult.model_validate_json(row[0])
+
+    def put(self, provider: str, key: str, result: LocationResult) -> None:
+        conn = self._conn()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache VALUES (?, ?, ?, ?, ?)",
+                (provider, key, result.model_dump_json(), now, now),
+            )
+            self._flush_counts(conn)
+            excess = conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM geocode_cache WHERE rowid IN "
+                    "(SELECT rowid FROM geocode_cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                conn.execute(
+                    "INSERT INTO geocode_cache_stats VALUES ('evictions', ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                    (excess,),
+                )
+
+    def stats(self) -> dict[str, int]:
+        conn = self._conn()
+        out = {"hits": 0, "misses": 0, "evictions": 0}
+        out.update(dict(conn.execute("SELECT name, value FROM geocode_cache_stats").fetchall()))
+        with self._pending_lock:
+            for name, n in self._pending.items():
+                out[name] += n
+        out["entries"] = conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()[0]
+        return out
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM geocode_cache")
+            conn.execute("DELETE FROM geocode_cache_stats")
+        with self._pending_lock:
+            self._pending = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=1)
+def default_geocode_cache() -> GeocodeCache:
+    return GeocodeCache(default_geocode_cache_path())
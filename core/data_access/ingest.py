@@ -0,0 +1,230 @@
+"""Raw building extracts -> processed/buildings.parquet.
+
+`data/raw/`의 공공데이터포털 원본(CSV 또는 GeoJSON)을 청크 단위로 스트리밍하면서
+`load_buildings_table` 컬럼 계약(building_id, name, address, lat, lon, roof_area_m2)으로
+정규화합니다. 청크는 공간 타일별 임시 파일로 흘려보낸 뒤 타일 순서대로 다시 읽어
+Parquet row group으로 쓰므로, 메모리 사용량은 입력 크기가 아니라 청크/타일 크기로
+제한됩니다.
+
+사용:
+    python -m core.data_access.ingest data/raw/buildings.csv [more.geojson ...] \\
+        [--out data/processed/buildings.parquet] [--encoding cp949] [--chunk-rows 100000]
+
+- CSV 컬럼은 영문/한글 별칭(예: 위도/경도, 건물명, 도로명주소, 건축면적)을 인식합니다.
+- GeoJSON은 EPSG:4326(lon/lat) 폴리곤을 가정하고, 중심점과 폴리곤 면적으로
+  lat/lon/roof_area_m2를 계산합니다 (속성에 면적이 있으면 그 값을 우선).
+- 대한민국 범위를 벗어나거나 좌표가 없는 행은 제외하고 개수만 보고합니다.
+"""
+from __future__ import annotations
+
+import argparse
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.config import settings
+from core.data_access.schema import BUILDING_COLUMNS
+from core.utils.geojson_stream import iter_features
+from core.utils.geometry import polygon_area_m2
+
+# 출력 Parquet 스키마: core.data_access.schema와 같은 float32 좌표/면적, 문자열은 dictionary 인코딩
+PARQUET_SCHEMA = pa.schema(
+    [
+        ("building_id", pa.string()),
+        ("name", pa.string()),
+        ("address", pa.string()),
+        ("lat", pa.float32()),
+        ("lon", pa.float32()),
+        ("roof_area_m2", pa.float32()),
+    ]
+)
+
+# 원본 컬럼명 별칭 (소문자 비교, 앞쪽 우선)
+COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "building_id": ("building_id", "bld_id", "bd_mgt_sn", "건물관리번호", "관리건물번호", "mgm_bldrgst_pk", "pnu"),
+    "name": ("name", "bld_nm", "buld_nm", "bd_nm", "건물명"),
+    "address": ("address", "road_addr", "new_plat_plc", "도로명주소", "도로명대지위치", "plat_plc", "대지위치", "지번주소"),
+    "lat": ("lat", "latitude", "위도", "y"),
+    "lon": ("lon", "lng", "longitude", "경도", "x"),
+    "roof_area_m2": ("roof_area_m2", "arch_area", "archarea", "bldg_area", "건축면적", "건축면적(㎡)"),
+}
+
+KOREA_LAT = (33.0, 39.5)
+KOREA_LON = (124.0, 132.5)
+
+
+def default_output_path() -> Path:
+    return Path(settings.data_dir) / "processed" / "buildings.parquet"
+
+
+def normalize_columns(df: pd.DataFrame, *, id_prefix: str, row_offset: int) -> pd.DataFrame:
+    """Map raw column names onto BUILDING_COLUMNS and coerce types."""
+    lower = {str(c).strip().lower(): c for c in df.columns}
+    out = pd.DataFrame(index=df.index)
+    for col, aliases in COLUMN_ALIASES.items():
+        src = next((lower[a] for a in aliases if a in lower), None)
+        out[col] = df[src] if src is not None else None
+
+    # id가 빠진 행만 "<파일>-<행 번호>"로 채움 (일부 행만 비어도 "nan"/"None" id가 생기지 않게)
+    ids = out["building_id"].astype(object).map(lambda v: None if pd.isna(v) else (str(v).strip() or None))
+    generated = pd.Series([f"{id_prefix}-{row_offset + i + 1}" for i in range(len(out))], index=out.index)
+    out["building_id"] = ids.where(ids.notna(), generated).astype(str)
+    for col in ("name", "address"):
+        out[col] = out[col].astype(object).map(lambda v: None if pd.isna(v) else (str(v).strip() or None))
+    for col in ("lat", "lon", "roof_area_m2"):
+        out[col] = pd.to_numeric(out[col], errors="coerce")
+    return out[BUILDING_COLUMNS]
+
+
+def _feature_row(feature: dict) -> dict:
+    props = dict(feature.get("properties") or {})
+    geom = feature.get("geometry") or {}
+    coords = geom.get("coordinates") or []
+    if geom.get("type") == "Polygon":
+        rings = [coords[0]] if coords else []
+    elif geom.get("type") == "MultiPolygon":
+        rings = [p[0] for p in coords if p]
+    elif geom.get("type") == "Point" and coords:
+        props.setdefault("lon", coords[0])
+        props.setdefault("lat", coords[1])
+        rings = []
+    else:
+        rings = []
+
+    if rings:
+        # 가장 큰 외곽 링 기준 중심점(정점 평균), 면적은 모든 외곽 링 합
+        pts = [[(float(x), float(y)) for x, y, *_ in ring] for ring in rings]
+        areas = [polygon_area_m2(p) for p in pts]
+        main = pts[int(np.argmax(areas))]
+        if len(main) > 1 and main[0] == main[-1]:
+            main = main[:-1]
+        props.setdefault("lon", sum(x for x, _ in main) / len(main))
+        props.setdefault("lat", sum(y for _, y in main) / len(main))
+        props["_footprint_area_m2"] = sum(areas)
+    return props
+
+
+def _iter_geojson_chunks(path: Path, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    def _file_chunks():
+        with open(path, "rb") as f:
+            while True:
+                b = f.read(1 << 20)
+                if not b:
+                    return
+                yield b
+
+    rows: list[dict] = []
+    for feature in iter_features(_file_chunks()):
+        rows.append(_feature_row(feature))
+        if len(rows) >= chunk_rows:
+            yield pd.DataFrame(rows)
+            rows = []
+    if rows:
+        yield pd.DataFrame(rows)
+
+
+def iter_raw_chunks(path: Path, *, chunk_rows: int, encoding: str) -> Iterator[pd.DataFrame]:
+    """Normalized chunks of one raw file (CSV or GeoJSON)."""
+    path = Path(path)
+    if path.suffix.lower() in (".geojson", ".json"):
+        raw_chunks = _iter_geojson_chunks(path, chunk_rows)
+    else:
+        raw_chunks = pd.read_csv(path, chunksize=chunk_rows, encoding=encoding, dtype=str, low_memory=True)
+
+    offset = 0
+    for raw in raw_chunks:
+        df = normalize_columns(raw, id_prefix=path.stem, row_offset=offset)
+        if "_footprint_area_m2" in raw.columns:
+            # 속성 면적이 없으면 폴리곤 면적으로 roof_area_m2 사전 계산
+            df["roof_area_m2"] = df["roof_area_m2"].fillna(pd.to_numeric(raw["_footprint_area_m2"], errors="coerce"))
+        offset += len(raw)
+        yield df
+
+
+@dataclass
+class IngestStats:
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_dropped: int = 0
+    tiles: int = 0
+
+
+def ingest_buildings(
+    sources: list[Path],
+    out_path: Path,
+    *,
+    chunk_rows: int = 100_000,
+    encoding: str = "utf-8",
+    tile_deg: float = 0.05,
+) -> IngestStats:
+    """Stream `sources` into a tile-sorted Parquet file at `out_path`."""
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    stats = IngestStats()
+    spill_dir = Path(tempfile.mkdtemp(prefix="okssang-ingest-"))
+    try:
+        # 1) 청크 -> 타일별 spill 파일 (pickle 스트림에 이어 쓰기)
+        for src in sources:
+            for df in iter_raw_chunks(src, chunk_rows=chunk_rows, encoding=encoding):
+                stats.rows_read += len(df)
+                ok = df["lat"].between(*KOREA_LAT) & df["lon"].between(*KOREA_LON)
+                stats.rows_dropped += int((~ok).sum())
+                df = df[ok]
+                ti = np.floor(df["lat"].to_numpy() / tile_deg).astype(np.int64)
+                tj = np.floor(df["lon"].to_numpy() / tile_deg).astype(np.int64)
+                for (i, j), part in df.groupby([ti, tj], sort=False):
+                    with open(spill_dir / f"{i}_{j}.pkl", "ab") as f:
+                        pickle.dump(part, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # 2) 타일 순서대로 읽어 row group 단위로 기록
+        tiles = sorted(
+            (tuple(int(v) for v in p.stem.split("_")), p) for p in spill_dir.glob("*.pkl")
+        )
+        tmp_out = out_path.with_suffix(out_path.suffix + ".tmp")
+        with pq.ParquetWriter(tmp_out, PARQUET_SCHEMA, compression="zstd") as writer:
+            for _, spill in tiles:
+                parts = []
+                with open(spill, "rb") as f:
+                    while True:
+                        try:
+                            parts.append(pickle.load(f))
+                        except EOFError:
+                            break
+                tile = pd.concat(parts, ignore_index=True).sort_values(["lat", "lon"], kind="stable")
+                writer.write_table(pa.Table.from_pandas(tile, schema=PARQUET_SCHEMA, preserve_index=False))
+                stats.rows_written += len(tile)
+                stats.tiles += 1
+        tmp_out.replace(out_path)
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build processed/buildings.parquet from raw CSV/GeoJSON extracts.")
+    parser.add_argument("sources", type=Path, nargs="+")
+    parser.add_argument("--out", type=Path, default=default_output_path())
+    parser.add_argument("--encoding", default="utf-8", help="CSV encoding (공공데이터포털 원본은 보통 cp949)")
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    parser.add_argument("--tile-deg", type=float, default=0.05)
+    args = parser.parse_args()
+
+    stats = ingest_buildings(
+        args.sources, args.out, chunk_rows=args.chunk_rows, encoding=args.encoding, tile_deg=args.tile_deg
+    )
+    print(
+        f"read {stats.rows_read} rows, wrote {stats.rows_written} in {stats.tiles} tiles, "
+        f"dropped {stats.rows_dropped} -> {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
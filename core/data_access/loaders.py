@@ -1,42 +1,156 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
+import threading
 import pandas as pd
 
 from core.config import settings
+from core.data_access.columnar import BuildingColumns, default_columns_dir, open_building_columns
+from core.data_access.partitioned import MANIFEST_NAME, PartitionedBuildings, default_partitions_dir
+from core.data_access.schema import BUILDING_COLUMNS, apply_buildings_schema
+from core.data_access.snapshots import SnapshotCache, file_signature
+from core.data_access.spatial_index import GridIndex
 
-@lru_cache(maxsize=8)
-def load_buildings_table() -> pd.DataFrame:
-    """Load processed building table.
+def _processed_dir() -> Path:
+    return Path(settings.data_dir) / "processed"
+
+
+def _read_raw_buildings_table() -> pd.DataFrame:
+    """Read the source building table (buildings.parquet, else the sample CSV).
 
     Expected columns (example):
     - building_id, name, address, lat, lon, roof_area_m2 (optional)
     """
-    path = Path(settings.data_dir) / "processed" / "buildings.parquet"
+    path = _processed_dir() / "buildings.parquet"
     if path.exists():
         return pd.read_parquet(path)
 
     # Fallback: small sample table for demo environments
-    sample_path = Path(settings.data_dir) / "processed" / "sample_buildings.csv"
+    sample_path = _processed_dir() / "sample_buildings.csv"
     if sample_path.exists():
         df = pd.read_csv(sample_path)
         # Ensure required columns exist
-        required_cols = ["building_id", "name", "address", "lat", "lon", "roof_area_m2"]
-        for col in required_cols:
+        for col in BUILDING_COLUMNS:
             if col not in df.columns:
                 if col == "building_id":
                     df[col] = [f"sample-{i+1}" for i in range(len(df))]
                 else:
                     df[col] = None
-        return df[required_cols]
+        return df[BUILDING_COLUMNS]
 
     # MVP: empty table if not provided
-    return pd.DataFrame(columns=["building_id", "name", "address", "lat", "lon", "roof_area_m2"])
+    return pd.DataFrame(columns=BUILDING_COLUMNS)
 
-@lru_cache(maxsize=8)
-def load_lookup_table(name: str) -> pd.DataFrame:
+
+def read_buildings_source() -> pd.DataFrame:
+    """The source table the derived stores (columns, partitions) are built from."""
+    # 어느 경로로 읽었든 같은 compact dtype으로 맞춤 (core.data_access.schema)
+    return apply_buildings_schema(_read_raw_buildings_table())
+
+
+@dataclass(frozen=True)
+class BuildingsData:
+    """One consistent snapshot of the building data used by proximity queries.
+
+    우선순위: mmap 컬럼 저장소 > 타일 파티션 > 전체 테이블(+격자 인덱스).
+    질의는 시작할 때 스냅샷 하나를 잡고 끝까지 그것만 사용합니다.
+    """
+
+    snapshot_id: str
+    columns: BuildingColumns | None = None
+    partitions: PartitionedBuildings | None = None
+    table: pd.DataFrame | None = None
+    index: GridIndex | None = None
+
+
+def _buildings_source_paths() -> list[Path]:
+    processed = _processed_dir()
+    return [
+        default_columns_dir() / "meta.json",
+        default_partitions_dir() / MANIFEST_NAME,
+        processed / "buildings.parquet",
+        processed / "sample_buildings.csv",
+    ]
+
+
+def _build_buildings_data(snapshot_id: str) -> BuildingsData:
+    columns_dir = default_columns_dir()
+    if (columns_dir / "meta.json").exists():
+        columns = open_building_columns(columns_dir)
+        return BuildingsData(snapshot_id=snapshot_id, columns=columns, index=columns.index)
+
+    partitions_dir = default_partitions_dir()
+    if (partitions_dir / MANIFEST_NAME).exists():
+        return BuildingsData(snapshot_id=snapshot_id, partitions=PartitionedBuildings(partitions_dir))
+
+    df = read_buildings_source()
+    index = GridIndex.build(df["lat"].to_numpy(), df["lon"].to_numpy(), cell_deg=settings.building_grid_cell_deg)
+    return BuildingsData(snapshot_id=snapshot_id, table=df, index=index)
+
+
+_buildings_cache: SnapshotCache[BuildingsData] = SnapshotCache(
+    _build_buildings_data,
+    lambda: file_signature(_buildings_source_paths()),
+    check_interval_s=settings.data_reload_interval_s,
+)
+
+
+def load_buildings_snapshot() -> BuildingsData:
+    """Current building data snapshot (reloaded in the background when files change)."""
+    return _buildings_cache.get().value
+
+
+# 컬럼 저장소/파티션 모드의 전체 테이블 (snapshot_id, table)
+_full_table: tuple[str, pd.DataFrame] | None = None
+_full_table_lock = threading.Lock()
+
+
+def load_buildings_table() -> pd.DataFrame:
+    """Full processed building table of the current snapshot.
+
+    스냅샷과 같은 소스(컬럼 저장소 > 타일 파티션 > 전체 테이블)에서 읽으므로 근접 검색과
+    전체 테이블이 항상 같은 데이터입니다. 컬럼 저장소/파티션 모드에서는 필요할 때만
+    읽고, 스냅샷 id로 캐시합니다.
+    """
+    global _full_table
+    data = load_buildings_snapshot()
+    if data.table is not None:
+        return data.table
+    with _full_table_lock:
+        if _full_table is None or _full_table[0] != data.snapshot_id:
+            _full_table = (data.snapshot_id, _snapshot_table(data))
+        return _full_table[1]
+
+
+def _snapshot_table(data: BuildingsData) -> pd.DataFrame:
+    if data.columns is not None:
+        return apply_buildings_schema(data.columns.to_frame())
+    if data.partitions is not None:
+        return apply_buildings_schema(data.partitions.read_all())
+    return read_buildings_source()
+
+
+_lookup_caches: dict[str, SnapshotCache[pd.DataFrame]] = {}
+_lookup_lock = threading.Lock()
+
+
+def _read_lookup_table(name: str) -> pd.DataFrame:
     path = Path(settings.data_dir) / "lookup" / f"{name}.csv"
     if not path.exists():
         return pd.DataFrame()
     return pd.read_csv(path)
+
+
+def load_lookup_table(name: str) -> pd.DataFrame:
+    with _lookup_lock:
+        cache = _lookup_caches.get(name)
+        if cache is None:
+            path = Path(settings.data_dir) / "lookup" / f"{name}.csv"
+            cache = SnapshotCache(
+                lambda _sig: _read_lookup_table(name),
+                lambda: file_signature([path]),
+                check_interval_s=settings.data_reload_interval_s,
+            )
+            _lookup_caches[name] = cache
+    return cache.get().value
@@ -0,0 +1,182 @@
+"""Tile-partitioned buildings dataset with bbox pushdown.
+
+`data/processed/buildings/` 아래에 공간 타일(기본 0.05° ≈ 5km)별 Parquet 파티션을 두고,
+`_manifest.json`에 파티션별 bbox/행 수 통계를 기록합니다. 질의 반경과 겹치는
+파티션만 읽으므로, 전국 단위로 데이터가 커져도 첫 질의 지연과 메모리가 질의 주변
+파티션 크기로 제한됩니다.
+
+레이아웃:
+    buildings/_manifest.json
+    buildings/tile=<i>_<j>/part-0.parquet   (컬럼 계약은 `load_buildings_table`과 동일)
+
+생성:
+    python -m core.data_access.partitioned [--out DIR] [--tile-deg 0.05]
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.schema import BUILDING_COLUMNS, apply_buildings_schema
+from core.data_access.spatial_index import METERS_PER_DEG_LAT, GridIndex
+
+MANIFEST_NAME = "_manifest.json"
+
+
+def default_partitions_dir() -> Path:
+    return Path(settings.data_dir) / "processed" / "buildings"
+
+
+def tile_key(i: int, j: int) -> str:
+    return f"tile={i}_{j}"
+
+
+def write_partitioned_buildings(df: pd.DataFrame, directory: Path, *, tile_deg: float = 0.05) -> dict:
+    """Split `df` into per-tile Parquet files and write the manifest.
+
+    좌표를 해석할 수 없는 행은 어느 타일에도 속하지 않으므로 제외합니다.
+    """
+    directory = Path(directory)
+    tmp = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    lat = pd.to_numeric(df["lat"], errors="coerce")
+    lon = pd.to_numeric(df["lon"], errors="coerce")
+    valid = lat.notna() & lon.notna()
+    table = df.loc[valid, BUILDING_COLUMNS].assign(lat=lat[valid], lon=lon[valid])
+    ti = np.floor(table["lat"].to_numpy() / tile_deg).astype(np.int64)
+    tj = np.floor(table["lon"].to_numpy() / tile_deg).astype(np.int64)
+
+    partitions = []
+    for (i, j), part in table.groupby([ti, tj], sort=True):
+        key = tile_key(int(i), int(j))
+        (tmp / key).mkdir()
+        part.to_parquet(tmp / key / "part-0.parquet", index=False)
+        partitions.append(
+            {
+                "key": key,
+                "rows": int(len(part)),
+                # 파티션별 bbox 통계 (predicate pushdown 용)
+                "min_lat": float(part["lat"].min()),
+                "max_lat": float(part["lat"].max()),
+                "min_lon": float(part["lon"].min()),
+                "max_lon": float(part["lon"].max()),
+            }
+        )
+
+    manifest = {"tile_deg": tile_deg, "columns": BUILDING_COLUMNS, "partitions": partitions}
+    (tmp / MANIFEST_NAME).write_text(json.dumps(manifest, ensure_ascii=False, indent=1))
+
+    old = directory.with_name(directory.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if directory.exists():
+        directory.rename(old)
+    tmp.rename(directory)
+    shutil.rmtree(old, ignore_errors=True)
+    return manifest
+
+
+@dataclass(frozen=True)
+class _Partition:
+    table: pd.DataFrame
+    index: GridIndex
+
+
+class PartitionedBuildings:
+    """Reads only the partitions whose bbox intersects the query.
+
+    읽어 들인 파티션은 최근 사용 순으로 `max_cached_partitions`개까지만 유지합니다.
+    """
+
+    def __init__(self, directory: Path, *, max_cached_partitions: int = 64):
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST_NAME).read_text())
+        self.tile_deg = float(manifest["tile_deg"])
+        stats = manifest["partitions"]
+        self._keys = [p["key"] for p in stats]
+        self._bbox = np.array(
+            [(p["min_lat"], p["max_lat"], p["min_lon"], p["max_lon"]) for p in stats], dtype=np.float64
+        ).reshape(-1, 4)
+        self._max_cached = max_cached_partitions
+        self._cache: OrderedDict[str, _Partition] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def partitions_for_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> list[str]:
+        b = self._bbox
+        hit = (b[:, 0] <= max_lat) & (b[:, 1] >= min_lat) & (b[:, 2] <= max_lon) & (b[:, 3] >= min_lon)
+        return [self._keys[k] for k in np.flatnonzero(hit)]
+
+    def load_partition(self, key: str) -> _Partition:
+        with self._lock:
+            part = self._cache.get(key)
+            if part is not None:
+                self._cache.move_to_end(key)
+                return part
+
+        table = apply_buildings_schema(pd.read_parquet(self.directory / key / "part-0.parquet"))
+        part = _Partition(
+            table=table,
+            index=GridIndex.build(table["lat"].to_numpy(), table["lon"].to_numpy(), cell_deg=settings.building_grid_cell_deg),
+        )
+        with self._lock:
+            self._cache[key] = part
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return part
+
+    def read_all(self) -> pd.DataFrame:
+        """Every partition concatenated (uncached; for callers that need the full table)."""
+        parts = [pd.read_parquet(self.directory / key / "part-0.parquet") for key in self._keys]
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=BUILDING_COLUMNS)
+
+    def _query(self, lat: float, lon: float, radius_m: float, limit: int) -> tuple[list[dict], list[float]]:
+        dlat = radius_m / METERS_PER_DEG_LAT
+        dlon = radius_m / max(METERS_PER_DEG_LAT * math.cos(math.radians(lat)), 1e-6)
+        hits = []
+        for key in self.partitions_for_bbox(lat - dlat, lon - dlon, lat + dlat, lon + dlon):
+            part = self.load_partition(key)
+            rows, dist = part.index.query(lat, lon, radius_m, limit)
+            hits.extend((float(d), key, int(r)) for r, d in zip(rows, dist))
+
+        best = heapq.nsmallest(limit, hits)
+        records = [self.load_partition(key).table.iloc[r].to_dict() for _, key, r in best]
+        return records, [d for d, _, _ in best]
+
+    def find_nearest(
+        self, lat: float, lon: float, radius_m: float, limit: int, *, max_radius_m: float | None = None
+    ) -> tuple[list[dict], list[float]]:
+        """(records, distances_m) nearest first; widens by doubling up to max_radius_m."""
+        r = radius_m
+        while True:
+            records, dist = self._query(lat, lon, r, limit)
+            if records or max_radius_m is None or r >= max_radius_m:
+                return records, dist
+            r = min(r * 2, max_radius_m)
+
+
+def main() -> None:
+    # loaders가 이 모듈을 import하므로 여기서만 지연 import
+    from core.data_access.loaders import read_buildings_source
+
+    parser = argparse.ArgumentParser(description="Write the buildings table as tile partitions with bbox stats.")
+    parser.add_argument("--out", type=Path, default=default_partitions_dir())
+    parser.add_argument("--tile-deg", type=float, default=0.05)
+    args = parser.parse_args()
+    manifest = write_partitioned_buildings(read_buildings_source(), args.out, tile_deg=args.tile_deg)
+    print(f"wrote {len(manifest['partitions'])} partitions -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,122 @@
 from __future__ import annotations
 
+from typing import Iterable
+
+import numpy as np
 import pandas as pd
 
-from core.data_access.loaders import load_buildings_table
+from core.config import settings
+from core.data_access.loaders import load_buildings_snapshot
+from core.data_access.sqlite_repository import default_sqlite_repository
 from core.models import BuildingCandidate
-from core.utils.geometry import haversine_m
 
-def find_nearby_buildings(lat: float, lon: float, radius_m: float = 150.0, limit: int = 5) -> list[BuildingCandidate]:
-    df: pd.DataFrame = load_buildings_table()
-    if df.empty:
-        return []
 
-    # 매우 단순한 거리 계산 (MVP)
-    candidates = []
-    for _, row in df.iterrows():
-        try:
-            d = haversine_m(lat, lon, float(row["lat"]), float(row["lon"]))
-        except Exception:
-            continue
-        if d <= radius_m:
-            candidates.append((d, row))
-
-    candidates.sort(key=lambda x: x[0])
-    out: list[BuildingCandidate] = []
-    for d, row in candidates[:limit]:
-        out.append(
-            BuildingCandidate(
-                building_id=str(row.get("building_id")),
-                name=row.get("name"),
-                address=row.get("address"),
-                distance_m=float(d),
-                extra={"roof_area_m2": row.get("roof_area_m2")},
-            )
+def _clean(v):
+    if v is None or (pd.api.types.is_scalar(v) and pd.isna(v)):
+        return None
+    return v
+
+
+_RECORD_COLUMNS = ("building_id", "name", "address", "roof_area_m2")
+
+
+def _frame_records(df: pd.DataFrame, idx: np.ndarray) -> list[dict]:
+    sub = df.iloc[idx]
+    # 컬럼 단위로 결측 -> None 변환 후 행 dict로 묶음 (행마다 isna 호출 X)
+    values = [[_clean(v) for v in sub[c].tolist()] if sub[c].hasnans else sub[c].tolist() for c in _RECORD_COLUMNS]
+    return [dict(zip(_RECORD_COLUMNS, row)) for row in zip(*values)]
+
+
+def _to_candidate(rec: dict, distance_m: float) -> BuildingCandidate:
+    return BuildingCandidate(
+        building_id=str(rec.get("building_id")),
+        name=rec.get("name"),
+        address=rec.get("address"),
+        distance_m=float(distance_m),
+        extra={"roof_area_m2": rec.get("roof_area_m2")},
+    )
+
+
+def find_nearby_buildings(
+    lat: float,
+    lon: float,
+    radius_m: float = 150.0,
+    limit: int = 5,
+    *,
+    max_radius_m: float | None = None,
+) -> list[BuildingCandidate]:
+    """Nearest buildings within radius_m, closest first.
+
+    max_radius_m를 주면 radius_m 안에 후보가 없을 때 격자 링 단위로 반경을 넓혀
+    max_radius_m까지 찾아봅니다.
+    settings.building_repository로 저장소(memory/sqlite)를 고릅니다.
+    """
+    if settings.building_repository == "sqlite":
+        return default_sqlite_repository().find_nearby_buildings(
+            lat, lon, radius_m, limit, max_radius_m=max_radius_m
         )
-    return out
+
+    # 질의 동안 스냅샷 하나만 사용 (핫 리로드 중에도 일관된 결과)
+    data = load_buildings_snapshot()
+
+    # 타일 파티션이 있으면 질의 반경과 겹치는 파티션만 읽음
+    if data.partitions is not None:
+        records, dist = data.partitions.find_nearest(lat, lon, radius_m, limit, max_radius_m=max_radius_m)
+        return [_to_candidate({k: _clean(v) for k, v in rec.items()}, d) for rec, d in zip(records, dist)]
+
+    # mmap 컬럼 저장소가 있으면 DataFrame을 아예 올리지 않음
+    if data.columns is None and data.table.empty:
+        return []
+
+    index = data.index
+    if max_radius_m is None:
+        idx, dist = index.query(lat, lon, radius_m, limit)
+    else:
+        idx, dist = index.query_expanding(lat, lon, radius_m, max_radius_m, limit)
+
+    records = data.columns.records(idx) if data.columns is not None else _frame_records(data.table, idx)
+    return [_to_candidate(rec, d) for rec, d in zip(records, dist)]
+
+
+def find_nearby_buildings_many(
+    points: Iterable[tuple[float, float]],
+    radius_m: float = 150.0,
+    limit: int = 5,
+    *,
+    max_radius_m: float | None = None,
+) -> list[list[BuildingCandidate]]:
+    """`find_nearby_buildings` for many (lat, lon) points; one result list per input, in order.
+
+    메모리/컬럼 저장소에서는 격자 인덱스로 한 번에 처리하고, 결과 행도 한 번에
+    가져옵니다. sqlite/파티션 저장소는 점마다 인덱스 질의를 반복합니다.
+    """
+    pts = np.asarray(list(points), dtype=np.float64).reshape(-1, 2)
+    if settings.building_repository == "sqlite":
+        repo = default_sqlite_repository()
+        return [repo.find_nearby_buildings(la, lo, radius_m, limit, max_radius_m=max_radius_m) for la, lo in pts]
+
+    data = load_buildings_snapshot()
+    if data.partitions is not None:
+        out = []
+        for la, lo in pts:
+            records, dist = data.partitions.find_nearest(la, lo, radius_m, limit, max_radius_m=max_radius_m)
+            out.append([_to_candidate({k: _clean(v) for k, v in rec.items()}, d) for rec, d in zip(records, dist)])
+        return out
+    if data.columns is None and data.table.empty:
+        return [[] for _ in range(len(pts))]
+
+    results = data.index.query_many(pts[:, 0], pts[:, 1], radius_m, limit)
+    if max_radius_m is not None and max_radius_m > radius_m:
+        for p, (rows, _) in enumerate(results):
+            if rows.size == 0:
+                results[p] = data.index.query_expanding(pts[p, 0], pts[p, 1], radius_m, max_radius_m, limit)
+
+    # 필요한 행을 한 번에 materialize
+    all_rows = np.unique(np.concatenate([rows for rows, _ in results] + [np.empty(0, dtype=np.int64)]))
+    records = data.columns.records(all_rows) if data.columns is not None else _frame_records(data.table, all_rows)
+    by_row = dict(zip(all_rows.tolist(), records))
+    return [[_to_candidate(by_row[r], d) for r, d in zip(rows.tolist(), dist)] for rows, dist in results]
+
 
 def get_roof_area_from_candidate(candidate: BuildingCandidate) -> float | None:
     v = candidate.extra.get("roof_area_m2") if candidate.extra else None
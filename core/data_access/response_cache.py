@@ -0,0 +1,211 @@
+"""Persistent, compressed cache of raw external HTTP responses (SQLite).
+
+WFS/지오코딩 응답 JSON은 크고 프로세스가 끝나면 사라지므로, 재시작/재배포 직후에
+같은 요청이 VWorld로 몰립니다. 여기서는 성공(200) 응답 본문을 zlib으로 압축해
+`data/cache/http.sqlite`에 저장합니다.
+
+- 항목마다 TTL(expires_at)을 두고, 만료된 항목은 miss로 취급합니다 (`allow_stale`로 무시 가능).
+- 압축된 본문 크기의 합이 max_bytes를 넘으면 가장 오래 조회되지 않은 것부터 지웁니다 (LRU).
+  합계는 stats 테이블의 `total_size` 행으로 저장/삭제 때마다 갱신하므로 매번 다시 더하지 않고,
+  조회 시각은 `touch_interval_s`보다 오래됐을 때만 갱신합니다.
+- hit/miss 수는 메모리에서 세고 다음 쓰기 트랜잭션 때 DB에 더합니다.
+- 색인과 본문이 같은 WAL 트랜잭션으로 기록되므로 도중에 죽어도 반쯤 쓰인 항목이 남지 않습니다.
+- 캐시 키에는 API 키(`key` 파라미터, 헤더)를 넣지 않습니다. 키를 바꿔도 캐시가 유지되고
+  파일에 키가 남지 않습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping
+
+from core.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    body BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS http_cache_accessed ON http_cache (accessed_at);
+CREATE TABLE IF NOT EXISTS http_cache_stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# 캐시 키에서 빼는 파라미터 (API 키)
+_SECRET_PARAMS = frozenset({"key", "apikey", "api_key"})
+
+
+def default_response_cache_path() -> Path:
+    return Path(settings.data_dir) / "cache" / "http.sqlite"
+
+
+def response_key(url: str, params: Mapping[str, object] | None = None) -> str:
+    """Stable key for a GET request: URL + sorted params, API keys excluded."""
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if str(k).lower() not in _SECRET_PARAMS)
+    raw = url + "?" + "&".join(f"{k}={v}" for k, v in items)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    content_type: str
+    body: bytes
+
+
+class ResponseCache:
+    """Response bodies keyed by request, zlib-compressed, TTL + total-byte LRU bound."""
+
+    def __init__(
+        self, path: Path, *, max_bytes: int | None = None, level: int = 6, touch_interval_s: float | None = None
+    ):
+        self.path = Path(path)
+        self.max_bytes = settings.http_cache_max_bytes if max_bytes is None else max_bytes
+        self.level = level
+        self.touch_interval_s = settings.cache_touch_interval_s if touch_interval_s is None else touch_interval_s
+        self._local = threading.local()
+        # 아직 DB에 더하지 않은 hit/miss 수
+        self._pending = {"hits": 0, "misses": 0}
+        self._pending_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            with conn:
+                # 크기 합계 행이 없는 기존 파일은 한 번만 다시 더함
+                conn.execute(
+                    "INSERT OR IGNORE INTO http_cache_stats SELECT 'total_size', COALESCE(SUM(size), 0) FROM http_cache"
+                )
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _add(conn: sqlite3.Connection, name: str, n: int) -> None:
+        conn.execute(
+            "INSERT INTO http_cache_stats VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, n),
+        )
+
+    def _flush_counts(self, conn: sqlite3.Connection) -> None:
+        # 호출 측 쓰기 트랜잭션 안에서 실행
+        with self._pending_lock:
+            pending, self._pending = self._pending, {"hits": 0, "misses": 0}
+        for name, n in pending.items():
+            if n:
+                self._add(conn, name, n)
+
+    def _count(self, name: str) -> None:
+        with self._pending_lock:
+            self._pending[name] += 1
+
+    def get(self, key: str, *, allow_stale: bool = False) -> CachedResponse | None:
+        conn = self._conn()
+        now = time.time()
+        row = conn.execute(
+            "SELECT status, content_type, body, expires_at, accessed_at FROM http_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or (not allow_stale and now >= row[3]):
+            self._count("misses")
+            return None
+        if now - row[4] >= self.touch_interval_s:
+            with conn:
+                conn.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        try:
+            body = zlib.decompress(row[2])
+        except zlib.error:
+            self.delete(key)
+            return None
+        return CachedResponse(status=row[0], content_type=row[1], body=body)
+
+    def put(self, key: str, *, status: int, content_type: str, body: bytes, ttl_s: float) -> None:
+        compressed = zlib.compress(body, self.level)
+        if len(compressed) > self.max_bytes:
+            return
+        conn = self._conn()
+        now = time.time()
+        with conn:
+            self._flush_counts(conn)
+            old = conn.execute("SELECT size FROM http_cache WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, status, content_type, compressed, len(body), len(compressed), now, now + ttl_s, now),
+            )
+            self._add(conn, "total_size", len(compressed) - (old[0] if old else 0))
+            total = conn.execute("SELECT value FROM http_cache_stats WHERE name = 'total_size'").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            # 만료된 것부터, 그다음 오래 조회되지 않은 것부터 예산 안으로 들어올 때까지
+            evicted = freed = 0
+            for rowid, size in conn.execute(
+                "SELECT rowid, size FROM http_cache WHERE key != ? ORDER BY expires_at > ?, accessed_at", (key, now)
+            ).fetchall():
+                if total - freed <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM http_cache WHERE rowid = ?", (rowid,))
+                freed += size
+                evicted += 1
+            if evicted:
+                self._add(conn, "evictions", evicted)
+                self._add(conn, "total_size", -freed)
+
+    def delete(self, key: str) -> None:
+        conn = self._conn()
+        with conn:
+            self._flush_counts(conn)
+            row = conn.execute("SELECT size FROM http_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+                self._add(conn, "total_size", -row[0])
+
+    def stats(self) -> dict[str, int]:
+        conn = self._conn()
+        out = {"hits": 0, "misses": 0, "evictions": 0}
+        out.update(
+            dict(
+                conn.execute(
+                    "SELECT name, value FROM http_cache_stats WHERE name IN ('hits', 'misses', 'evictions')"
+                ).fetchall()
+            )
+        )
+        with self._pending_lock:
+            for name, n in self._pending.items():
+                out[name] += n
+        entries, size, raw_size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM http_cache"
+        ).fetchone()
+        out.update(entries=entries, bytes=size, raw_bytes=raw_size)
+        return out
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM http_cache")
+            conn.execute("DELETE FROM http_cache_stats")
+            conn.execute("INSERT INTO http_cache_stats VALUES ('total_size', 0)")
+        with self._pending_lock:
+            self._pending = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=1)
+def default_response_cache() -> ResponseCache:
+    return ResponseCache(default_response_cache_path())
@@ -0,0 +1,77 @@
+"""Compact in-memory schema for the buildings table.
+
+`load_buildings_table`이 어떤 경로(Parquet/파티션/CSV)로 읽든 같은 dtype을 갖도록
+맞춥니다.
+
+- lat, lon: float32 (서울 부근 해상도 약 0.7m, 근접 검색에는 충분)
+- roof_area_m2: nullable Float32 (결측은 pd.NA)
+- building_id: pyarrow string (행마다 파이썬 객체를 만들지 않음)
+- name, address: 중복이 많으면 category(인터닝), 아니면 pyarrow string
+
+메모리 확인:
+    python -m core.data_access.schema
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+BUILDING_COLUMNS = ["building_id", "name", "address", "lat", "lon", "roof_area_m2"]
+
+COORD_DTYPE = np.float32
+AREA_DTYPE = pd.Float32Dtype()
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+# 고유값 비율이 이보다 낮으면 category로 인터닝
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _compact_strings(s: pd.Series) -> pd.Series:
+    s = s.astype(object).where(s.notna(), None)
+    n = len(s)
+    if n and s.nunique(dropna=True) / n < CATEGORY_MAX_UNIQUE_RATIO:
+        return s.astype(pd.CategoricalDtype())
+    return s.astype(STRING_DTYPE)
+
+
+def apply_buildings_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Return `df` restricted to BUILDING_COLUMNS with the compact dtypes.
+
+    없는 컬럼은 결측으로 채우고, 숫자로 바꿀 수 없는 좌표/면적은 결측이 됩니다.
+    """
+    out = pd.DataFrame(index=pd.RangeIndex(len(df)))
+    for col in BUILDING_COLUMNS:
+        src = df[col].reset_index(drop=True) if col in df.columns else pd.Series([None] * len(df), dtype=object)
+        if col in ("lat", "lon"):
+            out[col] = pd.to_numeric(src, errors="coerce").astype(COORD_DTYPE)
+        elif col == "roof_area_m2":
+            out[col] = pd.to_numeric(src, errors="coerce").astype(AREA_DTYPE)
+        elif col == "building_id":
+            out[col] = src.astype(object).where(src.notna(), None).astype(STRING_DTYPE)
+        else:
+            out[col] = _compact_strings(src)
+    return out
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-column dtype and deep memory usage (bytes), with a total row."""
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({"dtype": df.dtypes.astype(str), "bytes": usage})
+    report.loc["total"] = ["", int(usage.sum())]
+    report["mb"] = report["bytes"].astype(float) / (1024 * 1024)
+    return report
+
+
+def main() -> None:
+    # loaders가 이 모듈을 import하므로 여기서만 지연 import
+    from core.data_access.loaders import _read_raw_buildings_table
+
+    raw = _read_raw_buildings_table()
+    print(f"rows: {len(raw)}")
+    for label, df in (("as loaded", raw), ("compact schema", apply_buildings_schema(raw))):
+        print(f"\n[{label}]")
+        print(memory_report(df).to_string(float_format=lambda v: f"{v:.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Snapshot-based hot reload for cached data tables.
+
+`lru_cache`로 고정된 테이블은 데이터를 갱신하려면 재배포가 필요했습니다.
+`SnapshotCache`는 원본 파일 시그니처(mtime/size, 선택적으로 내용 해시)를 주기적으로
+확인하고, 바뀌면 새 값을 백그라운드 스레드에서 만든 뒤 참조 하나를 바꿔 끼웁니다.
+이미 이전 스냅샷을 잡고 있는 질의는 그 스냅샷으로 끝까지 실행되고, 교체 중에도
+다른 세션이 멈추지 않습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+def file_signature(paths: Iterable[Path], *, content_hash: bool = False) -> str:
+    """Stable id for the current state of `paths` (missing files included).
+
+    기본은 (경로, mtime_ns, size)로 판단하고, content_hash=True면 내용 SHA-1을 씁니다.
+    """
+    h = hashlib.sha1()
+    for p in paths:
+        p = Path(p)
+        h.update(str(p).encode())
+        try:
+            st = p.stat()
+        except OSError:
+            h.update(b"-")
+            continue
+        if content_hash and p.is_file():
+            with open(p, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+        else:
+            h.update(f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}".encode())
+    return h.hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class Snapshot(Generic[T]):
+    id: str
+    value: T
+    loaded_at: float
+
+
+class SnapshotCache(Generic[T]):
+    """Holds the current snapshot of a value derived from files on disk.
+
+    - 첫 `get()`은 동기로 만들고, 이후에는 check_interval_s마다 시그니처만 확인
+    - 시그니처가 바뀌면 백그라운드에서 build → 완료 시 원자적으로 교체
+    - build가 실패하면 이전 스냅샷을 유지 (다음 확인 때 재시도)
+    """
+
+    def __init__(
+        self,
+        build: Callable[[str], T],
+        signature: Callable[[], str],
+        *,
+        check_interval_s: float = 5.0,
+        background: bool = True,
+    ):
+        self._build = build
+        self._signature = signature
+        self.check_interval_s = check_interval_s
+        self.background = background
+        self._current: Snapshot[T] | None = None
+        self._lock = threading.Lock()
+        self._reloading: str | None = None
+        self._last_check = 0.0
+        self.last_error: BaseException | None = None
+
+    def _load(self, sig: str) -> Snapshot[T]:
+        return Snapshot(id=sig, value=self._build(sig), loaded_at=time.time())
+
+    def get(self) -> Snapshot[T]:
+        current = self._current
+        if current is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = self._load(self._signature())
+                    self._last_check = time.monotonic()
+                return self._current
+
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval_s:
+            self._last_check = now
+            self._maybe_reload(current)
+        return self._current
+
+    def _maybe_reload(self, current: Snapshot[T]) -> None:
+        sig = self._signature()
+        if sig == current.id:
+            return
+        with self._lock:
+            if self._reloading == sig:
+                return
+            self._reloading = sig
+        if self.background:
+            threading.Thread(target=self._reload, args=(sig,), name="snapshot-reload", daemon=True).start()
+        else:
+            self._reload(sig)
+
+    def _reload(self, sig: str) -> None:
+        try:
+            snap = self._load(sig)
+        except Exception as e:
+            self.last_error = e
+            snap = None
+        with self._lock:
+            if snap is not None:
+                self._current = snap
+            if self._reloading == sig:
+                self._reloading = None
+
+    def refresh(self) -> Snapshot[T]:
+        """Check the signature now and rebuild synchronously if it changed."""
+        current = self.get()
+        sig = self._signature()
+        if sig != current.id:
+            self._reload(sig)
+        self._last_check = time.monotonic()
+        return self._current
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current = None
+            self._reloading = None
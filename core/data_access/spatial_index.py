@@ -0,0 +1,256 @@
+"""Uniform lat/lon grid index for proximity queries.
+
+건물 테이블 로드 시 한 번 만들어 DataFrame 옆에 캐시해 두고,
+반경 질의는 주변 셀에 속한 행만 거리 계산합니다. 질의 비용은 도시 크기가 아니라
+질의 반경 안의 건물 수에 비례합니다.
+"""
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.utils.geometry import haversine_m_array
+
+METERS_PER_DEG_LAT = 111320.0
+
+# 셀 좌표 (i, j)를 int64 키 하나로 합치기 위한 오프셋/스트라이드
+_KEY_OFFSET = 1 << 20
+_KEY_STRIDE = 1 << 21
+
+
+def _meters_per_deg_lon(lat: float) -> float:
+    return max(METERS_PER_DEG_LAT * math.cos(math.radians(lat)), 1e-6)
+
+
+def nearest_within(dist: np.ndarray, radius_m: float, limit: int) -> np.ndarray:
+    """Positions of the `limit` smallest distances <= radius_m, nearest first.
+
+    전체 정렬 대신 argpartition으로 top-k만 고른 뒤 그 k개만 정렬합니다.
+    동일 거리는 원래 위치 순서를 유지합니다.
+    """
+    pos = np.flatnonzero(dist <= radius_m)
+    if pos.size == 0 or limit <= 0:
+        return pos[:0]
+    if pos.size > limit:
+        part = np.argpartition(dist[pos], limit - 1)[:limit]
+        pos = pos[part]
+    return pos[np.lexsort((pos, dist[pos]))]
+
+
+@dataclass(frozen=True)
+class GridIndex:
+    """Rows bucketed by (floor(lat / cell_deg), floor(lon / cell_deg)).
+
+    - lat, lon: 원본 행 순서의 좌표 (float32/float64 그대로 보관, 변환 불가 값은 NaN)
+    - order: 셀 키 기준으로 정렬된 행 번호
+    - keys: 비어있지 않은 셀 키 (오름차순)
+    - starts: keys[i] 셀의 행은 order[starts[i]:starts[i + 1]]
+    """
+
+    cell_deg: float
+    lat: np.ndarray
+    lon: np.ndarray
+    order: np.ndarray
+    keys: np.ndarray
+    starts: np.ndarray
+
+    @classmethod
+    def build(cls, lat: np.ndarray, lon: np.ndarray, cell_deg: float = 0.002) -> "GridIndex":
+        lat, lon = cls._coords(lat), cls._coords(lon)
+        valid = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        # 셀 번호는 질의와 같은 float64로 계산 (float32 나눗셈 반올림으로 셀이 어긋나지 않게)
+        cell_keys = cls._keys(
+            np.floor(lat[valid].astype(np.float64) / cell_deg).astype(np.int64),
+            np.floor(lon[valid].astype(np.float64) / cell_deg).astype(np.int64),
+        )
+        sort = np.argsort(cell_keys, kind="stable")
+        order = valid[sort]
+        sorted_keys = cell_keys[sort]
+        keys, first = np.unique(sorted_keys, return_index=True)
+        starts = np.append(first, sorted_keys.size).astype(np.int64)
+        return cls(cell_deg=cell_deg, lat=lat, lon=lon, order=order, keys=keys, starts=starts)
+
+    @staticmethod
+    def _coords(a) -> np.ndarray:
+        # compact schema의 float32는 복사 없이 유지, 그 외(nullable/object 등)는 float64로
+        if isinstance(a, np.ndarray) and a.dtype in (np.float32, np.float64):
+            return a
+        return np.asarray(pd.to_numeric(pd.Series(a), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan))
+
+    _ARRAYS = ("order", "keys", "starts")
+
+    def save(self, directory: Path) -> None:
+        """Write the bucket arrays as `grid_*.npy` (lat/lon are stored by the caller)."""
+        directory = Path(directory)
+        for name in self._ARRAYS:
+            np.save(directory / f"grid_{name}.npy", getattr(self, name))
+        (directory / "grid.json").write_text(json.dumps({"cell_deg": self.cell_deg}))
+
+    @classmethod
+    def load(cls, directory: Path, lat: np.ndarray, lon: np.ndarray, *, mmap: bool = True) -> "GridIndex":
+        directory = Path(directory)
+        meta = json.loads((directory / "grid.json").read_text())
+        mode = "r" if mmap else None
+        arrays = {name: np.load(directory / f"grid_{name}.npy", mmap_mode=mode) for name in cls._ARRAYS}
+        return cls(cell_deg=float(meta["cell_deg"]), lat=lat, lon=lon, **arrays)
+
+    @staticmethod
+    def _keys(i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        return (i + _KEY_OFFSET) * _KEY_STRIDE + (j + _KEY_OFFSET)
+
+    def __len__(self) -> int:
+        return int(self.lat.size)
+
+    def cell_of(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def rows_in_cells(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Row numbers of every building in the given cells."""
+        want = self._keys(np.asarray(i, dtype=np.int64), np.asarray(j, dtype=np.int64))
+        pos = np.searchsorted(self.keys, want)
+        hit = pos < self.keys.size
+        hit[hit] = self.keys[pos[hit]] == want[hit]
+        pos = pos[hit]
+        if pos.size == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([self.order[self.starts[p] : self.starts[p + 1]] for p in pos])
+
+    def _cover(self, lat: float, lon: float, radius_m: float) -> tuple[range, range]:
+        dlat = radius_m / METERS_PER_DEG_LAT
+        dlon = radius_m / _meters_per_deg_lon(lat)
+        c = self.cell_deg
+        return (
+            range(math.floor((lat - dlat) / c), math.floor((lat + dlat) / c) + 1),
+            range(math.floor((lon - dlon) / c), math.floor((lon + dlon) / c) + 1),
+        )
+
+    def _nearest(self, rows: np.ndarray, dist: np.ndarray, radius_m: float, limit: int):
+        # 행 번호 순으로 정렬해 두면 동일 거리일 때 원래 테이블 순서가 유지됨
+        sort = np.argsort(rows, kind="stable")
+        rows, dist = rows[sort], dist[sort]
+        pos = nearest_within(dist, radius_m, limit)
+        return rows[pos], dist[pos]
+
+    def _distances(self, rows: np.ndarray, lat: float, lon: float) -> np.ndarray:
+        return haversine_m_array(lat, lon, self.lat[rows], self.lon[rows])
+
+    def query(self, lat: float, lon: float, radius_m: float, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """(rows, distances_m) of the nearest `limit` rows within radius_m."""
+        ri, rj = self._cover(lat, lon, radius_m)
+        ii, jj = np.meshgrid(np.arange(ri.start, ri.stop), np.arange(rj.start, rj.stop), indexing="ij")
+        rows = self.rows_in_cells(ii.ravel(), jj.ravel())
+        return self._nearest(rows, self._distances(rows, lat, lon), radius_m, limit)
+
+    def query_many(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        radius_m: float,
+        limit: int,
+        *,
+        group_cells: int = 4,
+        batch: int = 256,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """`query` for many points at once, in input order.
+
+        점들을 group_cells x group_cells 셀 블록 단위로 묶어 블록 주변 행을 한 번만 모으고,
+        (점 x 행) 거리 행렬에서 점마다 top-k를 고릅니다. 거리 행렬 크기는 batch개 점
+        단위로 제한합니다.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        out: list[tuple[np.ndarray, np.ndarray]] = [(np.empty(0, dtype=np.int64), np.empty(0))] * lats.size
+        if lats.size == 0 or limit <= 0:
+            return out
+
+        g = self.cell_deg * group_cells
+        bi = np.floor(lats / g).astype(np.int64)
+        bj = np.floor(lons / g).astype(np.int64)
+        groups, inverse = np.unique(self._keys(bi, bj), return_inverse=True)
+        members = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[members], np.arange(groups.size + 1))
+
+        span_i = math.ceil(radius_m / (METERS_PER_DEG_LAT * self.cell_deg))
+        for k in range(groups.size):
+            pts = members[bounds[k] : bounds[k + 1]]
+            i0, j0 = int(bi[pts[0]]) * group_cells, int(bj[pts[0]]) * group_cells
+            # 블록 안에서 위도 절댓값이 가장 큰(경도 간격이 가장 좁은) 쪽 기준
+            far_lat = max(abs(i0 * self.cell_deg), abs((i0 + group_cells) * self.cell_deg))
+            span_j = math.ceil(radius_m / (_meters_per_deg_lon(far_lat) * self.cell_deg))
+            ii, jj = np.meshgrid(
+                np.arange(i0 - span_i, i0 + group_cells + span_i),
+                np.arange(j0 - span_j, j0 + group_cells + span_j),
+                indexing="ij",
+            )
+            rows = np.sort(self.rows_in_cells(ii.ravel(), jj.ravel()))
+            if rows.size == 0:
+                continue
+            row_lat, row_lon = self.lat[rows], self.lon[rows]
+            top = min(limit, rows.size)
+            for start in range(0, pts.size, batch):
+                chunk = pts[start : start + batch]
+                dist = haversine_m_array(lats[chunk, None], lons[chunk, None], row_lat, row_lon)
+                dist = np.where(dist <= radius_m, dist, np.inf)
+                if rows.size > top:
+                    part = np.argpartition(dist, top - 1, axis=1)[:, :top]
+                    # 행 번호 오름차순으로 맞춰야 동일 거리에서 원래 순서 유지
+                    part.sort(axis=1)
+                else:
+                    part = np.broadcast_to(np.arange(top), (chunk.size, top))
+                sub = np.take_along_axis(dist, part, axis=1)
+                order = np.argsort(sub, axis=1, kind="stable")
+                part = np.take_along_axis(part, order, axis=1)
+                sub = np.take_along_axis(sub, order, axis=1)
+                for p, cols, d in zip(chunk, part, sub):
+                    keep = np.isfinite(d)
+                    out[p] = (rows[cols[keep]], d[keep])
+        return out
+
+    def _ring(self, ci: int, cj: int, k: int) -> tuple[np.ndarray, np.ndarray]:
+        if k == 0:
+            return np.array([ci]), np.array([cj])
+        span = np.arange(-k, k + 1)
+        inner = np.arange(-k + 1, k)
+        di = np.concatenate([np.full(span.size, -k), np.full(span.size, k), inner, inner])
+        dj = np.concatenate([span, span, np.full(inner.size, -k), np.full(inner.size, k)])
+        return ci + di, cj + dj
+
+    def _ring_coverage_m(self, lat: float, lon: float, ci: int, cj: int, k: int) -> float:
+        """Radius of the disc around (lat, lon) fully inside rings 0..k."""
+        c = self.cell_deg
+        dlat = min(lat - (ci - k) * c, (ci + k + 1) * c - lat) * METERS_PER_DEG_LAT
+        dlon = min(lon - (cj - k) * c, (cj + k + 1) * c - lon) * _meters_per_deg_lon(lat)
+        # 위도 방향 경도 간격 변화 등 근사 오차 보정
+        return 0.995 * min(dlat, dlon)
+
+    def query_expanding(
+        self, lat: float, lon: float, radius_m: float, max_radius_m: float, limit: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Like `query`, but grows the search ring by ring up to max_radius_m.
+
+        radius_m 안에 아무것도 없으면 셀 링을 하나씩 추가하면서, 추가된 셀의 행만
+        거리 계산합니다. 처음으로 후보가 생긴 링에서 멈춥니다.
+        """
+        rows, dist = self.query(lat, lon, radius_m, limit)
+        if rows.size or max_radius_m <= radius_m or self.keys.size == 0:
+            return rows, dist
+
+        ci, cj = self.cell_of(lat, lon)
+        seen_rows: list[np.ndarray] = []
+        seen_dist: list[np.ndarray] = []
+        k = 0
+        while True:
+            ring_rows = self.rows_in_cells(*self._ring(ci, cj, k))
+            seen_rows.append(ring_rows)
+            seen_dist.append(self._distances(ring_rows, lat, lon))
+            covered = min(self._ring_coverage_m(lat, lon, ci, cj, k), max_radius_m)
+            if covered > radius_m:
+                rows, dist = self._nearest(np.concatenate(seen_rows), np.concatenate(seen_dist), covered, limit)
+                if rows.size or covered >= max_radius_m:
+                    return rows, dist
+            k += 1
@@ -0,0 +1,195 @@
+"""SQLite(R*Tree) backed building repository.
+
+건물 테이블 전체를 pandas로 올리지 않고 `data/processed/buildings.sqlite`에서
+bbox로 후보만 읽은 뒤 거리를 계산합니다. 여러 Streamlit 프로세스가 같은 파일을
+열면 OS 페이지 캐시를 공유하므로 레플리카당 메모리가 데이터 크기와 무관해집니다.
+
+DB 생성:
+    python -m core.data_access.sqlite_repository [--out PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.loaders import load_buildings_table
+from core.data_access.snapshots import file_signature
+from core.data_access.spatial_index import METERS_PER_DEG_LAT, nearest_within
+from core.models import BuildingCandidate
+from core.utils.geometry import haversine_m_array
+
+# R*Tree는 좌표를 float32로 저장하므로 bbox 경계에 여유를 둠
+_BBOX_EPS_DEG = 1e-5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buildings (
+    id INTEGER PRIMARY KEY,
+    building_id TEXT,
+    name TEXT,
+    address TEXT,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    roof_area_m2 REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS buildings_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+"""
+
+
+def default_db_path() -> Path:
+    return Path(settings.data_dir) / "processed" / "buildings.sqlite"
+
+
+def build_buildings_db(df: pd.DataFrame, path: Path, *, chunk_size: int = 50_000) -> int:
+    """(Re)create the SQLite building DB at `path` from a buildings table.
+
+    새 파일에 쓴 뒤 rename으로 교체하므로, 열려 있는 리더는 이전 파일을 계속 봅니다.
+    좌표를 해석할 수 없는 행은 건너뜁니다. 저장한 행 수를 반환합니다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    table = pd.DataFrame(
+        {
+            "id": np.arange(1, len(df) + 1),
+            "building_id": df["building_id"].astype(str),
+            "name": df["name"],
+            "address": df["address"],
+            "lat": pd.to_numeric(df["lat"], errors="coerce"),
+            "lon": pd.to_numeric(df["lon"], errors="coerce"),
+            "roof_area_m2": pd.to_numeric(df["roof_area_m2"], errors="coerce"),
+        }
+    ).dropna(subset=["lat", "lon"])
+    # sqlite에는 NaN 대신 NULL로 저장
+    table = table.astype(object).where(table.notna(), None)
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(_SCHEMA)
+        for start in range(0, len(table), chunk_size):
+            rows = list(table.iloc[start : start + chunk_size].itertuples(index=False, name=None))
+            conn.executemany("INSERT INTO buildings VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany(
+                "INSERT INTO buildings_rtree VALUES (?, ?, ?, ?, ?)",
+                [(r[0], r[4], r[4], r[5], r[5]) for r in rows],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    tmp.replace(path)
+    return len(table)
+
+
+class SqliteBuildingRepository:
+    """Proximity queries against a DB created by `build_buildings_db`.
+
+    커넥션은 스레드별로 하나씩 read-only로 엽니다 (Streamlit 스크립트 스레드 대응).
+    DB 파일이 교체되면(build_buildings_db의 rename) 다음 질의부터 새 파일로 다시 엽니다.
+    """
+
+    _QUERY = """
+        SELECT b.building_id, b.name, b.address, b.lat, b.lon, b.roof_area_m2
+        FROM buildings_rtree r JOIN buildings b ON b.id = r.id
+        WHERE r.min_lat <= ? AND r.max_lat >= ? AND r.min_lon <= ? AND r.max_lon >= ?
+        ORDER BY b.id
+    """
+
+    def __init__(self, path: Path, *, check_interval_s: float | None = None):
+        self.path = Path(path)
+        # mode=ro는 파일이 없으면 질의 시점에 OperationalError("unable to open")로만 실패함
+        if not self.path.exists():
+            raise FileNotFoundError(f"building DB not built: {self.path} (python -m core.data_access.sqlite_repository)")
+        self.check_interval_s = settings.data_reload_interval_s if check_interval_s is None else check_interval_s
+        self._local = threading.local()
+        self._snapshot_id: str | None = None
+        self._checked_at = 0.0
+
+    @property
+    def snapshot_id(self) -> str:
+        now = time.monotonic()
+        if self._snapshot_id is None or now - self._checked_at >= self.check_interval_s:
+            self._snapshot_id = file_signature([self.path])
+            self._checked_at = now
+        return self._snapshot_id
+
+    def _conn(self) -> sqlite3.Connection:
+        sig = self.snapshot_id
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.snapshot_id != sig:
+            conn.close()
+            conn = None
+        if conn is None:
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self._local.conn = conn
+            self._local.snapshot_id = sig
+        return conn
+
+    def _rows_in_radius(self, lat: float, lon: float, radius_m: float) -> list[tuple]:
+        dlat = radius_m / METERS_PER_DEG_LAT + _BBOX_EPS_DEG
+        dlon = radius_m / max(METERS_PER_DEG_LAT * math.cos(math.radians(lat)), 1e-6) + _BBOX_EPS_DEG
+        return self._conn().execute(self._QUERY, (lat + dlat, lat - dlat, lon + dlon, lon - dlon)).fetchall()
+
+    def find_nearby_buildings(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: float = 150.0,
+        limit: int = 5,
+        *,
+        max_radius_m: float | None = None,
+    ) -> list[BuildingCandidate]:
+        """Same contract as `repositories.find_nearby_buildings`.
+
+        max_radius_m가 주어지면 후보가 나올 때까지 반경을 두 배씩 넓힙니다.
+        """
+        r = radius_m
+        while True:
+            rows = self._rows_in_radius(lat, lon, r)
+            if rows:
+                coords = np.array([(row[3], row[4]) for row in rows], dtype=np.float64)
+                dist = haversine_m_array(lat, lon, coords[:, 0], coords[:, 1])
+                pos = nearest_within(dist, r, limit)
+                if pos.size:
+                    return [self._candidate(rows[p], float(dist[p])) for p in pos]
+            if max_radius_m is None or r >= max_radius_m:
+                return []
+            r = min(r * 2, max_radius_m)
+
+    @staticmethod
+    def _candidate(row: tuple, distance_m: float) -> BuildingCandidate:
+        building_id, name, address, _, _, roof_area_m2 = row
+        return BuildingCandidate(
+            building_id=str(building_id),
+            name=name,
+            address=address,
+            distance_m=distance_m,
+            extra={"roof_area_m2": roof_area_m2},
+        )
+
+
+@lru_cache(maxsize=1)
+def default_sqlite_repository() -> SqliteBuildingRepository:
+    return SqliteBuildingRepository(default_db_path())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the SQLite R*Tree building DB from the buildings table.")
+    parser.add_argument("--out", type=Path, default=default_db_path())
+    args = parser.parse_args()
+    n = build_buildings_db(load_buildings_table(), args.out)
+    print(f"wrote {n} buildings -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""In-process cache of VWorld WFS building polygons per fixed geographic tile.
+
+이웃한 건물들은 거의 같은 bbox로 WFS를 부르는데, 응답에서 폴리곤 하나만 쓰고 나머지는
+버리면 같은 지역을 반복해서 받게 됩니다. 여기서는 좌표를 고정 격자 타일
+(기본 0.002° ≈ 220m x 180m)로 양자화해 타일 전체의 폴리곤을 한 번 받아 두고, 같은
+타일 안의 다른 점은 네트워크 없이 점-폴리곤 판정으로 답합니다.
+
+- 점을 포함하는 건물은 그 점이 속한 타일의 bbox와 반드시 겹치므로 타일 하나로 충분합니다.
+- 포함하는 폴리곤이 없으면 `max_dist_m` 안에서 bbox가 가장 가까운 폴리곤을 씁니다
+  (이웃 타일은 보지 않음).
+- 건물이 없는 타일도 빈 목록으로 캐시합니다. 요청 실패는 캐시하지 않습니다.
+- 응답이 feature 상한(maxfeatures)에 닿은 타일은 폴리곤을 버리고 `truncated`로만 표시합니다.
+  그 타일의 점은 호출 측이 점 중심 조회로 답합니다.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+from core.config import settings
+from core.utils.geometry import point_in_polygon
+
+Polygon = list[tuple[float, float]]
+Tile = tuple[int, int]
+
+_M_PER_DEG = 111320.0
+
+
+@dataclass(frozen=True)
+class TileFeatures:
+    polygons: list[Polygon]
+    bboxes: np.ndarray  # (n, 4): min_lon, min_lat, max_lon, max_lat
+    truncated: bool = False  # 상한에 닿은 타일 (polygons는 비어 있음)
+
+    @classmethod
+    def from_polygons(cls, polygons: Sequence[Polygon]) -> "TileFeatures":
+        polygons = [p for p in polygons if len(p) >= 3]
+        bboxes = np.empty((len(polygons), 4), dtype=np.float64)
+        for i, poly in enumerate(polygons):
+            ring = np.asarray(poly, dtype=np.float64)
+            bboxes[i, :2] = ring.min(axis=0)
+            bboxes[i, 2:] = ring.max(axis=0)
+        return cls(polygons, bboxes)
+
+    @classmethod
+    def truncated_tile(cls) -> "TileFeatures":
+        return cls([], np.empty((0, 4), dtype=np.float64), truncated=True)
+
+    def polygon_at(self, lat: float, lon: float, *, max_dist_m: float) -> Optional[Polygon]:
+        """First polygon containing (lat, lon), else the nearest one within max_dist_m."""
+        if not self.polygons:
+            return None
+        b = self.bboxes
+        inside = (b[:, 0] <= lon) & (lon <= b[:, 2]) & (b[:, 1] <= lat) & (lat <= b[:, 3])
+        for i in np.flatnonzero(inside):
+            if point_in_polygon((lon, lat), self.polygons[i]):
+                return self.polygons[i]
+
+        # 점에서 bbox까지 거리(m, 평면 근사)
+        dx = np.maximum(np.maximum(b[:, 0] - lon, lon - b[:, 2]), 0.0) * _M_PER_DEG * math.cos(math.radians(lat))
+        dy = np.maximum(np.maximum(b[:, 1] - lat, lat - b[:, 3]), 0.0) * _M_PER_DEG
+        dist = np.hypot(dx, dy)
+        i = int(np.argmin(dist))
+        return self.polygons[i] if dist[i] <= max_dist_m else None
+
+
+class WfsTileCache:
+    def __init__(self, *, tile_deg: float = 0.002, max_tiles: int = 512, ttl_s: float = 24 * 3600):
+        self.tile_deg = float(tile_deg)
+        self.max_tiles = max_tiles
+        self.ttl_s = ttl_s
+        self._tiles: OrderedDict[Tile, tuple[float, TileFeatures]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def tile_of(self, lat: float, lon: float) -> Tile:
+        return (math.floor(lon / self.tile_deg), math.floor(lat / self.tile_deg))
+
+    def tile_bbox(self, tile: Tile) -> tuple[float, float, float, float]:
+        """(min_lon, min_lat, max_lon, max_lat) of a tile."""
+        x, y = tile
+        d = self.tile_deg
+        return (x * d, y * d, (x + 1) * d, (y + 1) * d)
+
+    def get(self, tile: Tile) -> Optional[TileFeatures]:
+        with self._lock:
+            entry = self._tiles.get(tile)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_s:
+                if entry is not None:
+                    del self._tiles[tile]
+                self.misses += 1
+                return None
+            self._tiles.move_to_end(tile)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, tile: Tile, polygons: Sequence[Polygon]) -> TileFeatures:
+        return self._store(tile, TileFeatures.from_polygons(polygons))
+
+    def mark_truncated(self, tile: Tile) -> TileFeatures:
+        """Remember that the tile is too dense for one request (no polygons are kept)."""
+        return self._store(tile, TileFeatures.truncated_tile())
+
+    def _store(self, tile: Tile, features: TileFeatures) -> TileFeatures:
+        with self._lock:
+            self._tiles[tile] = (time.monotonic(), features)
+            self._tiles.move_to_end(tile)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return features
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "tiles": len(self._tiles)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiles.clear()
+
+
+@lru_cache(maxsize=1)
+def default_wfs_tile_cache() -> WfsTileCache:
+    return WfsTileCache(
+        tile_deg=settings.wfs_tile_deg,
+        max_tiles=settings.wfs_tile_cache_max_tiles,
+        ttl_s=settings.wfs_tile_cache_ttl_s,
+    )
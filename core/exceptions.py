@@ -16,3 +16,19 @@ class RooftopAreaUnavailableError(OkssangimongError):
 
 class InvalidScenarioError(OkssangimongError):
     pass
+
+
+class ProviderUnavailableError(OkssangimongError):
+    """External provider is unhealthy or over quota; use a fallback."""
+
+
+class CircuitOpenError(ProviderUnavailableError):
+    pass
+
+
+class RateLimitedError(ProviderUnavailableError):
+    pass
+
+
+class DeadlineExceededError(ProviderUnavailableError):
+    """The caller's end-to-end budget ran out before the call could finish."""
@@ -17,6 +17,13 @@ class LocationResult(BaseModel):
     extra: dict[str, Any] = Field(default_factory=dict)
 
 
+class AddressSuggestion(BaseModel):
+    text: str
+    kind: Literal["address", "building"] = "address"
+    address: Optional[str] = None
+    point: Optional[GeoPoint] = None
+
+
 class BuildingCandidate(BaseModel):
     building_id: str
     name: Optional[str] = None
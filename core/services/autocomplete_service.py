@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import math
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.address_index import default_address_index
+from core.data_access.columnar import StringColumn
+from core.data_access.loaders import BuildingsData, load_buildings_snapshot
+from core.models import AddressSuggestion
+from core.utils.address import canonicalize_address
+from core.utils.hangul import jamo_bytes, to_jamo
+
+# 자모 3-gram. 한 글자(2~3자모) 이하 입력은 후보가 너무 많아 제안하지 않음
+_GRAM = 3
+# 이보다 긴 posting(흔한 gram)은 오타 보정 후보를 모을 때 쓰지 않고 포함 여부만 확인
+_MAX_FUZZY_POSTING = 20_000
+# 부분 문자열 확인은 짧은 항목부터 이 개수까지만 (짧은 입력의 지연 상한)
+_MAX_HITS = 256
+_MAX_POOL = 16 * _MAX_HITS
+
+
+def _search_key(text: str) -> str:
+    return to_jamo(canonicalize_address(text))
+
+
+def _query_keys(query: str) -> list[str]:
+    """Search keys for typed input, most literal first.
+
+    한 단어 입력은 시/도 약칭 확장("세종" -> "세종특별자치시") 때문에 "세종대로"를 놓치므로
+    표기 그대로의 키를 먼저 시도합니다.
+    """
+    key = _search_key(query)
+    raw = to_jamo(unicodedata.normalize("NFKC", query).strip().casefold())
+    if raw and raw != key and " " not in raw:
+        return [raw, key]
+    return [key]
+
+
+# 항목 종류 코드 (AddressSuggestion.kind)
+_KINDS = ("address", "building")
+
+
+def _gram_codes(codes: np.ndarray) -> np.ndarray:
+    return (codes[:-2].astype(np.int32) << 16) | (codes[1:-1].astype(np.int32) << 8) | codes[2:].astype(np.int32)
+
+
+def _codes(key: str) -> np.ndarray:
+    return np.frombuffer(jamo_bytes(key), dtype=np.uint8)
+
+
+def _packed(values: pd.Series) -> StringColumn:
+    return StringColumn(*StringColumn.encode(values))
+
+
+@dataclass(frozen=True)
+class AutocompleteIndex:
+    """Hangul jamo 3-gram inverted index over address / building-name entries.
+
+    입력이 항목 검색 키의 부분 문자열이면(자모 단위, 입력 중인 글자 포함) 모든 gram
+    posting의 교집합으로 찾고, 없으면 gram 겹침 수로 오타를 허용해 찾습니다.
+    순위: 앞부분 일치 > 토큰 시작 일치 > 중간 일치, 그다음 짧은 항목.
+    후보가 많으면 짧은 항목부터 `_MAX_HITS`개만 확인하므로 순위는 그 안에서 정합니다.
+
+    항목은 numpy 배열(문자열은 UTF-8 바이트 + 오프셋, 검색 키는 글자당 1바이트)로만 들고,
+    `AddressSuggestion`은 돌려주는 상위 항목에 대해서만 만듭니다.
+    """
+
+    n: int
+    texts: StringColumn
+    addresses: StringColumn
+    kinds: np.ndarray  # uint8, _KINDS의 위치
+    lat: np.ndarray  # float32, 없으면 NaN
+    lon: np.ndarray
+    key_data: np.ndarray  # 검색 키를 \0으로 이어 붙인 바이트
+    key_starts: np.ndarray
+    lengths: np.ndarray
+    grams: np.ndarray  # 정렬된 고유 gram 코드
+    offsets: np.ndarray  # grams[i]의 posting = postings[offsets[i]:offsets[i+1]]
+    postings: np.ndarray
+
+    @classmethod
+    def build(cls, suggestions: Iterable[AddressSuggestion]) -> "AutocompleteIndex":
+        rows = [
+            (s.text, _KINDS.index(s.kind), s.address, s.point.lat if s.point else np.nan, s.point.lon if s.point else np.nan)
+            for s in suggestions
+        ]
+        return cls.from_entries(pd.DataFrame(rows, columns=["text", "kind", "address", "lat", "lon"]))
+
+    @classmethod
+    def from_entries(cls, entries: pd.DataFrame) -> "AutocompleteIndex":
+        """Index rows of (text, kind, address, lat, lon); kind is a position in `_KINDS`."""
+        entries = entries[entries["text"].notna() & (entries["text"].astype(str) != "")]
+        entries = entries.drop_duplicates(["text", "address"]).reset_index(drop=True)
+        keys = [jamo_bytes(_search_key(t)) for t in entries["text"].tolist()]
+
+        # 모든 키를 구분자(\0)로 이어 붙여 gram 코드를 한 번에 계산
+        joined = np.frombuffer(b"\0".join(keys) + b"\0", dtype=np.uint8)
+        lengths = np.fromiter((len(k) + 1 for k in keys), dtype=np.int64, count=len(keys))
+        del keys
+        starts = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        owner = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+        if len(joined) >= _GRAM:
+            codes = _gram_codes(joined)
+            valid = (joined[:-2] != 0) & (joined[1:-1] != 0) & (joined[2:] != 0)
+            codes, owner = codes[valid], owner[: len(joined) - 2][valid]
+        else:
+            codes, owner = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+        order = np.lexsort((owner, codes))
+        codes, owner = codes[order], owner[order]
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (owner[1:] != owner[:-1])
+        codes, owner = codes[keep], owner[keep]
+        grams, gram_starts = np.unique(codes, return_index=True)
+        return cls(
+            n=len(entries),
+            texts=_packed(entries["text"].astype(str)),
+            addresses=_packed(entries["address"]),
+            kinds=entries["kind"].to_numpy(dtype=np.uint8),
+            lat=pd.to_numeric(entries["lat"], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan),
+            lon=pd.to_numeric(entries["lon"], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan),
+            key_data=joined,
+            key_starts=starts,
+            lengths=lengths - 1,
+            grams=grams,
+            offsets=np.append(gram_starts, len(codes)).astype(np.int64),
+            postings=owner,
+        )
+
+    def key(self, row: int) -> bytes:
+        start = int(self.key_starts[row])
+        return self.key_data[start : start + int(self.lengths[row])].tobytes()
+
+    def suggestion(self, row: int) -> AddressSuggestion:
+        lat, lon = float(self.lat[row]), float(self.lon[row])
+        point = None if math.isnan(lat) or math.isnan(lon) else {"lat": lat, "lon": lon}
+        return AddressSuggestion(
+            text=self.texts[row], kind=_KINDS[int(self.kinds[row])], address=self.addresses[row], point=point
+        )
+
+    def _posting(self, gram: int) -> np.ndarray:
+        i = int(np.searchsorted(self.grams, gram))
+        if i < len(self.grams) and self.grams[i] == gram:
+            return self.postings[self.offsets[i] : self.offsets[i + 1]]
+        return self.postings[:0]
+
+    @staticmethod
+    def _intersect(candidates: np.ndarray, postings: list[np.ndarray]) -> np.ndarray:
+        for p in postings:
+            if not len(candidates):
+                break
+            # posting은 행 번호순으로 정렬돼 있으므로 작은 후보 쪽에서 이분 탐색
+            i = np.minimum(np.searchsorted(p, candidates), len(p) - 1)
+            candidates = candidates[p[i] == candidates]
+        return candidates
+
+    def _verify(self, q: bytes, candidates: np.ndarray) -> list[int]:
+        """Rows whose key really contains q, shortest first, at most `_MAX_HITS`."""
+        lengths = self.lengths[candidates]
+        if len(candidates) > _MAX_POOL:
+            short = np.argpartition(lengths, _MAX_POOL)[:_MAX_POOL]
+            candidates, lengths = candidates[short], lengths[short]
+        hits: list[int] = []
+        for r in candidates[np.argsort(lengths, kind="stable")]:
+            if q in self.key(r):
+                hits.append(int(r))
+                if len(hits) >= _MAX_HITS:
+                    break
+        return hits
+
+    def _exact(self, q: bytes, limit: int) -> tuple[list[int], list[np.ndarray], np.ndarray]:
+        grams = np.unique(_gram_codes(np.frombuffer(q, dtype=np.uint8)))
+        postings = sorted((self._posting(int(g)) for g in grams), key=len)
+
+        # 흔한 gram만으로 된 입력("서울특별시")은 후보가 수십만이므로 짧은 항목부터 먼저 확인
+        pool = postings[0]
+        hits: list[int] = []
+        if len(pool) > _MAX_POOL:
+            short = pool[np.argpartition(self.lengths[pool], _MAX_POOL)[:_MAX_POOL]]
+            hits = self._verify(q, self._intersect(np.sort(short), postings[1:]))
+        if len(hits) < limit:
+            hits = self._verify(q, self._intersect(pool, postings[1:]))
+        return hits, postings, grams
+
+    def suggest(self, query: str, limit: int = 8) -> list[AddressSuggestion]:
+        keys = [q for q in (jamo_bytes(k) for k in _query_keys(query)) if len(q) >= _GRAM]
+        if not keys or not self.n:
+            return []
+        for q in keys:
+            hits, postings, grams = self._exact(q, limit)
+            if hits:
+                def rank(r: int) -> tuple:
+                    key = self.key(r)
+                    pos = 0 if key.startswith(q) else 1 if (b" " + q) in key else 2
+                    return (pos, len(key), self.texts[r])
+
+                return [self.suggestion(r) for r in sorted(hits, key=rank)[:limit]]
+
+        # 오타 허용: gram의 60% 이상(짧은 입력은 자모 하나 몫을 뺀 만큼)을 공유하는 항목.
+        # 후보는 드문 gram의 posting(없으면 가장 짧은 posting 하나)에서만 모으고,
+        # 공유 gram 수는 모든 posting에 대해 이분 탐색으로 셈
+        nonempty = [p for p in postings if len(p)]
+        if not nonempty:
+            return []
+        rare = [p for p in nonempty if len(p) <= _MAX_FUZZY_POSTING] or nonempty[:1]
+        rows = np.unique(np.concatenate(rare))
+        counts = np.zeros(len(rows), dtype=np.int64)
+        for p in nonempty:
+            i = np.minimum(np.searchsorted(p, rows), len(p) - 1)
+            counts += p[i] == rows
+        # 자모 하나가 틀리면 gram이 최대 _GRAM개 빠지므로 짧은 입력은 그만큼은 허용
+        need = max(1, min(int(np.ceil(0.6 * len(grams))), len(grams) - _GRAM))
+        good = counts >= need
+        rows, counts = rows[good], counts[good]
+        order = np.lexsort((self.lengths[rows], -counts))[:limit]
+        return [self.suggestion(int(rows[i])) for i in order]
+
+
+# 제안에 필요한 컬럼만 (전체 건물 테이블을 만들지 않음)
+_SUGGESTION_COLUMNS = ["name", "address", "lat", "lon"]
+
+
+def _suggestion_columns(data: BuildingsData) -> pd.DataFrame:
+    """name / address / lat / lon of the snapshot, read column by column."""
+    if data.columns is not None:
+        strings, numeric = data.columns.strings, data.columns.numeric
+        return pd.DataFrame(
+            {
+                "name": strings["name"].tolist(),
+                "address": strings["address"].tolist(),
+                "lat": np.asarray(numeric["lat"]),
+                "lon": np.asarray(numeric["lon"]),
+            }
+        )
+    if data.table is not None:
+        return data.table[_SUGGESTION_COLUMNS]
+    parts = sorted(data.partitions.directory.glob("*/part-*.parquet")) if data.partitions is not None else []
+    if not parts:
+        return pd.DataFrame(columns=_SUGGESTION_COLUMNS)
+    return pd.concat([pd.read_parquet(p, columns=_SUGGESTION_COLUMNS) for p in parts], ignore_index=True)
+
+
+def _entries(text: pd.Series, kind: str, address: pd.Series, lat, lon) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"text": text.to_numpy(), "kind": _KINDS.index(kind), "address": address.to_numpy(), "lat": lat, "lon": lon}
+    )
+
+
+def _building_entries(data: BuildingsData) -> pd.DataFrame:
+    """Address entries, then building-name entries, of the buildings snapshot."""
+    df = _suggestion_columns(data)
+    address = df["address"].astype(object).where(df["address"].notna(), None)
+    name = df["name"].astype(object).where(df["name"].notna(), None)
+    lat = pd.to_numeric(df["lat"], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+    lon = pd.to_numeric(df["lon"], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+    has_address = address.notna().to_numpy()
+    has_name = (name.notna() & (name.astype(str).str.strip() != "")).to_numpy()
+    return pd.concat(
+        [
+            _entries(address[has_address], "address", address[has_address], lat[has_address], lon[has_address]),
+            _entries(name[has_name], "building", address[has_name], lat[has_name], lon[has_name]),
+        ],
+        ignore_index=True,
+    )
+
+
+def _address_index_entries(limit: int) -> pd.DataFrame:
+    index = default_address_index()
+    if index is None or limit <= 0:
+        return pd.DataFrame(columns=["text", "kind", "address", "lat", "lon"])
+    # 도로명주소 전체는 너무 많으므로 건물명이 있는 주소만 (건물명 + 주소 두 항목)
+    rows = np.flatnonzero(~np.asarray(index.name.null))[: limit // 2]
+    name = pd.Series([index.name[r] for r in rows], dtype=object)
+    address = pd.Series([index.key[r] for r in rows], dtype=object)
+    lat, lon = np.asarray(index.lat)[rows], np.asarray(index.lon)[rows]
+    return pd.concat(
+        [_entries(name, "building", address, lat, lon), _entries(address, "address", address, lat, lon)],
+        ignore_index=True,
+    )
+
+
+def _build_default_index(data: BuildingsData) -> AutocompleteIndex:
+    limit = settings.autocomplete_max_entries
+    entries = _building_entries(data).head(limit)
+    extra = _address_index_entries(limit - len(entries))
+    if len(extra):
+        entries = pd.concat([entries, extra], ignore_index=True)
+    return AutocompleteIndex.from_entries(entries)
+
+
+class _IndexBuilder:
+    """Builds the index per buildings snapshot off the request path.
+
+    - 현재 스냅샷의 인덱스가 아직 없으면 백그라운드 빌드를 시작하고, 그동안은
+      이전 스냅샷의 인덱스(처음에는 None)를 돌려줍니다.
+    - 빌드가 실패하면 같은 스냅샷으로는 다시 시도하지 않습니다 (`last_error`).
+    """
+
+    def __init__(self, build, *, background: bool = True):
+        self._build = build
+        self.background = background
+        self._current: tuple[str, AutocompleteIndex] | None = None
+        self._pending: str | None = None
+        self._failed: str | None = None
+        self._lock = threading.Lock()
+        self.last_error: BaseException | None = None
+
+    def get(self, data: BuildingsData) -> AutocompleteIndex | None:
+        current = self._current
+        if current is not None and current[0] == data.snapshot_id:
+            return current[1]
+        with self._lock:
+            start = data.snapshot_id not in (self._pending, self._failed)
+            if start:
+                self._pending = data.snapshot_id
+        if start:
+            if self.background:
+                threading.Thread(target=self._run, args=(data,), name="autocomplete-index", daemon=True).start()
+            else:
+                self._run(data)
+        current = self._current
+        return current[1] if current is not None else None
+
+    def _run(self, data: BuildingsData) -> None:
+        try:
+            index = self._build(data)
+        except Exception as e:
+            self.last_error = e
+            with self._lock:
+                self._failed = data.snapshot_id
+                if self._pending == data.snapshot_id:
+                    self._pending = None
+            return
+        with self._lock:
+            self._current = (data.snapshot_id, index)
+            if self._pending == data.snapshot_id:
+                self._pending = None
+
+
+_builder = _IndexBuilder(_build_default_index)
+
+
+def default_autocomplete_index() -> AutocompleteIndex | None:
+    """Index over the current buildings snapshot (+ named buildings of the offline address index).
+
+    처음 호출(및 스냅샷 교체) 직후에는 빌드가 끝날 때까지 None 또는 이전 인덱스입니다.
+    """
+    return _builder.get(load_buildings_snapshot())
+
+
+class AutocompleteService:
+    def __init__(self, index: AutocompleteIndex | None = None):
+        self._index = index
+
+    @property
+    def index(self) -> AutocompleteIndex | None:
+        return self._index or default_autocomplete_index()
+
+    def suggest(self, query: str, limit: int = 8) -> list[AddressSuggestion]:
+        index = self.index
+        if index is None:
+            return []
+        return index.suggest(query, limit=limit)
@@ -6,7 +6,8 @@ from core.exceptions import BuildingNotFoundError
 
 class BuildingService:
     def find_candidates(self, lat: float, lon: float) -> list[BuildingCandidate]:
-        return find_nearby_buildings(lat, lon, radius_m=200.0, limit=5)
+        # 200m 안에 없으면 링 단위로 넓혀 1km까지 탐색
+        return find_nearby_buildings(lat, lon, radius_m=200.0, limit=5, max_radius_m=1000.0)
 
     def choose_best(self, candidates: list[BuildingCandidate]) -> BuildingCandidate:
         if not candidates:
@@ -1,29 +1,175 @@
 from __future__ import annotations
 
-from core.exceptions import AddressNotFoundError
+import asyncio
+import sqlite3
+from functools import lru_cache
+from typing import Sequence
+
+from core.exceptions import AddressNotFoundError, ProviderUnavailableError
 from core.models import LocationResult
-from api.adapters import GeocodingProvider
+from api.adapters import AsyncGeocodingProvider, AsyncProviderAdapter, GeocodingProvider
+from api.hedged import HedgedGeocodingProvider
 from api.kakao_api import KakaoGeocodingProvider
+from api.offline_api import OfflineGeocodingProvider
 from api.vworld_api import VWorldGeocodingProvider
 from core.config import settings
+from core.data_access.address_index import default_address_index
+from core.data_access.geocode_cache import GeocodeCache, address_key, default_geocode_cache
+from core.utils.deadline import deadline_scope
+from core.utils.singleflight import SingleFlight
+
+# 같은 (provider, 주소 키)에 대한 동시 요청은 하나만 내보냄
+_geocode_flight = SingleFlight()
+
+@lru_cache(maxsize=1)
+def _hedged_provider(kakao_key: str, vworld_key: str) -> HedgedGeocodingProvider:
+    # 지연 분포/승리 횟수가 세션 간에 누적되도록 프로세스당 하나
+    return HedgedGeocodingProvider(
+        KakaoGeocodingProvider(api_key=kakao_key),
+        VWorldGeocodingProvider(api_key=vworld_key),
+        hedge_delay_s=settings.geocode_hedge_delay_s,
+    )
 
 def default_provider() -> GeocodingProvider:
-    # 우선순위: Kakao -> VWorld -> Dummy
+    # 우선순위: Kakao -> VWorld -> 오프라인 주소 색인 -> Dummy (둘 다 있으면 Kakao 우선, 늦으면 VWorld로 hedge)
+    if settings.kakao_rest_api_key and settings.vworld_api_key and settings.geocode_hedge_enabled:
+        return _hedged_provider(settings.kakao_rest_api_key, settings.vworld_api_key)
     if settings.kakao_rest_api_key:
         return KakaoGeocodingProvider(api_key=settings.kakao_rest_api_key)
     if settings.vworld_api_key:
         return VWorldGeocodingProvider(api_key=settings.vworld_api_key)
+    index = default_address_index()
+    if index is not None:
+        return OfflineGeocodingProvider(index)
     return _DummyGeocodingProvider()
 
+def _with_input(res: LocationResult, address: str) -> LocationResult:
+    # 캐시/다른 표기로 들어온 동시 요청의 결과를 이번 입력 표기로 돌려줌
+    address = (address or "").strip()
+    if res.input_address == address:
+        return res
+    return res.model_copy(update={"input_address": address})
+
 class GeocodingService:
-    def __init__(self, provider: GeocodingProvider | None = None):
+    def __init__(
+        self,
+        provider: GeocodingProvider | None = None,
+        cache: GeocodeCache | None = None,
+        async_provider: AsyncGeocodingProvider | None = None,
+    ):
         self.provider = provider or default_provider()
+        # 비동기 경로도 같은 provider 체인(hedge/폴백)을 씀
+        self.async_provider = async_provider or AsyncProviderAdapter(self.provider)
+        # 로컬(오프라인/더미) provider 결과는 캐시하지 않음
+        local = isinstance(self.provider, (OfflineGeocodingProvider, _DummyGeocodingProvider))
+        if cache is None and settings.geocode_cache_enabled and not local:
+            cache = default_geocode_cache()
+        self.cache = cache
 
-    def geocode(self, address: str) -> LocationResult:
-        res = self.provider.geocode(address)
+    def _cached(self, provider_name: str, key: str, *, allow_stale: bool = False) -> LocationResult | None:
+        if self.cache is None or not key:
+            return None
+        try:
+            return self.cache.get(provider_name, key, allow_stale=allow_stale)
+        except sqlite3.Error:
+            return None
+
+    def _finish(self, provider_name: str, key: str, address: str, res: LocationResult | None) -> LocationResult:
         if res is None:
             raise AddressNotFoundError(f"주소를 찾지 못했습니다: {address}")
-        return res
+        if self.cache is not None and key:
+            try:
+                self.cache.put(provider_name, key, res)
+            except sqlite3.Error:
+                pass
+        return _with_input(res, address)
+
+    def geocode(self, address: str) -> LocationResult:
+        provider_name = type(self.provider).__name__
+        key = address_key(address)
+        cached = self._cached(provider_name, key)
+        if cached is not None:
+            return _with_input(cached, address)
+
+        try:
+            # 재시도/백오프를 포함한 전체 조회가 예산(settings.geocode_deadline_s) 안에서 끝나도록
+            with deadline_scope(settings.geocode_deadline_s):
+                res = _geocode_flight.do((provider_name, key or address), lambda: self.provider.geocode(address))
+        except ProviderUnavailableError:
+            # provider 장애(회로 open 등) 중에는 만료된 캐시라도 사용
+            stale = self._cached(provider_name, key, allow_stale=True)
+            if stale is None:
+                raise
+            return _with_input(stale, address)
+        return self._finish(provider_name, key, address, res)
+
+    async def ageocode(self, address: str, *, timeout_s: float | None = None) -> LocationResult:
+        """Async `geocode` through `async_provider`; timeout_s bounds the provider call itself."""
+        provider_name = type(self.provider).__name__
+        key = address_key(address)
+        cached = self._cached(provider_name, key)
+        if cached is not None:
+            return _with_input(cached, address)
+
+        try:
+            res = await self.async_provider.geocode(address, timeout_s=timeout_s)
+        except ProviderUnavailableError:
+            stale = self._cached(provider_name, key, allow_stale=True)
+            if stale is None:
+                raise
+            return _with_input(stale, address)
+        return self._finish(provider_name, key, address, res)
+
+    async def ageocode_many(
+        self,
+        addresses: Sequence[str],
+        *,
+        concurrency: int | None = None,
+        timeout_s: float | None = None,
+    ) -> list[LocationResult | Exception]:
+        """Geocode many addresses concurrently; results are in input order.
+
+        동시 요청은 concurrency(기본 settings.geocode_batch_concurrency, provider 스레드 풀
+        크기 이하)개까지, 주소마다 호출을 시작한 뒤 timeout_s(기본
+        settings.geocode_batch_timeout_s) 안에 끝나야 합니다. 실패한 주소는
+        `asyncio.gather(return_exceptions=True)`처럼 예외 객체(AddressNotFoundError,
+        ProviderUnavailableError, TimeoutError 등)가 그 자리에 들어갑니다.
+        배치 안에서 표기만 다른 같은 주소는 한 번만 조회합니다.
+        """
+        concurrency = max(1, concurrency or settings.geocode_batch_concurrency)
+        # 스레드 풀보다 많이 띄우면 초과분은 풀 대기열에서 기다리기만 함
+        pool = getattr(self.async_provider, "max_concurrency", None)
+        if pool:
+            concurrency = min(concurrency, pool)
+        limit = asyncio.Semaphore(concurrency)
+        timeout_s = settings.geocode_batch_timeout_s if timeout_s is None else timeout_s
+
+        async def one(address: str) -> LocationResult:
+            async with limit:
+                return await self.ageocode(address, timeout_s=timeout_s)
+
+        tasks: dict[str, asyncio.Task] = {}
+        keys = []
+        for address in addresses:
+            key = address_key(address) or (address or "").strip()
+            if key not in tasks:
+                tasks[key] = asyncio.ensure_future(one(address))
+            keys.append(key)
+        results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+        return [
+            _with_input(results[key], address) if isinstance(results[key], LocationResult) else results[key]
+            for address, key in zip(addresses, keys)
+        ]
+
+    def geocode_many(
+        self,
+        addresses: Sequence[str],
+        *,
+        concurrency: int | None = None,
+        timeout_s: float | None = None,
+    ) -> list[LocationResult | Exception]:
+        """Blocking wrapper around `ageocode_many` (use that one inside a running event loop)."""
+        return asyncio.run(self.ageocode_many(addresses, concurrency=concurrency, timeout_s=timeout_s))
 
 class _DummyGeocodingProvider:
     """No external API. Returns a fixed point near Seoul City Hall."""
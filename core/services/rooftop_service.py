@@ -3,9 +3,11 @@ from __future__ import annotations
 from core.models import RooftopAreaEstimate
 from core.data_access.repositories import get_roof_area_from_candidate
 from core.config import settings
+from core.data_access.footprints import default_footprint_store
 from core.utils.geometry import polygon_area_m2
 from api.vworld_wfs import get_building_polygon
 from core.utils.availability import compute_availability_ratio
+from core.utils.deadline import Deadline
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -83,16 +85,25 @@ def estimate_greenable_roof_area_m2_from_floor(floor_area_m2: float, *, alpha: f
 
 
 class RooftopService:
-    def estimate_area(self, candidates, lat: float | None = None, lon: float | None = None) -> RooftopAreaEstimate:
+    def estimate_area(
+        self,
+        candidates,
+        lat: float | None = None,
+        lon: float | None = None,
+        *,
+        deadline: Deadline | None = None,
+    ) -> RooftopAreaEstimate:
         """
         옥상 녹화/활용 가능면적(Available/Greenable Roof Area) 추정.
 
         우선순위:
         1) candidates에서 roof_area_m2(물리 옥상면적)를 찾으면:
            A_greenable = β × A_roof
-        2) 없으면 VWorld 폴리곤으로 바닥면적(A_floor) 추정 후:
+        2) 없으면 건물 폴리곤(로컬 footprint 저장소 → VWorld WFS 순)으로 바닥면적(A_floor) 추정 후:
            A_greenable = α × β × A_floor
         3) 둘 다 없으면 suggested=None (사용자 입력 유도)
+
+        deadline: 외부 호출(WFS)에 쓸 전체 시간 예산. 기본은 settings.rooftop_deadline_s초.
         """
         alpha = _get_alpha()
         beta = _get_beta()
@@ -120,13 +131,33 @@ class RooftopService:
                 )
                 break
 
-        # 2) VWorld WFS 폴리곤 기반 바닥면적 추정 (가능한 경우)
+        # 2) 건물 폴리곤 기반 바닥면적 추정 (가능한 경우)
+        #    로컬 footprint 저장소를 먼저 보고, 없을 때만 VWorld WFS 호출 후 저장
         polygon = None
-        if lat is not None and lon is not None and settings.vworld_api_key:
+        # 출처마다 조사가 달라서(…으로/…로) 조사까지 포함한 구절로 둠
+        polygon_via = "VWorld 건물 폴리곤(WFS)으로"
+        if lat is not None and lon is not None:
+            store = default_footprint_store()
             try:
-                polygon = get_building_polygon((lat, lon), api_key=settings.vworld_api_key)
+                polygon = store.lookup(lat, lon)
             except Exception:
                 polygon = None
+            if polygon:
+                polygon_via = "로컬 건물 폴리곤 저장소의 폴리곤으로"
+            elif settings.vworld_api_key:
+                try:
+                    polygon = get_building_polygon(
+                        (lat, lon),
+                        api_key=settings.vworld_api_key,
+                        deadline=deadline or Deadline(settings.rooftop_deadline_s),
+                    )
+                except Exception:
+                    polygon = None
+                if polygon:
+                    try:
+                        store.add(polygon)
+                    except Exception:
+                        pass
 
             if polygon:
                 area = polygon_area_m2(polygon)
@@ -142,14 +173,14 @@ class RooftopService:
                         )
                         confidence = "low"
                         note = (
-                            "VWorld 건물 폴리곤(WFS)으로 바닥면적(A_floor)을 추정했습니다. "
+                            f"{polygon_via} 바닥면적(A_floor)을 추정했습니다. "
                             f"옥상 녹화/활용 가능면적은 A_greenable=α×β×A_floor 로 추정했습니다 (α={alpha}, β={beta}). "
                             "참고용으로 확인이 필요합니다."
                         )
                     else:
                         # candidates로 suggested를 이미 만들었지만, 바닥면적을 얻었으니 정보 보강
                         # (원하면 implied alpha 같은 것도 note에 추가 가능)
-                        note = note + " 또한 VWorld 폴리곤(WFS)으로 바닥면적(A_floor)도 함께 추정했습니다."
+                        note = note + f" 또한 {polygon_via} 바닥면적(A_floor)도 함께 추정했습니다."
 
         return RooftopAreaEstimate(
             roof_area_m2_suggested=suggested,
@@ -0,0 +1,101 @@
+"""Korean address canonicalization.
+
+같은 주소라도 "서울시"/"서울특별시", 띄어쓰기, "번지", 괄호 속 건물명 등 표기가
+제각각이라 문자열 그대로 캐시 키로 쓰면 자주 빗나갑니다. `canonicalize_address`는
+지오코딩 결과를 바꾸지 않는 범위에서 표기 차이만 없앤 안정적인 키를 만듭니다.
+
+예)
+    "서울시 중구 세종대로110 (태평로1가)"  -> "서울특별시 중구 세종대로 110"
+    "서울 중구 태평로1가 31번지"           -> "서울특별시 중구 태평로1가 31"
+    "경기 성남시 분당구 판교역로 235, 3층"  -> "경기도 성남시 분당구 판교역로 235"
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# 시/도 약칭 -> 정식 명칭 (개편 전후 명칭도 같은 키로)
+_SIDO = {
+    "서울": "서울특별시",
+    "서울시": "서울특별시",
+    "서울특별시": "서울특별시",
+    "부산": "부산광역시",
+    "부산시": "부산광역시",
+    "부산광역시": "부산광역시",
+    "대구": "대구광역시",
+    "대구시": "대구광역시",
+    "대구광역시": "대구광역시",
+    "인천": "인천광역시",
+    "인천시": "인천광역시",
+    "인천광역시": "인천광역시",
+    "광주": "광주광역시",
+    "광주광역시": "광주광역시",
+    "대전": "대전광역시",
+    "대전시": "대전광역시",
+    "대전광역시": "대전광역시",
+    "울산": "울산광역시",
+    "울산시": "울산광역시",
+    "울산광역시": "울산광역시",
+    "세종": "세종특별자치시",
+    "세종시": "세종특별자치시",
+    "세종특별자치시": "세종특별자치시",
+    "경기": "경기도",
+    "경기도": "경기도",
+    "강원": "강원특별자치도",
+    "강원도": "강원특별자치도",
+    "강원특별자치도": "강원특별자치도",
+    "충북": "충청북도",
+    "충청북도": "충청북도",
+    "충남": "충청남도",
+    "충청남도": "충청남도",
+    "전북": "전북특별자치도",
+    "전라북도": "전북특별자치도",
+    "전북특별자치도": "전북특별자치도",
+    "전남": "전라남도",
+    "전라남도": "전라남도",
+    "경북": "경상북도",
+    "경상북도": "경상북도",
+    "경남": "경상남도",
+    "경상남도": "경상남도",
+    "제주": "제주특별자치도",
+    "제주도": "제주특별자치도",
+    "제주특별자치도": "제주특별자치도",
+}
+# NOTE: "광주시"는 경기도 광주시일 수 있어 치환하지 않습니다. 시/도 치환은 맨 앞 토큰에만 적용.
+
+_PARENS = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+# 쉼표 뒤(동/층/호 등 상세주소)는 지오코딩에 쓰이지 않음
+_DETAIL_AFTER_COMMA = re.compile(r",.*$")
+_FLOOR_UNIT = re.compile(r"(?<!\S)(?:지하\s*)?\d+\s*(?:층|호)(?!\S)")
+# "123 - 4" -> "123-4"
+_DASH = re.compile(r"(\d)\s*-\s*(\d)")
+# "산 12" -> "산12" (임야 지번)
+_SAN = re.compile(r"(?<!\S)산\s+(\d)")
+# "31번지", "31번" -> "31" ("110번길"은 유지)
+_BUNJI = re.compile(r"(\d+(?:-\d+)?)\s*번지?(?!\S)")
+# "강남대로 118길", "세종대로 110번길" -> 붙여 쓴 도로명으로
+_ROAD_SUFFIX = re.compile(r"(\S(?:로|길))\s+(\d+(?:번)?길)(?!\S)")
+# "세종대로110" -> "세종대로 110" (뒤에 길/가/번길이 오면 도로명·법정동 일부이므로 제외)
+_ROAD_NUMBER = re.compile(r"(\S(?:로|길))(\d+(?:-\d+)?)(?![\d가-힣-])")
+_LEADING_ZEROS = re.compile(r"(?<!\d)0+(\d)")
+
+
+def canonicalize_address(address: str) -> str:
+    """Stable cache key for a Korean road-name or lot-number address."""
+    s = unicodedata.normalize("NFKC", address or "").casefold()
+    s = _PARENS.sub(" ", s)
+    s = _DETAIL_AFTER_COMMA.sub("", s)
+    s = _FLOOR_UNIT.sub(" ", s)
+    s = _DASH.sub(r"\1-\2", s)
+    s = _SAN.sub(r"산\1", s)
+    s = _BUNJI.sub(r"\1", s)
+    s = _ROAD_SUFFIX.sub(r"\1\2", s)
+    s = _ROAD_NUMBER.sub(r"\1 \2", s)
+    s = _LEADING_ZEROS.sub(r"\1", s)
+
+    tokens = s.split()
+    if tokens and tokens[0] == "대한민국":
+        tokens = tokens[1:]
+    if tokens:
+        tokens[0] = _SIDO.get(tokens[0], tokens[0])
+    return " ".join(tokens)
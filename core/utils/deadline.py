@@ -0,0 +1,74 @@
+"""End-to-end deadlines for outbound calls.
+
+호출 측(예: `RooftopService.estimate_area`)이 전체 예산을 정하면 그 안에서 일어나는
+모든 외부 호출의 타임아웃, 호출 한도 대기, 재시도 백오프가 남은 시간을 넘지 않습니다.
+
+명시적으로 넘길 수도 있고(`deadline=`), `deadline_scope`로 현재 컨텍스트에 걸어 두면
+`api.http.get`이 알아서 읽습니다. 스레드 풀로 넘길 때는 `contextvars.copy_context()`로
+컨텍스트를 함께 넘겨야 합니다.
+"""
+from __future__ import annotations
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+class Deadline:
+    """Absolute point in (monotonic) time by which a piece of work must finish."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, budget_s: float):
+        self.expires_at = time.monotonic() + max(0.0, float(budget_s))
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, timeout_s: float) -> float:
+        """timeout_s, shortened to the remaining budget."""
+        return min(float(timeout_s), self.remaining())
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+_current: ContextVar[Deadline | None] = ContextVar("okssangimong_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(budget: float | Deadline | None) -> Iterator[Deadline | None]:
+    """Install a deadline for the enclosed calls (an outer, tighter deadline wins)."""
+    if budget is None:
+        yield _current.get()
+        return
+    deadline = budget if isinstance(budget, Deadline) else Deadline(budget)
+    outer = _current.get()
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        deadline = outer
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def backoff_delay(attempt: int, *, base_s: float, cap_s: float, deadline: Deadline | None = None) -> float | None:
+    """Full-jitter exponential backoff; None when the wait would not fit the deadline.
+
+    attempt는 0부터. 지연은 uniform(0, min(cap_s, base_s * 2**attempt)).
+    """
+    delay = random.uniform(0.0, min(cap_s, base_s * (2**attempt)))
+    if deadline is not None and delay >= deadline.remaining():
+        return None
+    return delay
@@ -0,0 +1,101 @@
+"""Incremental GeoJSON FeatureCollection parser.
+
+본문 전체를 dict로 올리지 않고 `"features"` 배열의 원소를 하나씩 디코드해서
+돌려줍니다. 대용량 원본 파일이나 HTTP 응답 스트림을 메모리 한도 안에서 처리할 때
+사용합니다.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Iterable, Iterator
+
+_FEATURES_KEY = re.compile(r'"features"\s*:\s*\[')
+_WS = " \t\r\n"
+
+
+class FeatureStream:
+    """`iter_features` that also records whether a `features` array was found.
+
+    빈 FeatureCollection과 features가 없는 JSON(오류 응답 등)은 둘 다 아무것도
+    내놓지 않으므로, 응답을 검증하는 쪽은 `found_array`로 구분합니다.
+    """
+
+    def __init__(self, chunks: Iterable[bytes | str], *, encoding: str = "utf-8"):
+        self._chunks = chunks
+        self._encoding = encoding
+        self.found_array = False
+
+    def __iter__(self) -> Iterator[dict]:
+        return _iter_features(self._chunks, self._encoding, self)
+
+
+def iter_features(chunks: Iterable[bytes | str], *, encoding: str = "utf-8") -> Iterator[dict]:
+    """Yield each element of the top-level `features` array as it is parsed.
+
+    chunks는 bytes(파일 read, `resp.iter_content`) 또는 str 조각의 iterable.
+    배열이 끝나면 나머지 입력은 읽지 않습니다.
+    """
+    return iter(FeatureStream(chunks, encoding=encoding))
+
+
+def _iter_features(chunks: Iterable[bytes | str], encoding: str, stream: FeatureStream) -> Iterator[dict]:
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    it = iter(chunks)
+    buf = ""
+    eof = False
+
+    def _more() -> bool:
+        nonlocal buf, eof
+        if eof:
+            return False
+        for chunk in it:
+            piece = text_decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+            if piece:
+                buf += piece
+                return True
+        buf += text_decoder.decode(b"", final=True)
+        eof = True
+        return False
+
+    # 1) "features": [ 위치 찾기
+    while True:
+        m = _FEATURES_KEY.search(buf)
+        if m:
+            buf = buf[m.end() :]
+            stream.found_array = True
+            break
+        # 키가 청크 경계에 걸칠 수 있으므로 끝부분은 남겨둠
+        buf = buf[-64:]
+        if not _more():
+            return
+
+    # 2) 배열 원소를 하나씩 디코드
+    pos = 0
+    while True:
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf) and buf[pos] == ",":
+                pos += 1
+                continue
+            break
+        if pos >= len(buf):
+            buf, pos = "", 0
+            if not _more():
+                raise ValueError("unexpected end of GeoJSON input inside features array")
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # 원소가 아직 다 도착하지 않음 -> 더 읽고 재시도
+            buf, pos = buf[pos:], 0
+            if not _more():
+                raise
+            continue
+        yield obj
+        buf, pos = buf[end:], 0
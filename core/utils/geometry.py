@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
 
 # NOTE:
 # - 공간데이터(폴리곤)가 들어오면 shapely/pyproj로 확장하세요.
@@ -17,6 +19,71 @@ def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return R * c
 
+def haversine_m_array(lat, lon, lats, lons) -> np.ndarray:
+    """Vectorized great-circle distance (meters), broadcasting like NumPy.
+
+    보통 점 하나(lat, lon) 대 배열(lats, lons)로 쓰고, `lat[:, None]`처럼 넘기면
+    점 여러 개 x 배열의 거리 행렬을 얻습니다.
+    NaN 좌표는 NaN 거리로 남으므로 호출 측에서 `<=` 비교로 자연스럽게 걸러집니다.
+    """
+    R = 6371000.0
+    phi1 = np.radians(np.asarray(lat, dtype=np.float64))
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lons, dtype=np.float64) - np.asarray(lon, dtype=np.float64))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def point_in_polygon(point: Tuple[float, float], polygon: Iterable[Tuple[float, float]]) -> bool:
+    """Ray casting test; point and polygon vertices in the same (x, y) order."""
+    x, y = point
+    inside = False
+    pts = list(polygon)
+    if len(pts) < 3:
+        return False
+    j = len(pts) - 1
+    for i in range(len(pts)):
+        xi, yi = pts[i]
+        xj, yj = pts[j]
+        intersects = ((yi > y) != (yj > y)) and (
+            x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi
+        )
+        if intersects:
+            inside = not inside
+        j = i
+    return inside
+
+def iter_exterior_rings(geometry: dict) -> Iterator[list]:
+    """Exterior rings of a GeoJSON Polygon/MultiPolygon as the raw coordinate lists."""
+    if not geometry:
+        return
+    geom_type = geometry.get("type")
+    coords = geometry.get("coordinates") or []
+    if geom_type == "Polygon":
+        if coords:
+            yield coords[0]
+    elif geom_type == "MultiPolygon":
+        for poly in coords:
+            if poly:
+                yield poly[0]
+
+def extract_polygons(geometry: dict) -> list[list[Tuple[float, float]]]:
+    """Exterior rings of a GeoJSON Polygon/MultiPolygon as (x, y) lists."""
+    return [[(float(x), float(y)) for x, y in ring] for ring in iter_exterior_rings(geometry)]
+
+def ring_contains(point: Tuple[float, float], ring: list) -> bool:
+    """point_in_polygon with a cheap bounding-box rejection first."""
+    x, y = point
+    if len(ring) < 3:
+        return False
+    xs = [p[0] for p in ring]
+    if not (min(xs) <= x <= max(xs)):
+        return False
+    ys = [p[1] for p in ring]
+    if not (min(ys) <= y <= max(ys)):
+        return False
+    return point_in_polygon(point, ring)
+
 def _looks_like_korea_lonlat(points: list[Tuple[float, float]]) -> bool:
     if not points:
         return False
@@ -0,0 +1,68 @@
+"""Hangul syllable -> compatibility jamo decomposition.
+
+입력 중인 글자("세종댈" -> "세종대로")도 매칭되도록 음절을 호환 자모로 풀어 씁니다.
+겹받침/이중모음도 낱자로 풀어서 IME 조합 중간 상태와 완성형이 같은 자모열을 갖게 합니다.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 단독으로 입력된 겹자모 (예: "ㄳ", "ㅘ")
+_COMPAT_SPLIT = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+# 음절/겹자모 -> 낱자모 표 (str.translate 한 번으로 분해)
+_JAMO_TABLE = {
+    _SYLLABLE_BASE + i: _CHO[i // 588] + _JUNG[(i % 588) // 28] + _JONG[i % 28]
+    for i in range(_SYLLABLE_LAST - _SYLLABLE_BASE + 1)
+}
+_JAMO_TABLE.update({ord(k): v for k, v in _COMPAT_SPLIT.items()})
+
+
+def to_jamo(text: str) -> str:
+    """Decompose Hangul syllables; other characters pass through unchanged."""
+    return text.translate(_JAMO_TABLE)
+
+
+# 자모열을 글자당 1바이트로: 호환 자모(U+3131~U+318E) -> 0x80~, ASCII는 그대로, 그 밖의 문자는 "?"
+_BYTE_TABLE = {cp: 0x80 + cp - 0x3131 for cp in range(0x3131, 0x318F)}
+_BYTE_TABLE.update({cp: ord("?") for cp in range(0x80, 0x100)})
+
+
+def jamo_bytes(jamo: str) -> bytes:
+    """One byte per character of a `to_jamo` string, for numpy-side comparisons."""
+    return jamo.translate(_BYTE_TABLE).encode("latin-1", errors="replace")
+
+
+def edit_distances(target: bytes, candidates: np.ndarray, lengths: np.ndarray, *, limit: int) -> np.ndarray:
+    """Levenshtein distance from `target` to every row of `candidates`, capped at limit + 1.
+
+    `candidates`는 (후보 수, 최대 길이) uint8 배열이고 각 행의 앞 `lengths`개만 씁니다.
+    후보 전체를 한 번에 계산하므로 반복 횟수는 두 문자열 길이의 곱뿐입니다.
+    오타 비교는 `jamo_bytes(to_jamo(...))`끼리 하면 "테해란로"/"테헤란로"가 1이 됩니다.
+    """
+    k, width = candidates.shape
+    t = np.frombuffer(target, dtype=np.uint8)
+    prev = np.broadcast_to(np.arange(width + 1, dtype=np.int32), (k, width + 1)).copy()
+    for i, ch in enumerate(t, 1):
+        cur = np.empty_like(prev)
+        cur[:, 0] = i
+        sub = prev[:, :-1] + (candidates != ch)
+        step = np.minimum(prev[:, 1:] + 1, sub)
+        for j in range(width):
+            cur[:, j + 1] = np.minimum(step[:, j], cur[:, j] + 1)
+        prev = cur
+    return np.minimum(prev[np.arange(k), lengths], limit + 1)
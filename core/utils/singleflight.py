@@ -0,0 +1,66 @@
+"""Single-flight request coalescing.
+
+같은 키로 동시에 들어온 호출 중 첫 번째만 실제로 실행하고, 나머지는 그 결과(또는
+예외)를 함께 받습니다. 캠퍼스에서 여러 사용자가 같은 주소를 넣거나 배치 작업이
+같은 위치를 반복할 때 Kakao/VWorld/WFS로 나가는 중복 요청을 하나로 줄입니다.
+
+실행이 끝나면 키를 바로 지우므로 결과를 캐시하지는 않습니다 (캐시는 호출 측 책임).
+"""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn() once per key among concurrent callers; everyone gets its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
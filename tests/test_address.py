@@ -0,0 +1,26 @@
+import pytest
+
+from core.utils.address import canonicalize_address
+
+
+@pytest.mark.parametrize(
+    "variants",
+    [
+        ["서울특별시 중구 세종대로 110", "서울시 중구 세종대로110", " 서울  중구 세종대로 110 (태평로1가)", "대한민국 서울 중구 세종대로 110, 3층"],
+        ["서울 강남구 강남대로118길 5", "서울특별시 강남구 강남대로 118길 05"],
+        ["서울 중구 태평로1가 31번지", "서울특별시 중구 태평로1가 31"],
+        ["제주 제주시 애월읍 산 12 - 3 번지", "제주특별자치도 제주시 애월읍 산12-3"],
+        ["강원도 춘천시 중앙로 1", "강원특별자치도 춘천시 중앙로 1"],
+    ],
+)
+def test_variants_share_one_key(variants):
+    assert len({canonicalize_address(v) for v in variants}) == 1
+
+
+def test_distinct_addresses_stay_distinct():
+    keys = {
+        canonicalize_address(a)
+        for a in ["서울 중구 세종대로 110", "서울 중구 세종대로110번길 1", "서울 종로구 종로1가 1", "경기 광주시 경안로 1", "광주 동구 금남로 1"]
+    }
+    assert len(keys) == 5
+    assert canonicalize_address("서울 종로구 종로1가 1") == "서울특별시 종로구 종로1가 1"
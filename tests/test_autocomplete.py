@@ -0,0 +1,126 @@
+from core.models import AddressSuggestion
+from core.services.autocomplete_service import AutocompleteIndex, AutocompleteService
+from core.utils.hangul import to_jamo
+
+
+def _index():
+    addresses = [
+        "서울특별시 중구 세종대로 110",
+        "서울특별시 중구 세종대로 1",
+        "서울특별시 종로구 세종로 1",
+        "서울특별시 강남구 테헤란로 152",
+        "서울특별시 중구 을지로 100",
+    ]
+    items = [AddressSuggestion(text=a, address=a) for a in addresses]
+    items.append(AddressSuggestion(text="세종빌딩", kind="building", address="서울특별시 중구 을지로 100"))
+    items.append(AddressSuggestion(text=addresses[0], address=addresses[0]))  # 중복은 한 번만
+    return AutocompleteIndex.build(items)
+
+
+def test_jamo_decomposition_matches_composing_input():
+    assert to_jamo("댈") == "ㄷㅐㄹ"
+    assert to_jamo("대로").startswith(to_jamo("댈"))
+    assert to_jamo("ㄳ") == to_jamo("각사")[2:4] == "ㄱㅅ"
+    assert to_jamo("110") == "110"
+
+
+def test_partial_syllable_and_abbreviated_region_match():
+    index = _index()
+    assert index.n == 6
+
+    texts = [s.text for s in index.suggest("세종댈")]
+    assert texts[:2] == ["서울특별시 중구 세종대로 1", "서울특별시 중구 세종대로 110"]
+
+    texts = [s.text for s in index.suggest("서울시 중구 세종대로 11")]
+    assert texts == ["서울특별시 중구 세종대로 110"]
+
+
+def test_prefix_matches_rank_before_substring_matches():
+    suggestions = _index().suggest("세종")
+    assert suggestions[0].kind == "building"
+    assert suggestions[0].address == "서울특별시 중구 을지로 100"
+    assert {s.text for s in suggestions[1:]} == {
+        "서울특별시 중구 세종대로 1",
+        "서울특별시 중구 세종대로 110",
+        "서울특별시 종로구 세종로 1",
+    }
+
+
+def test_typo_falls_back_to_gram_overlap():
+    texts = [s.text for s in AutocompleteService(_index()).suggest("테해란로 152")]
+    assert texts[0] == "서울특별시 강남구 테헤란로 152"
+    assert _index().suggest("세") == []
+
+
+def test_default_index_builds_in_background_from_columnar_store(tmp_path, monkeypatch):
+    import threading
+
+    import pandas as pd
+
+    from core.data_access import loaders
+    from core.data_access.columnar import open_building_columns, write_building_columns
+    from core.data_access.loaders import BuildingsData
+    from core.services import autocomplete_service as ac
+
+    df = pd.DataFrame(
+        {
+            "building_id": ["b1", "b2"],
+            "name": ["세종빌딩", None],
+            "address": ["서울특별시 중구 을지로 100", "서울특별시 중구 세종대로 110"],
+            "lat": [37.566, 37.5665],
+            "lon": [126.99, 126.978],
+            "roof_area_m2": [None, 500.0],
+        }
+    )
+    write_building_columns(df, tmp_path / "cols")
+    data = BuildingsData(snapshot_id="s1", columns=open_building_columns(tmp_path / "cols"))
+    monkeypatch.setattr(loaders, "load_buildings_table", lambda: (_ for _ in ()).throw(AssertionError("full table")))
+    monkeypatch.setattr(ac, "_address_index_entries", lambda limit: pd.DataFrame())
+
+    gate = threading.Event()
+
+    def build(d):
+        gate.wait(5)
+        return ac._build_default_index(d)
+
+    builder = ac._IndexBuilder(build)
+    assert builder.get(data) is None  # 빌드 중에는 요청을 막지 않음
+    gate.set()
+    for _ in range(100):
+        index = builder.get(data)
+        if index is not None:
+            break
+        threading.Event().wait(0.02)
+    assert [s.text for s in index.suggest("세종빌")] == ["세종빌딩"]
+    point = index.suggest("세종대로")[0].point
+    assert abs(point.lat - 37.5665) < 1e-4 and abs(point.lon - 126.978) < 1e-4
+
+    # 실패한 스냅샷은 다시 빌드하지 않고, 이전 인덱스로 계속 제안
+    calls = []
+
+    def broken(d):
+        calls.append(d.snapshot_id)
+        raise OSError("disk")
+
+    builder._build, builder.background = broken, False
+    assert builder.get(BuildingsData(snapshot_id="s2", columns=data.columns)) is index
+    assert builder.get(BuildingsData(snapshot_id="s2", columns=data.columns)) is index
+    assert calls == ["s2"] and isinstance(builder.last_error, OSError)
+
+
+def test_typo_fallback_on_a_dense_index(monkeypatch):
+    from core.services import autocomplete_service as ac
+
+    # 흔한 gram(서울특별시, 강남구, …로)의 posting이 상한을 넘어 후보 수집에서 빠지는 규모
+    monkeypatch.setattr(ac, "_MAX_FUZZY_POSTING", 50)
+    roads = ["테헤란로", "봉은사로", "도산대로", "언주로", "선릉로", "학동로", "논현로", "삼성로"]
+    items = [
+        AddressSuggestion(text=f"서울특별시 강남구 {road} {n}", address=f"서울특별시 강남구 {road} {n}")
+        for road in roads
+        for n in range(1, 301)
+    ]
+    index = AutocompleteIndex.build(items)
+    assert max(len(index._posting(int(g))) for g in ac._gram_codes(ac._codes(ac._search_key("서울특별시")))) > 50
+
+    assert index.suggest("테해란로")[0].text.startswith("서울특별시 강남구 테헤란로 ")
+    assert index.suggest("서울특별시 강남구 테해란로 152")[0].text == "서울특별시 강남구 테헤란로 152"
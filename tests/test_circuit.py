@@ -0,0 +1,49 @@
+import pytest
+
+from api import circuit
+from api.circuit import CircuitBreaker
+from core.exceptions import CircuitOpenError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(circuit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_on_error_rate_and_recovers_through_half_open(clock):
+    b = CircuitBreaker("wfs", window_s=10, min_calls=4, failure_rate=0.5, open_s=30)
+    for ok in (True, False, True):
+        b.before_call()
+        b.record(ok, 0.1)
+    assert b.state == circuit.CLOSED
+    b.before_call()
+    b.record(False, 0.1)  # 2/4 실패
+    assert b.state == circuit.OPEN
+    with pytest.raises(CircuitOpenError):
+        b.before_call()
+
+    clock[0] += 31
+    assert b.state == circuit.HALF_OPEN
+    b.before_call()
+    with pytest.raises(CircuitOpenError):
+        b.before_call()  # 시험 호출은 하나만
+    b.record(False, 0.1)
+    assert b.state == circuit.OPEN
+
+    clock[0] += 31
+    b.before_call()
+    b.record(True, 0.1)
+    assert b.state == circuit.CLOSED
+
+
+def test_slow_calls_count_as_failures_and_old_calls_expire(clock):
+    b = CircuitBreaker("kakao", window_s=10, min_calls=2, failure_rate=1.0, slow_call_s=1.0)
+    b.record(False, 0.1)
+    clock[0] += 11
+    b.record(True, 2.0)
+    assert b.state == circuit.CLOSED  # 첫 실패는 창 밖
+    b.record(False, 0.1)
+    assert b.state == circuit.OPEN
+    assert b.health()["state"] == circuit.OPEN
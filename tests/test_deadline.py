@@ -0,0 +1,74 @@
+import dataclasses
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from api import http
+from core.exceptions import DeadlineExceededError
+from core.utils.deadline import Deadline, backoff_delay, current_deadline, deadline_scope
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict = {}
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        n = _Handler.hits[path] = _Handler.hits.get(path, 0) + 1
+        if path == "/slow":
+            time.sleep(1.0)
+        status = {"/flaky": 503 if n <= 2 else 200, "/missing": 404}.get(path, 200)
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def base_url(monkeypatch):
+    monkeypatch.setattr(http, "settings", dataclasses.replace(http.settings, http_backoff_base_s=0.01, http_backoff_cap_s=0.05))
+    _Handler.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_only_retryable_errors_are_retried(base_url):
+    assert http.get_with_retries(f"{base_url}/flaky", retries=2).status_code == 200
+    assert _Handler.hits["/flaky"] == 3
+
+    assert http.get_with_retries(f"{base_url}/missing", retries=2).status_code == 404
+    assert _Handler.hits["/missing"] == 1
+
+
+def test_deadline_bounds_timeouts_and_retries(base_url):
+    t0 = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        http.get_with_retries(f"{base_url}/slow", timeout=5.0, retries=5, deadline=Deadline(0.3))
+    assert time.monotonic() - t0 < 0.8
+
+    with deadline_scope(0.0):
+        with pytest.raises(DeadlineExceededError):
+            http.get(f"{base_url}/ok")
+    assert "/ok" not in _Handler.hits
+
+
+def test_scopes_nest_to_the_tighter_deadline():
+    with deadline_scope(10.0) as outer:
+        with deadline_scope(60.0) as inner:
+            assert inner is outer
+        with deadline_scope(1.0) as inner:
+            assert current_deadline() is inner and inner.remaining() <= 1.0
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+    assert all(0.0 <= backoff_delay(a, base_s=0.2, cap_s=1.0) <= 1.0 for a in range(10))
+    assert backoff_delay(3, base_s=10.0, cap_s=10.0, deadline=Deadline(0.0)) is None
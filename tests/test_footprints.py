@@ -0,0 +1,51 @@
+import dataclasses
+
+from core.data_access.footprints import FootprintStore, default_footprints_path
+from core.services import rooftop_service
+from core.services.rooftop_service import RooftopService
+
+
+def _square(lon, lat, d):
+    return [(lon, lat), (lon + d, lat), (lon + d, lat + d), (lon, lat + d), (lon, lat)]
+
+
+def test_store_returns_smallest_containing_footprint(tmp_path):
+    store = FootprintStore(tmp_path / "footprints.sqlite")
+    assert store.lookup(37.5, 127.0) is None
+    assert not (tmp_path / "footprints.sqlite").exists()
+
+    outer = _square(127.0, 37.5, 0.001)
+    inner = _square(127.0004, 37.5004, 0.0002)
+    assert store.add_many([outer, inner, outer]) == 2
+    assert not store.add(inner)
+    assert len(store) == 2
+
+    assert store.lookup(37.5005, 127.0005) == inner
+    assert store.lookup(37.5001, 127.0001) == outer
+    assert store.lookup(37.51, 127.01) is None
+
+
+def test_estimate_area_uses_store_before_network(tmp_path, monkeypatch):
+    store = FootprintStore(tmp_path / "footprints.sqlite")
+    monkeypatch.setattr(rooftop_service, "default_footprint_store", lambda: store)
+    monkeypatch.setattr(rooftop_service, "settings", dataclasses.replace(rooftop_service.settings, vworld_api_key="k"))
+    calls = []
+
+    def fake_wfs(coords, api_key, **kwargs):
+        calls.append(coords)
+        return _square(127.0, 37.5, 0.0002)
+
+    monkeypatch.setattr(rooftop_service, "get_building_polygon", fake_wfs)
+
+    first = RooftopService().estimate_area([], lat=37.5001, lon=127.0001)
+    second = RooftopService().estimate_area([], lat=37.5001, lon=127.0001)
+    assert len(calls) == 1
+    assert first.floor_area_m2 == second.floor_area_m2 > 0
+    assert first.note.startswith("VWorld 건물 폴리곤(WFS)으로 바닥면적")
+    assert second.note.startswith("로컬 건물 폴리곤 저장소의 폴리곤으로 바닥면적")
+
+
+
+def test_default_store_lives_in_the_untracked_cache_dir():
+    # 실행 중에 쓰이는 파일(-wal/-shm 포함)이 git이 추적하는 data/processed에 생기지 않도록
+    assert default_footprints_path().parent.name == "cache"
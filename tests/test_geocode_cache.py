@@ -0,0 +1,76 @@
+import pytest
+
+from core.data_access.geocode_cache import GeocodeCache
+from core.exceptions import AddressNotFoundError
+from core.models import LocationResult
+from core.services.geocoding_service import GeocodingService
+
+
+class _CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def geocode(self, address):
+        self.calls.append(address)
+        if "없는" in address:
+            return None
+        return LocationResult(
+            input_address=address.strip(), normalized_address=address.strip(), point={"lat": 37.5, "lon": 127.0}, provider="kakao"
+        )
+
+
+def test_geocode_served_from_cache_across_instances(tmp_path):
+    path = tmp_path / "geocode.sqlite"
+    provider = _CountingProvider()
+    first = GeocodingService(provider, cache=GeocodeCache(path)).geocode("서울 중구  세종대로 110")
+    # 새 인스턴스(재시작)에서도 같은 파일을 공유
+    cache = GeocodeCache(path)
+    second = GeocodingService(provider, cache=cache).geocode(" 서울 중구 세종대로 110 ")
+    assert provider.calls == ["서울 중구  세종대로 110"]
+    assert second.point == first.point
+    assert second.input_address == "서울 중구 세종대로 110"
+
+    with pytest.raises(AddressNotFoundError):
+        GeocodingService(provider, cache=cache).geocode("없는 주소")
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "entries": 1}
+
+
+def test_ttl_and_lru_eviction(tmp_path, monkeypatch):
+    import core.data_access.geocode_cache as gc
+
+    now = [1000.0]
+    monkeypatch.setattr(gc.time, "time", lambda: now[0])
+    cache = GeocodeCache(tmp_path / "geocode.sqlite", ttl_s=100, max_entries=2, touch_interval_s=0)
+    res = _CountingProvider().geocode("a")
+    cache.put("p", "a", res)
+    now[0] += 1
+    cache.put("p", "b", res)
+    now[0] += 1
+    assert cache.get("p", "a") is not None  # a가 b보다 최근 조회
+    now[0] += 1
+    cache.put("p", "c", res)
+    assert cache.get("p", "b") is None
+    assert cache.stats()["evictions"] == 1
+
+    now[0] += 200
+    assert cache.get("p", "a") is None
+
+
+def test_reads_do_not_write_until_the_touch_interval(tmp_path, monkeypatch):
+    import core.data_access.geocode_cache as gc
+
+    now = [1000.0]
+    monkeypatch.setattr(gc.time, "time", lambda: now[0])
+    cache = GeocodeCache(tmp_path / "geocode.sqlite", touch_interval_s=600)
+    cache.put("p", "a", _CountingProvider().geocode("a"))
+    conn = cache._conn()
+    writes = conn.total_changes
+    now[0] += 10
+    assert cache.get("p", "a") is not None
+    assert cache.get("p", "missing") is None
+    assert conn.total_changes == writes
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    now[0] += 600
+    assert cache.get("p", "a") is not None
+    assert conn.total_changes == writes + 1
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+
+from core.data_access.geocode_cache import GeocodeCache
+from core.exceptions import AddressNotFoundError
+from core.models import LocationResult
+from core.services.geocoding_service import GeocodingService
+
+
+class _SlowProvider:
+    def __init__(self, delay_s=0.1):
+        self.delay_s = delay_s
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def geocode(self, address):
+        with self._lock:
+            self.calls.append(address)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(2.0 if "느린" in address else self.delay_s)
+            if "없는" in address:
+                return None
+            n = len(self.calls)
+            return LocationResult(input_address=address, normalized_address=address, point={"lat": 37.5, "lon": 127.0 + n * 1e-4}, provider="kakao")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_batch_runs_concurrently_in_input_order(tmp_path):
+    provider = _SlowProvider()
+    svc = GeocodingService(provider, cache=GeocodeCache(tmp_path / "g.sqlite"))
+    addresses = [f"서울특별시 중구 세종대로 {i}" for i in range(1, 33)]
+
+    t0 = time.monotonic()
+    results = svc.geocode_many(addresses, concurrency=8)
+    elapsed = time.monotonic() - t0
+
+    assert [r.input_address for r in results] == addresses
+    assert elapsed < 1.0  # 순차 실행이면 3.2초
+    assert provider.peak <= 8
+
+    # 두 번째 배치는 캐시에서
+    assert svc.geocode_many(addresses) == results
+    assert len(provider.calls) == 32
+
+
+def test_failures_and_timeouts_stay_in_their_slot(tmp_path):
+    provider = _SlowProvider(delay_s=0.0)
+    svc = GeocodingService(provider, cache=GeocodeCache(tmp_path / "g.sqlite"))
+    results = svc.geocode_many(["서울 중구 세종대로 110", "없는 주소", "느린 주소", "서울특별시 중구 세종대로110"], timeout_s=0.3)
+
+    assert isinstance(results[0], LocationResult)
+    assert isinstance(results[1], AddressNotFoundError)
+    assert isinstance(results[2], TimeoutError)
+    # 표기만 다른 같은 주소는 한 번만 조회하고 각자 입력 표기로 돌려받음
+    assert results[3].point == results[0].point
+    assert results[3].input_address == "서울특별시 중구 세종대로110"
+    assert sorted(provider.calls) == sorted(["서울 중구 세종대로 110", "없는 주소", "느린 주소"])
+
+
+def test_ageocode_many_inside_running_loop(tmp_path):
+    svc = GeocodingService(_SlowProvider(delay_s=0.0), cache=GeocodeCache(tmp_path / "g.sqlite"))
+
+    async def main():
+        return await svc.ageocode_many(["a 1", "b 2"])
+
+    assert [r.input_address for r in asyncio.run(main())] == ["a 1", "b 2"]
+
+
+def test_timeout_starts_when_the_call_starts_not_while_queued(tmp_path):
+    from api.adapters import blocking_pool_size
+
+    # 풀보다 많은 동시 실행을 요청해도, 뒤쪽 주소가 대기열에서 시간 초과되지 않음
+    pool = blocking_pool_size()
+    provider = _SlowProvider(delay_s=0.2)
+    svc = GeocodingService(provider, cache=GeocodeCache(tmp_path / "g.sqlite"))
+    addresses = [f"서울특별시 중구 세종대로 {i}" for i in range(1, 2 * pool + 1)]
+
+    results = svc.geocode_many(addresses, concurrency=2 * pool, timeout_s=0.35)
+
+    assert all(isinstance(r, LocationResult) for r in results)
+    assert provider.peak <= pool
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from api.hedged import HedgedGeocodingProvider
+from core.models import LocationResult
+
+
+class _Slow:
+    def __init__(self, name, delay_s, result=True, error=None):
+        self.name, self.delay_s, self.result, self.error = name, delay_s, result, error
+        self.calls = 0
+
+    def geocode(self, address):
+        self.calls += 1
+        time.sleep(self.delay_s)
+        if self.error:
+            raise self.error
+        if not self.result:
+            return None
+        return LocationResult(input_address=address, normalized_address=address, point={"lat": 37.5, "lon": 127.0}, provider=self.name)
+
+
+def test_fast_primary_is_not_hedged():
+    secondary = _Slow("vworld", 0.0)
+    hedged = HedgedGeocodingProvider(_Slow("kakao", 0.0), secondary, hedge_delay_s=0.5)
+    assert hedged.geocode("a").provider == "kakao"
+    assert secondary.calls == 0
+    assert hedged.stats()["wins"] == {"primary": 1, "secondary": 0}
+
+
+def test_slow_primary_is_hedged_and_secondary_wins():
+    hedged = HedgedGeocodingProvider(_Slow("kakao", 0.5), _Slow("vworld", 0.01), hedge_delay_s=0.05)
+    t0 = time.monotonic()
+    assert hedged.geocode("a").provider == "vworld"
+    assert time.monotonic() - t0 < 0.3
+    assert hedged.stats()["hedged"] == 1
+
+
+def test_failures_fall_back_and_propagate():
+    hedged = HedgedGeocodingProvider(_Slow("kakao", 0.0, error=RuntimeError("502")), _Slow("vworld", 0.0), hedge_delay_s=1.0)
+    assert hedged.geocode("a").provider == "vworld"
+
+    both_fail = HedgedGeocodingProvider(
+        _Slow("kakao", 0.0, error=RuntimeError("kakao")), _Slow("vworld", 0.0, error=RuntimeError("vworld")), hedge_delay_s=1.0
+    )
+    with pytest.raises(RuntimeError, match="kakao"):
+        both_fail.geocode("a")
+    assert HedgedGeocodingProvider(_Slow("kakao", 0.0, result=False), _Slow("vworld", 0.0, result=False)).geocode("a") is None
+
+
+def test_delay_adapts_to_primary_p90():
+    hedged = HedgedGeocodingProvider(_Slow("kakao", 0.02), _Slow("vworld", 0.0), min_delay_s=0.0)
+    for _ in range(12):
+        hedged.geocode("a")
+    time.sleep(0.05)
+    assert 0.015 < hedged.hedge_delay_s < 0.2
+
+
+def test_latency_samples_exclude_pool_queue_time(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from api import hedged as hedged_module
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(hedged_module, "_executor", pool)
+    pool.submit(time.sleep, 0.3)  # 앞선 작업이 풀을 점유
+    hedged = HedgedGeocodingProvider(_Slow("kakao", 0.01), _Slow("vworld", 0.0), hedge_delay_s=1.0)
+    assert hedged.geocode("a").provider == "kakao"
+    assert len(hedged._latencies) == 1
+    assert hedged._latencies[0] < 0.2
+    pool.shutdown()
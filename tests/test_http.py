@@ -0,0 +1,41 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from api import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers = set()
+
+    def do_GET(self):
+        _Handler.peers.add(self.client_address)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_shared_session_reuses_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        http.close_session()
+        url = f"http://127.0.0.1:{server.server_address[1]}/x"
+        for _ in range(5):
+            assert http.get(url, timeout=2.0).json() == {"ok": True}
+        assert len(_Handler.peers) == 1
+        assert http.get_session() is http.get_session()
+    finally:
+        server.shutdown()
+        http.close_session()
+
+
+def test_float_timeout_is_read_timeout():
+    connect, read = http.default_timeout(7.0)
+    assert read == 7.0 and connect == http.settings.http_connect_timeout_s
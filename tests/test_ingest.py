@@ -0,0 +1,56 @@
+import json
+
+import pandas as pd
+import pytest
+
+from core.data_access.ingest import ingest_buildings, normalize_columns
+from core.utils.geojson_stream import iter_features
+
+
+def _square(lon, lat, d=0.0001):
+    return {"type": "Polygon", "coordinates": [[[lon, lat], [lon + d, lat], [lon + d, lat + d], [lon, lat + d], [lon, lat]]]}
+
+
+def test_iter_features_across_chunk_boundaries():
+    fc = {
+        "type": "FeatureCollection",
+        "totalFeatures": 3,
+        "features": [{"type": "Feature", "id": i, "properties": {"이름": f"건물{i}"}} for i in range(3)],
+    }
+    body = json.dumps(fc, ensure_ascii=False).encode("utf-8")
+    # 1바이트씩 잘라서 넣어도 (멀티바이트 문자 포함) 동일하게 파싱
+    chunks = [body[i : i + 1] for i in range(len(body))]
+    assert [f["properties"]["이름"] for f in iter_features(chunks)] == ["건물0", "건물1", "건물2"]
+    assert list(iter_features([b'{"type": "FeatureCollection", "features": []}'])) == []
+    with pytest.raises(ValueError):
+        list(iter_features([b'{"features": [{"a": 1},']))
+
+
+def test_ingest_csv_and_geojson(tmp_path):
+    csv = tmp_path / "bldg.csv"
+    csv.write_text("건물명,도로명주소,위도,경도,건축면적\n시청,서울 중구 세종대로 110,37.5663,126.9779,1234.5\n해외,x,10,10,1\n", encoding="cp949")
+    geo = tmp_path / "foot.geojson"
+    geo.write_text(
+        json.dumps(
+            {"type": "FeatureCollection", "features": [{"type": "Feature", "properties": {"bld_nm": "폴리곤"}, "geometry": _square(127.0, 37.5)}]}
+        )
+    )
+
+    out = tmp_path / "buildings.parquet"
+    stats = ingest_buildings([csv, geo], out, chunk_rows=1, encoding="cp949")
+    assert (stats.rows_read, stats.rows_written, stats.rows_dropped) == (3, 2, 1)
+
+    df = pd.read_parquet(out)
+    assert list(df.columns) == ["building_id", "name", "address", "lat", "lon", "roof_area_m2"]
+    # 타일 순서 정렬: 남쪽(37.50) 타일이 먼저
+    assert df["name"].tolist() == ["폴리곤", "시청"]
+    assert df["building_id"].tolist() == ["foot-1", "bldg-1"]
+    assert df["lat"].iloc[0] == pytest.approx(37.50005)
+    assert 90 < df["roof_area_m2"].iloc[0] < 110
+    assert str(df["roof_area_m2"].dtype) == "float32"
+
+
+def test_missing_ids_are_filled_per_row():
+    raw = pd.DataFrame({"building_id": ["A1", None, " ", "A4"], "lat": [37.5] * 4, "lon": [127.0] * 4})
+    out = normalize_columns(raw, id_prefix="f", row_offset=10)
+    assert out["building_id"].tolist() == ["A1", "f-12", "f-13", "A4"]
@@ -0,0 +1,108 @@
+import time
+
+import pandas as pd
+import pytest
+
+from api.offline_api import OfflineGeocodingProvider
+from core.data_access.address_index import open_address_index, read_address_source, write_address_index
+
+
+def _juso_line(sido, sigungu, road, main_no, sub_no, name, x, y):
+    # 위치정보요약DB 18개 컬럼 중 색인에 쓰는 것만 채움
+    cols = [""] * 18
+    cols[3], cols[4], cols[7], cols[9], cols[10], cols[11], cols[16], cols[17] = (
+        sido, sigungu, road, str(main_no), str(sub_no), name, str(x), str(y)
+    )
+    return "|".join(cols)
+
+
+@pytest.fixture
+def provider(tmp_path):
+    txt = tmp_path / "entrc_seoul.txt"
+    txt.write_text(
+        "\n".join(
+            [
+                _juso_line("서울특별시", "중구", "세종대로", 110, 0, "서울특별시청", 953892.2, 1952009.9),
+                _juso_line("서울특별시", "중구", "세종대로", 110, 0, "서울특별시청", 953900.0, 1952000.0),  # 두 번째 출입구
+                _juso_line("서울특별시", "중구", "세종대로", 124, 0, "", 953880.0, 1952100.0),
+                _juso_line("서울특별시", "강남구", "강남대로118길", 5, 2, "", 958000.0, 1944000.0),
+            ]
+        ),
+        encoding="cp949",
+    )
+    csv = tmp_path / "extra.csv"
+    csv.write_text("sido,sigungu,road,main_no,sub_no,name,lat,lon\n부산광역시,중구,세종대로,110,0,,35.1,129.03\n", encoding="utf-8")
+    out = tmp_path / "address_index"
+    n = write_address_index([read_address_source(txt), read_address_source(csv, encoding="utf-8")], out)
+    assert n == 4
+    return OfflineGeocodingProvider(open_address_index(out))
+
+
+def test_exact_and_variant_spellings(provider):
+    res = provider.geocode("서울시 중구 세종대로110 (시청)")
+    assert res.provider == "offline"
+    assert res.normalized_address == "서울특별시 중구 세종대로 110"
+    assert res.point.lat == pytest.approx(37.5663, abs=1e-4)
+    assert res.point.lon == pytest.approx(126.9779, abs=1e-4)
+    assert res.extra == {"match": "exact", "building_name": "서울특별시청"}
+    assert provider.geocode("서울 강남구 강남대로 118길 5-2").normalized_address == "서울특별시 강남구 강남대로118길 5-2"
+
+
+def test_partial_region_and_missing_number(provider):
+    assert provider.geocode("중구 세종대로 110") is None  # 서울/부산 모두 중구 세종대로 110
+    assert provider.geocode("서울 세종대로 110").extra["match"] == "road"
+    # 없는 건물번호는 이웃 건물로 대신하지 않음
+    assert provider.geocode("서울특별시 중구 세종대로 122") is None
+    assert provider.geocode("서울특별시 중구 없는로 1") is None
+
+
+def test_road_name_typos_within_the_region(provider):
+    fixed = provider.geocode("서울특별시 중구 세좀대로 110")
+    assert fixed.normalized_address == "서울특별시 중구 세종대로 110"
+    assert fixed.extra["match"] == "road_typo"
+    assert provider.geocode("서울 강남구 강남데로118길 5-2").normalized_address == "서울특별시 강남구 강남대로118길 5-2"
+    # 도로명 숫자는 고치지 않고, 지역 없이도 고치지 않음
+    assert provider.geocode("서울 강남구 강남대로119길 5-2") is None
+    assert provider.geocode("세좀대로 110") is None
+
+
+def test_edit_distances_are_bounded():
+    import numpy as np
+
+    from core.utils.hangul import edit_distances, jamo_bytes, to_jamo
+
+    words = [jamo_bytes(to_jamo(w)) for w in ("테헤란로", "abc", "uvwxyz")]
+    width = max(map(len, words))
+    candidates = np.array([list(w.ljust(width, b"\0")) for w in words], dtype=np.uint8)
+    lengths = np.array([len(w) for w in words])
+    assert edit_distances(jamo_bytes(to_jamo("테해란로")), candidates, lengths, limit=2)[0] == 1
+    assert edit_distances(b"abc", candidates, lengths, limit=0)[1] == 0
+    assert edit_distances(b"abcdef", candidates, lengths, limit=2)[2] == 3
+
+
+def test_typo_lookup_on_a_realistic_region(tmp_path):
+    # 시군구 하나에 도로 수백 개, 주소 수만 개 규모
+    syllables = "가나다라마바사아자차카타파하거너더러머버서어저처"
+    roads = [f"{a}{b}{c}로" for a in syllables[:6] for b in syllables for c in syllables[:3]][:400]
+    rows = [
+        ("서울특별시", sigungu, road, n, 0, "", 37.5, 127.0)
+        for sigungu in ("강남구", "서초구")
+        for road in roads
+        for n in range(1, 61)
+    ]
+    df = pd.DataFrame(rows, columns=["sido", "sigungu", "road", "main_no", "sub_no", "name", "lat", "lon"])
+    out = tmp_path / "address_index"
+    assert write_address_index([df], out) == 2 * 400 * 60
+    index = open_address_index(out)
+
+    target = roads[137]
+    typo = chr(ord(target[0]) + 9 * 28) + target[1:]  # ㅏ -> ㅘ (자모 1개 추가)
+    started = time.perf_counter()
+    for _ in range(20):
+        fixed = index.lookup(f"서울특별시 강남구 {typo} 12")
+    elapsed = (time.perf_counter() - started) / 20
+    assert fixed.address == f"서울특별시 강남구 {target} 12"
+    assert fixed.match == "road_typo"
+    assert index.lookup(f"서울 {target} 12") is None  # 강남구/서초구 모두 있음
+    assert index.lookup(f"서초구 {target} 12").address == f"서울특별시 서초구 {target} 12"
+    assert elapsed < 0.05
@@ -0,0 +1,39 @@
+import multiprocessing as mp
+import time
+
+import pytest
+
+from api.ratelimit import TokenBucket
+from core.exceptions import RateLimitedError
+
+
+def _take(path, n):
+    bucket = TokenBucket(path, rate_per_s=20, burst=1)
+    for _ in range(n):
+        bucket.acquire(max_wait_s=5)
+
+
+def test_bucket_is_shared_across_processes(tmp_path):
+    path = tmp_path / "kakao.json"
+    ctx = mp.get_context("spawn")
+    t0 = time.monotonic()
+    procs = [ctx.Process(target=_take, args=(path, 5)) for _ in range(2)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    assert all(p.exitcode == 0 for p in procs)
+    _take(path, 1)
+    # 11번째 호출은 프로세스 기동 시간과 무관하게 앞선 10회 예약 뒤에 줄을 섬
+    assert time.monotonic() - t0 >= 0.45
+
+
+def test_deadline_and_daily_quota(tmp_path):
+    bucket = TokenBucket(tmp_path / "vworld.json", rate_per_s=1, burst=2, daily_limit=3)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0  # burst
+    with pytest.raises(RateLimitedError, match="rate limited"):
+        bucket.acquire(max_wait_s=0.1)
+    assert 0 < bucket.acquire(max_wait_s=2) <= 1.0
+    with pytest.raises(RateLimitedError, match="daily quota"):
+        bucket.acquire(max_wait_s=10)
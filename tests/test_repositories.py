@@ -0,0 +1,219 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_access import repositories
+from core.data_access.loaders import BuildingsData
+from core.data_access.schema import apply_buildings_schema, memory_report
+from core.data_access.spatial_index import GridIndex
+from core.utils.geometry import haversine_m, haversine_m_array
+
+
+def _use_table(monkeypatch, df):
+    index = GridIndex.build(df["lat"].to_numpy(), df["lon"].to_numpy())
+    _use_data(monkeypatch, BuildingsData(snapshot_id="test", table=df, index=index))
+
+
+def _use_data(monkeypatch, data):
+    monkeypatch.setattr(repositories, "load_buildings_snapshot", lambda: data)
+
+
+@pytest.fixture
+def buildings(monkeypatch):
+    df = apply_buildings_schema(pd.DataFrame(
+        {
+            "building_id": ["a", "b", "c", "d"],
+            "name": ["A", "B", None, "D"],
+            "address": ["addr a", "addr b", "addr c", "addr d"],
+            "lat": [37.5663, 37.5670, 37.5600, "bad"],
+            "lon": [126.9779, 126.9779, 126.9779, 126.9779],
+            "roof_area_m2": [100.0, None, 300.0, 400.0],
+        }
+    ))
+    _use_table(monkeypatch, df)
+    return df
+
+
+def test_find_nearby_buildings_orders_by_distance(buildings):
+    res = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=200.0, limit=5)
+    assert [c.building_id for c in res] == ["a", "b"]
+    # float32 좌표 해상도(~1m) 이내
+    assert res[0].distance_m == pytest.approx(haversine_m(37.5665, 126.9779, 37.5663, 126.9779), abs=1.0)
+    assert repositories.get_roof_area_from_candidate(res[0]) == 100.0
+    assert repositories.get_roof_area_from_candidate(res[1]) is None
+
+
+def test_find_nearby_buildings_limit_and_unparseable_coords(buildings):
+    res = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=2)
+    assert [c.building_id for c in res] == ["a", "b"]
+    res = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=10)
+    assert [c.building_id for c in res] == ["a", "b", "c"]
+    assert res[2].name is None
+
+
+def test_find_nearby_buildings_expands_when_radius_is_empty(buildings):
+    # c는 약 740m 떨어져 있음
+    assert repositories.find_nearby_buildings(37.5535, 126.9779, radius_m=200.0) == []
+    res = repositories.find_nearby_buildings(37.5535, 126.9779, radius_m=200.0, max_radius_m=1000.0)
+    assert [c.building_id for c in res] == ["c"]
+    assert repositories.find_nearby_buildings(37.5535, 126.9779, radius_m=200.0, max_radius_m=500.0) == []
+
+
+def test_grid_index_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(37.50, 37.60, 5000)
+    lon = rng.uniform(126.90, 127.05, 5000)
+    index = GridIndex.build(lat, lon, cell_deg=0.002)
+    for qlat, qlon in zip(rng.uniform(37.5, 37.6, 20), rng.uniform(126.9, 127.05, 20)):
+        dist = haversine_m_array(qlat, qlon, lat, lon)
+        expected = np.argsort(dist, kind="stable")[:5]
+        expected = expected[dist[expected] <= 300.0]
+        rows, d = index.query(qlat, qlon, 300.0, 5)
+        assert rows.tolist() == expected.tolist()
+        assert np.allclose(d, dist[expected])
+
+
+def test_sqlite_repository_matches_memory(buildings, tmp_path, monkeypatch):
+    from core.data_access.sqlite_repository import SqliteBuildingRepository, build_buildings_db
+
+    assert build_buildings_db(buildings, tmp_path / "b.sqlite") == 3
+    repo = SqliteBuildingRepository(tmp_path / "b.sqlite")
+    monkeypatch.setattr(repositories, "default_sqlite_repository", lambda: repo)
+
+    expected = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=10)
+    monkeypatch.setattr(repositories, "settings", replace(repositories.settings, building_repository="sqlite"))
+    got = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=10)
+    assert [c.building_id for c in got] == [c.building_id for c in expected]
+    assert [c.distance_m for c in got] == pytest.approx([c.distance_m for c in expected])
+    assert [c.extra for c in got] == [c.extra for c in expected]
+    assert [c.building_id for c in repositories.find_nearby_buildings(37.5535, 126.9779, 200.0, max_radius_m=1000.0)] == ["c"]
+
+
+def test_columnar_store_matches_memory(buildings, tmp_path, monkeypatch):
+    from core.data_access.columnar import open_building_columns, write_building_columns
+
+    expected = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=10)
+
+    write_building_columns(buildings, tmp_path / "cols")
+    columns = open_building_columns(tmp_path / "cols")
+    assert isinstance(columns.numeric["lat"], np.memmap)
+    _use_data(monkeypatch, BuildingsData(snapshot_id="test", columns=columns, index=columns.index))
+
+    got = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=10_000.0, limit=10)
+    assert [c.model_dump() for c in got] == [c.model_dump() for c in expected]
+
+
+def test_full_table_follows_the_snapshot_backend(buildings, tmp_path, monkeypatch):
+    from core.data_access import loaders
+    from core.data_access.columnar import open_building_columns, write_building_columns
+    from core.data_access.partitioned import PartitionedBuildings, write_partitioned_buildings
+
+    # 원본 Parquet/CSV가 없는 배포에서도 컬럼 저장소/파티션의 데이터를 돌려줌
+    monkeypatch.setattr(loaders, "read_buildings_source", lambda: pytest.fail("read the source table"))
+    monkeypatch.setattr(loaders, "_full_table", None)
+    write_building_columns(buildings, tmp_path / "cols")
+    columns = open_building_columns(tmp_path / "cols")
+    monkeypatch.setattr(loaders, "load_buildings_snapshot", lambda: BuildingsData(snapshot_id="cols", columns=columns))
+    table = loaders.load_buildings_table()
+    assert table["building_id"].tolist() == ["a", "b", "c", "d"]
+    assert table.dtypes.equals(buildings.dtypes)
+    assert loaders.load_buildings_table() is table
+
+    write_partitioned_buildings(buildings, tmp_path / "parts", tile_deg=0.005)
+    partitions = PartitionedBuildings(tmp_path / "parts")
+    monkeypatch.setattr(loaders, "load_buildings_snapshot", lambda: BuildingsData(snapshot_id="parts", partitions=partitions))
+    assert sorted(loaders.load_buildings_table()["building_id"]) == ["a", "b", "c"]
+
+
+def test_partitioned_dataset_reads_only_intersecting_tiles(buildings, tmp_path, monkeypatch):
+    from core.data_access.partitioned import PartitionedBuildings, write_partitioned_buildings
+
+    expected = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=200.0, limit=10)
+
+    manifest = write_partitioned_buildings(buildings, tmp_path / "parts", tile_deg=0.005)
+    assert sum(p["rows"] for p in manifest["partitions"]) == 3
+    partitions = PartitionedBuildings(tmp_path / "parts")
+    _use_data(monkeypatch, BuildingsData(snapshot_id="test", partitions=partitions))
+
+    got = repositories.find_nearby_buildings(37.5665, 126.9779, radius_m=200.0, limit=10)
+    assert [c.model_dump() for c in got] == [c.model_dump() for c in expected]
+    # c(37.5600)가 속한 타일은 읽지 않음
+    assert len(partitions._cache) == 1
+
+    res = repositories.find_nearby_buildings(37.5535, 126.9779, radius_m=200.0, max_radius_m=1000.0)
+    assert [c.building_id for c in res] == ["c"]
+
+
+def test_snapshot_cache_swaps_on_file_change(tmp_path):
+    from core.data_access.snapshots import SnapshotCache, file_signature
+
+    path = tmp_path / "table.csv"
+    path.write_text("v\n1\n")
+    builds = []
+
+    def build(sig):
+        builds.append(sig)
+        return pd.read_csv(path)
+
+    cache = SnapshotCache(build, lambda: file_signature([path]), check_interval_s=0.0, background=False)
+    old = cache.get()
+    assert old.value["v"].tolist() == [1]
+    assert cache.get() is old and len(builds) == 1
+
+    path.write_text("v\n1\n2\n")
+    new = cache.get()
+    assert new.id != old.id
+    assert new.value["v"].tolist() == [1, 2]
+    # 이전 스냅샷을 잡고 있던 쪽은 그대로 유지
+    assert old.value["v"].tolist() == [1]
+
+
+def test_find_nearby_buildings_many_matches_single(buildings):
+    points = [(37.5665, 126.9779), (37.5535, 126.9779), (37.5601, 126.9780), (37.5665, 126.9779)]
+    got = repositories.find_nearby_buildings_many(points, radius_m=200.0, limit=2, max_radius_m=1000.0)
+    expected = [repositories.find_nearby_buildings(la, lo, 200.0, 2, max_radius_m=1000.0) for la, lo in points]
+    assert [[c.model_dump() for c in g] for g in got] == [[c.model_dump() for c in e] for e in expected]
+    assert repositories.find_nearby_buildings_many([]) == []
+
+
+def test_grid_index_query_many_matches_query():
+    rng = np.random.default_rng(1)
+    lat = rng.uniform(37.50, 37.60, 5000)
+    lon = rng.uniform(126.90, 127.05, 5000)
+    index = GridIndex.build(lat, lon, cell_deg=0.002)
+    qlat, qlon = rng.uniform(37.5, 37.6, 300), rng.uniform(126.9, 127.05, 300)
+    for (rows, d), la, lo in zip(index.query_many(qlat, qlon, 450.0, 7, batch=16), qlat, qlon):
+        er, ed = index.query(la, lo, 450.0, 7)
+        assert rows.tolist() == er.tolist()
+        assert np.allclose(d, ed)
+
+
+def test_buildings_schema_is_compact():
+    n = 2000
+    raw = pd.DataFrame(
+        {
+            "building_id": [f"id-{i}" for i in range(n)],
+            "name": ["근린생활시설" if i % 2 else "주택" for i in range(n)],
+            "address": [f"서울특별시 중구 세종대로 {i}" for i in range(n)],
+            "lat": [37.5 + i * 1e-5 for i in range(n)],
+            "lon": [127.0] * n,
+            "roof_area_m2": [None if i % 3 == 0 else 10.0 * i for i in range(n)],
+        }
+    ).astype(object)
+    df = apply_buildings_schema(raw)
+    assert str(df["lat"].dtype) == "float32"
+    assert str(df["roof_area_m2"].dtype) == "Float32"
+    assert df["roof_area_m2"].isna().sum() == (n + 2) // 3
+    assert str(df["name"].dtype) == "category"
+    report = memory_report(df)
+    assert report.loc["total", "bytes"] * 3 < memory_report(raw).loc["total", "bytes"]
+
+
+def test_sqlite_repository_requires_a_built_db(tmp_path):
+    from core.data_access.sqlite_repository import SqliteBuildingRepository
+
+    with pytest.raises(FileNotFoundError):
+        SqliteBuildingRepository(tmp_path / "missing.sqlite")
+    assert not (tmp_path / "missing.sqlite").exists()
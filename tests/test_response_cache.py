@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from api import http
+from core.data_access.response_cache import ResponseCache, response_key
+
+
+def _body(n):
+    return json.dumps({"features": [{"id": i, "coordinates": [[127.0 + i * 1e-5, 37.5]] * 20} for i in range(n)]}).encode()
+
+
+def test_roundtrip_is_compressed_and_survives_reopen(tmp_path):
+    path = tmp_path / "http.sqlite"
+    body = _body(200)
+    ResponseCache(path).put("k", status=200, content_type="application/json", body=body, ttl_s=60)
+
+    cache = ResponseCache(path)  # 재시작
+    hit = cache.get("k")
+    assert hit.body == body and hit.content_type == "application/json"
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["bytes"] * 5 < stats["raw_bytes"] == len(body)
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_ttl_and_byte_budget_lru(tmp_path):
+    cache = ResponseCache(tmp_path / "http.sqlite", max_bytes=10_000, touch_interval_s=0)
+    cache.put("old", status=200, content_type="", body=b"x" * 10, ttl_s=-1)
+    assert cache.get("old") is None
+    assert cache.get("old", allow_stale=True).body == b"x" * 10
+
+    for i in range(6):
+        cache.put(f"r{i}", status=200, content_type="", body=os.urandom(3000), ttl_s=60)
+        cache.get("r0")  # r0은 계속 조회됨
+    keys = {k for k in ("old", "r0", "r1", "r2", "r3", "r4", "r5") if cache.get(k, allow_stale=True) is not None}
+    assert cache.stats()["bytes"] <= 10_000
+    assert "old" not in keys and "r5" in keys and "r0" in keys and "r1" not in keys
+
+
+def test_reads_are_read_only_and_size_is_tracked(tmp_path):
+    cache = ResponseCache(tmp_path / "http.sqlite", max_bytes=10_000, touch_interval_s=600)
+    cache.put("a", status=200, content_type="", body=os.urandom(3000), ttl_s=60)
+    conn = cache._conn()
+    writes = conn.total_changes
+    assert cache.get("a") is not None and cache.get("missing") is None
+    assert conn.total_changes == writes
+
+    def total():
+        return conn.execute("SELECT value FROM http_cache_stats WHERE name = 'total_size'").fetchone()[0]
+
+    cache.put("a", status=200, content_type="", body=os.urandom(2000), ttl_s=60)  # 덮어쓰기
+    cache.put("b", status=200, content_type="", body=os.urandom(1000), ttl_s=60)
+    assert total() == cache.stats()["bytes"]
+    cache.delete("a")
+    assert total() == cache.stats()["bytes"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_key_ignores_api_key():
+    assert response_key("u", {"a": 1, "key": "secret"}) == response_key("u", {"key": "other", "a": "1"})
+    assert response_key("u", {"a": 1}) != response_key("u", {"a": 2})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        _Handler.hits += 1
+        body = b'{"ok": true}'
+        ctype = "application/json; charset=utf-8"
+        if "fc" in self.path:
+            body = json.dumps({"type": "FeatureCollection", "features": [{"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [[[127.0, 37.5], [127.001, 37.5], [127.001, 37.501], [127.0, 37.5]]]}}]}).encode()
+        elif "geocode" in self.path:
+            body = b'{"response": {"status": "ERROR", "error": {"code": "INVALID_KEY"}}}'
+        elif "exception" in self.path:
+            body = b'<?xml version="1.0"?><ServiceExceptionReport><ServiceException>bad</ServiceException></ServiceExceptionReport>'
+            ctype = "text/xml"
+        self.send_response(200 if "bad" not in self.path else 500)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_get_serves_repeat_requests_from_disk(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "http.sqlite")
+    monkeypatch.setattr(http, "default_response_cache", lambda: cache)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        _Handler.hits = 0
+        url = f"http://127.0.0.1:{server.server_address[1]}/wfs"
+        first = http.get(url, params={"bbox": "1", "key": "a"}, cache_ttl_s=60)
+        second = http.get(url, params={"bbox": "1", "key": "b"}, cache_ttl_s=60)
+        assert first.json() == second.json() == {"ok": True}
+        assert second.headers["X-Cache"] == "HIT" and second.status_code == 200
+        assert _Handler.hits == 1
+
+        # 실패 응답은 저장하지 않음
+        http.get(url + "/bad", cache_ttl_s=60)
+        http.get(url + "/bad", cache_ttl_s=60)
+        assert _Handler.hits == 3
+    finally:
+        server.shutdown()
+
+
+def test_error_bodies_with_status_200_are_not_cached(tmp_path, monkeypatch):
+    from api import vworld_api
+
+    cache = ResponseCache(tmp_path / "http.sqlite")
+    monkeypatch.setattr(http, "default_response_cache", lambda: cache)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        for _ in range(2):
+            http.get(base + "/geocode", cache_ttl_s=60, cacheable=vworld_api._cacheable)
+            http.get(base + "/exception", cache_ttl_s=60, cacheable=lambda r: http.json_object(r) is not None)
+        assert cache.stats()["entries"] == 0
+
+        # 검증을 통과한 응답만 저장
+        http.get(base + "/ok", cache_ttl_s=60, cacheable=lambda r: http.json_object(r) == {"ok": True})
+        assert cache.stats()["entries"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_wfs_bodies_are_stored_from_the_streaming_pass(tmp_path, monkeypatch):
+    from api import vworld_wfs
+
+    cache = ResponseCache(tmp_path / "http.sqlite")
+    monkeypatch.setattr(http, "default_response_cache", lambda: cache)
+    # 저장을 위해 본문 전체를 다시 json.loads하지 않음
+    monkeypatch.setattr(http, "json_object", lambda resp: (_ for _ in ()).throw(AssertionError("second parse")))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        _Handler.hits = 0
+        monkeypatch.setattr(vworld_wfs, "VWORLD_WFS_URL", f"http://127.0.0.1:{server.server_address[1]}/fc")
+        bbox = (126.99, 37.49, 127.01, 37.51)
+        first = vworld_wfs._fetch_polygons(bbox, api_key="k", timeout_s=2.0, domain=None)
+        second = vworld_wfs._fetch_polygons(bbox, api_key="k", timeout_s=2.0, domain=None)
+        assert first == second and len(first) == 1
+        assert _Handler.hits == 1 and cache.stats()["entries"] == 1
+    finally:
+        server.shutdown()
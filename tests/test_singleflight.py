@@ -0,0 +1,55 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api import vworld_wfs
+from core.data_access.wfs_tile_cache import WfsTileCache
+from core.utils.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution_and_its_error():
+    flight = SingleFlight()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        time.sleep(0.2)
+        if value == "boom":
+            raise ValueError(value)
+        return value
+
+    with ThreadPoolExecutor(8) as pool:
+        ok = [pool.submit(flight.do, "k", lambda: slow("v")) for _ in range(4)]
+        bad = [pool.submit(flight.do, "e", lambda: slow("boom")) for _ in range(4)]
+        assert [f.result() for f in ok] == ["v"] * 4
+        for f in bad:
+            with pytest.raises(ValueError):
+                f.result()
+    assert sorted(calls) == ["boom", "v"]
+    assert flight.in_flight() == 0
+    # 끝난 뒤의 호출은 다시 실행
+    assert flight.do("k", lambda: slow("again")) == "again"
+
+
+def test_identical_wfs_lookups_are_coalesced(monkeypatch):
+    calls = []
+    gate = threading.Event()
+
+    def fake_fetch(bbox, **kwargs):
+        calls.append(bbox)
+        gate.wait(1.0)
+        return [[(127.0, 37.5), (127.1, 37.5), (127.1, 37.6)]]
+
+    monkeypatch.setattr(vworld_wfs, "_fetch_polygons", fake_fetch)
+    cache = WfsTileCache()
+    monkeypatch.setattr(vworld_wfs, "default_wfs_tile_cache", lambda: cache)
+    with ThreadPoolExecutor(6) as pool:
+        futures = [pool.submit(vworld_wfs.get_building_polygon, (37.55, 127.05), "key") for _ in range(6)]
+        time.sleep(0.1)
+        gate.set()
+        results = [f.result() for f in futures]
+    # 같은 타일 요청 하나
+    assert len(calls) == 1
+    assert all(r == results[0] for r in results)
@@ -0,0 +1,135 @@
+import io
+import json
+import threading
+import time
+
+import requests
+
+from api import http, vworld_wfs
+from core.data_access.response_cache import CachedResponse
+
+_HOME = [(127.049, 37.549), (127.051, 37.549), (127.051, 37.551), (127.049, 37.551), (127.049, 37.549)]
+_NEIGHBOR = [(127.06, 37.56), (127.07, 37.56), (127.07, 37.57), (127.06, 37.57), (127.06, 37.56)]
+
+
+def _fake(plan):
+    calls = []
+
+    def fetch(*, radius_m, cancelled=None, **kwargs):
+        calls.append(radius_m)
+        delay_s, poly = plan[radius_m]
+        time.sleep(delay_s)
+        return poly
+
+    return fetch, calls
+
+
+def test_first_containing_polygon_wins_without_waiting_for_slow_levels(monkeypatch):
+    fetch, calls = _fake({30.0: (1.0, _NEIGHBOR), 60.0: (0.05, _HOME), 120.0: (1.0, None)})
+    monkeypatch.setattr(vworld_wfs, "_fetch_polygon_once", fetch)
+
+    t0 = time.monotonic()
+    assert vworld_wfs._get_building_polygon(
+        37.55, 127.05, "key", radius_m=30.0, timeout_s=5.0, domain=None, max_attempts=3
+    ) == _HOME
+    assert time.monotonic() - t0 < 0.5
+    assert sorted(calls) == [30.0, 60.0, 120.0]
+
+
+def test_without_containing_polygon_smallest_radius_is_used(monkeypatch):
+    fetch, _ = _fake({30.0: (0.05, _NEIGHBOR), 60.0: (0.0, list(reversed(_NEIGHBOR))), 120.0: (0.0, None)})
+    monkeypatch.setattr(vworld_wfs, "_fetch_polygon_once", fetch)
+    assert vworld_wfs._get_building_polygon(
+        37.55, 127.05, "key", radius_m=30.0, timeout_s=5.0, domain=None, max_attempts=3
+    ) == _NEIGHBOR
+
+
+def test_cancelled_level_sends_no_request(monkeypatch):
+    def boom(*args, **kwargs):
+        raise AssertionError("request sent after cancel")
+
+    monkeypatch.setattr(vworld_wfs.http, "get", boom)
+    cancelled = threading.Event()
+    cancelled.set()
+    assert vworld_wfs._fetch_polygon_once(
+        lat=37.55, lon=127.05, api_key="key", radius_m=30.0, timeout_s=1.0, domain=None, cancelled=cancelled
+    ) is None
+
+
+class _CountingRaw(io.BytesIO):
+    def read(self, *args, **kwargs):
+        chunk = super().read(*args, **kwargs)
+        self.bytes_read = getattr(self, "bytes_read", 0) + len(chunk)
+        return chunk
+
+
+def _feature_collection(rings):
+    features = [{"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [ring]}} for ring in rings]
+    return json.dumps({"type": "FeatureCollection", "features": features, "totalFeatures": len(features)}).encode()
+
+
+def _response(body):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers["Content-Type"] = "application/json;charset=UTF-8"
+    resp.raw = _CountingRaw(body)
+    return resp
+
+
+def test_stream_stops_at_first_containing_ring():
+    filler = [[(127.0 + i * 1e-4, 37.0), (127.0 + i * 1e-4, 37.0001), (127.0001 + i * 1e-4, 37.0)] for i in range(2000)]
+    body = _feature_collection([_NEIGHBOR, [list(p) for p in _HOME], *filler])
+    resp = _response(body)
+
+    assert vworld_wfs._read_polygons(resp, cancelled=None, point=(127.05, 37.55)) == [_HOME]
+    assert resp.raw.bytes_read < len(body) // 4
+
+    # 포함하는 링이 없으면 첫 링 하나만
+    resp = _response(body)
+    assert vworld_wfs._read_polygons(resp, cancelled=None, point=(128.0, 36.0)) == [_NEIGHBOR]
+
+
+def test_stream_without_point_returns_every_ring_and_drains_body():
+    body = _feature_collection([_NEIGHBOR, _HOME])
+    resp = _response(body)
+    assert vworld_wfs._read_polygons(resp, cancelled=None, point=None) == [_NEIGHBOR, _HOME]
+    assert resp.raw.bytes_read == len(body)
+
+    assert vworld_wfs._read_polygons(_response(body[:-40]), cancelled=None, point=None) is None
+
+
+def test_cached_responses_can_be_streamed():
+    body = _feature_collection([_HOME])
+    cached = http._cached_response("u", CachedResponse(status=200, content_type="application/json", body=body))
+    assert vworld_wfs._read_polygons(cached, cancelled=None, point=(127.05, 37.55)) == [_HOME]
+
+
+def test_response_at_the_feature_cap_is_truncated_and_not_stored():
+    rings = [_HOME, _NEIGHBOR, _HOME]
+    stored = []
+    try:
+        vworld_wfs._read_polygons(
+            _response(_feature_collection(rings)), cancelled=None, point=None, max_features=3, on_complete=stored.append
+        )
+    except vworld_wfs._Truncated:
+        pass
+    else:
+        raise AssertionError("capped response accepted")
+    assert stored == []
+
+    body = _feature_collection(rings)
+    polygons = vworld_wfs._read_polygons(_response(body), cancelled=None, point=None, max_features=4, on_complete=stored.append)
+    assert len(polygons) == 3 and stored == [body]
+
+
+def test_only_complete_feature_collections_are_stored():
+    stored = []
+    # 점을 포함하는 링에서 멈춘 스트림은 본문이 불완전하므로 저장하지 않음
+    body = _feature_collection([_HOME, _NEIGHBOR])
+    assert vworld_wfs._read_polygons(_response(body), cancelled=None, point=(127.05, 37.55), on_complete=stored.append) == [_HOME]
+    # features 배열이 없는 JSON(오류 응답)도 저장하지 않음
+    assert vworld_wfs._read_polygons(_response(b'{"error": "bad key"}'), cancelled=None, point=None, on_complete=stored.append) == []
+    assert stored == []
+    empty = _feature_collection([])
+    assert vworld_wfs._read_polygons(_response(empty), cancelled=None, point=None, on_complete=stored.append) == []
+    assert stored == [empty]
@@ -0,0 +1,92 @@
+from api import vworld_wfs
+from core.data_access.wfs_tile_cache import TileFeatures, WfsTileCache
+
+
+def _square(lon, lat, half):
+    return [(lon - half, lat - half), (lon + half, lat - half), (lon + half, lat + half), (lon - half, lat + half), (lon - half, lat - half)]
+
+
+A = _square(127.0503, 37.5503, 0.0001)
+B = _square(127.0512, 37.5512, 0.0001)
+
+
+def test_tiles_cover_their_points():
+    cache = WfsTileCache(tile_deg=0.002)
+    tile = cache.tile_of(37.5503, 127.0503)
+    min_lon, min_lat, max_lon, max_lat = cache.tile_bbox(tile)
+    assert min_lon <= 127.0503 < max_lon and min_lat <= 37.5503 < max_lat
+    assert cache.tile_of(37.5512, 127.0512) == tile
+
+
+def test_polygon_at_prefers_containing_then_nearest():
+    features = TileFeatures.from_polygons([B, A])
+    assert features.polygon_at(37.5503, 127.0503, max_dist_m=120) == A
+    # A 바깥 약 20m: 가장 가까운 A
+    assert features.polygon_at(37.5506, 127.0503, max_dist_m=120) == A
+    assert features.polygon_at(37.5506, 127.0503, max_dist_m=5) is None
+    assert TileFeatures.from_polygons([]).polygon_at(37.55, 127.05, max_dist_m=120) is None
+
+
+def test_points_in_a_fetched_tile_are_answered_locally(monkeypatch):
+    cache = WfsTileCache(tile_deg=0.002)
+    monkeypatch.setattr(vworld_wfs, "default_wfs_tile_cache", lambda: cache)
+    fetched = []
+    responses = [None, [A, B], []]
+
+    def fake_fetch(bbox, **kwargs):
+        fetched.append(bbox)
+        return responses[len(fetched) - 1]
+
+    monkeypatch.setattr(vworld_wfs, "_fetch_polygons", fake_fetch)
+
+    # 요청 실패는 캐시하지 않음
+    assert vworld_wfs.get_building_polygon((37.5503, 127.0503), "key") is None
+    assert vworld_wfs.get_building_polygon((37.5503, 127.0503), "key") == A
+    assert vworld_wfs.get_building_polygon((37.5512, 127.0512), "key") == B
+    assert len(fetched) == 2
+    assert fetched[1] == cache.tile_bbox(cache.tile_of(37.5503, 127.0503))
+
+    # 건물 없는 타일도 캐시
+    assert vworld_wfs.get_building_polygon((37.6001, 127.1001), "key") is None
+    assert vworld_wfs.get_building_polygon((37.6002, 127.1002), "key") is None
+    assert len(fetched) == 3
+    assert cache.stats()["tiles"] == 2
+
+
+def test_lru_and_ttl(monkeypatch):
+    cache = WfsTileCache(max_tiles=2)
+    cache.put((0, 0), [A])
+    cache.put((0, 1), [B])
+    assert cache.get((0, 0)) is not None
+    cache.put((0, 2), [])
+    assert cache.get((0, 1)) is None
+    assert cache.get((0, 0)) is not None
+
+    expired = WfsTileCache(ttl_s=0.0)
+    expired.put((0, 0), [A])
+    assert expired.get((0, 0)) is None
+
+
+def test_truncated_tile_falls_back_to_point_query(monkeypatch):
+    cache = WfsTileCache(tile_deg=0.002)
+    monkeypatch.setattr(vworld_wfs, "default_wfs_tile_cache", lambda: cache)
+    tile_requests, point_requests = [], []
+
+    def fake_fetch(bbox, *, max_features=None, **kwargs):
+        tile_requests.append(max_features)
+        raise vworld_wfs._Truncated()
+
+    def fake_point(lat, lon, api_key, **kwargs):
+        point_requests.append((lat, lon))
+        return A
+
+    monkeypatch.setattr(vworld_wfs, "_fetch_polygons", fake_fetch)
+    monkeypatch.setattr(vworld_wfs, "_get_building_polygon", fake_point)
+
+    assert vworld_wfs.get_building_polygon((37.5512, 127.0512), "key") == A
+    assert vworld_wfs.get_building_polygon((37.5503, 127.0503), "key") == A
+    # 밀집 타일은 한 번만 요청하고, 잘린 폴리곤은 캐시하지 않음
+    assert tile_requests == [vworld_wfs.settings.wfs_tile_max_features]
+    assert point_requests == [(37.5512, 127.0512), (37.5503, 127.0503)]
+    features = cache.get(cache.tile_of(37.5503, 127.0503))
+    assert features.truncated and features.polygons == []
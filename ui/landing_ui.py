@@ -5,6 +5,7 @@ import os
 # 공통 헤더 컴포넌트 import
 from components.common.header import render_header
 from core.services.analyze_service import AnalyzeService
+from core.services.autocomplete_service import AutocompleteService
 from core.state import set_state
 
 def load_css_content(file_name):
@@ -67,6 +68,21 @@ def render_landing_page():
                 placeholder="예) 서울시 중구 세종대로 110 (서울시청) 입력...", 
                 label_visibility="collapsed"
             )
+            # 입력(Enter) 후 주소/건물명 후보를 보여주고, 고른 후보의 주소로 지오코딩
+            # 인덱스가 아직 준비 중이거나 실패하면 제안 없이 입력 그대로 진행
+            try:
+                suggestions = AutocompleteService().suggest(address) if len(address.strip()) >= 2 else []
+            except Exception:
+                suggestions = []
+            if suggestions:
+                labels = ["입력한 그대로"] + [
+                    f"🏢 {s.text} ({s.address})" if s.kind == "building" and s.address else s.text
+                    for s in suggestions
+                ]
+                picked = st.selectbox("추천 주소", range(len(labels)), format_func=labels.__getitem__, label_visibility="collapsed")
+                if picked:
+                    chosen = suggestions[picked - 1]
+                    address = chosen.address or chosen.text
         with c2:
             if st.button("시뮬레이션 시작", type="primary", use_container_width=True):
               if not address: